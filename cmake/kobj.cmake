@@ -34,18 +34,25 @@ endfunction()
 
 # Generates a gperf header file named OUTPUT using the symbols found in the KERNEL_TARGET's output
 # binary. INCLUDES is a list of JSON files defining kernel subsystems and sockets.
+#
+# If GEN_KOBJECT_LIST_CACHE_DIR is set, the kernel object types and variables found in the DWARF
+# information of the binary are cached there, keyed by its build ID or contents.
 function(gen_kobject_list_gperf)
   cmake_parse_arguments(PARSE_ARGV 0 arg
     ""
     "TARGET;OUTPUT;KERNEL_TARGET"
     "INCLUDES;DEPENDS"
   )
+  if(GEN_KOBJECT_LIST_CACHE_DIR)
+    set(cache_args --cache-dir ${GEN_KOBJECT_LIST_CACHE_DIR})
+  endif()
   gen_kobject_list(
     TARGET ${arg_TARGET}
     OUTPUTS ${arg_OUTPUT}
     SCRIPT_ARGS
       --kernel $<TARGET_FILE:${arg_KERNEL_TARGET}>
       --gperf-output ${arg_OUTPUT}
+      ${cache_args}
     INCLUDES ${arg_INCLUDES}
     DEPENDS
       ${arg_DEPENDS}
@@ -17,7 +17,8 @@ find_package(Dtc 1.4.6)
 #
 #   - To other arbitrary Python scripts (like twister) using a
 #     serialized edtlib.EDT object in Python's pickle format
-#     (https://docs.python.org/3/library/pickle.html)
+#     (https://docs.python.org/3/library/pickle.html), or in the
+#     memory-mappable binary format of devicetree.edtbin
 #
 #   - To users as a final devicetree source (DTS) file which can
 #     be used for debugging
@@ -56,6 +57,7 @@ find_package(Dtc 1.4.6)
 #      bindings were found
 #    - ${PROJECT_BINARY_DIR}/zephyr.dts exists
 #    - ${PROJECT_BINARY_DIR}/edt.pickle exists
+#    - ${PROJECT_BINARY_DIR}/edt.bin exists
 #    - ${KCONFIG_BINARY_DIR}/Kconfig.dts exists
 #    - DTS_INCLUDE_FILES is set to a ;-list of all devicetree files
 #      used in this build, including transitive includes (the build
@@ -109,6 +111,8 @@ set(GEN_EDT_SCRIPT              ${DT_SCRIPTS}/gen_edt.py)
 set(GEN_DEFINES_SCRIPT          ${DT_SCRIPTS}/gen_defines.py)
 # The edtlib.EDT object in pickle format.
 set(EDT_PICKLE                  ${PROJECT_BINARY_DIR}/edt.pickle)
+# The edtlib.EDT object in the binary format of devicetree.edtbin.
+set(EDT_BIN                     ${PROJECT_BINARY_DIR}/edt.bin)
 # The generated file containing the final DTS, for debugging.
 set(ZEPHYR_DTS                  ${PROJECT_BINARY_DIR}/zephyr.dts)
 # The generated C header needed by <zephyr/devicetree.h>
@@ -282,6 +286,7 @@ set_property(DIRECTORY APPEND PROPERTY
   ${DTS_INCLUDE_FILES}
   ${GEN_EDT_SCRIPT}
   ${GEN_DEFINES_SCRIPT}
+  ${DT_SCRIPTS}/gen_dts_cmake.py
   ${GEN_DRIVER_KCONFIG_SCRIPT}
   )
 
@@ -306,6 +311,12 @@ set(CMD_GEN_EDT ${PYTHON_EXECUTABLE} ${GEN_EDT_SCRIPT}
 --workspace-dir ${GEN_EDT_WORKSPACE_DIR}
 --dts-out ${ZEPHYR_DTS}.new # for debugging and dtc
 --edt-pickle-out ${EDT_PICKLE}.new
+--edt-bin-out ${EDT_BIN}.new
+# Written from the same process, instead of by running GEN_DEFINES_SCRIPT
+# and gen_dts_cmake.py on the pickle. The header is only written if it
+# changed.
+--header-out ${DEVICETREE_GENERATED_H}
+--cmake-out ${EDT_PICKLE}.cmake.new
 ${EXTRA_GEN_EDT_ARGS}
 )
 
@@ -316,27 +327,14 @@ execute_process(
   )
 zephyr_file_copy(${ZEPHYR_DTS}.new ${ZEPHYR_DTS} ONLY_IF_DIFFERENT)
 zephyr_file_copy(${EDT_PICKLE}.new ${EDT_PICKLE} ONLY_IF_DIFFERENT)
-file(REMOVE ${ZEPHYR_DTS}.new ${EDT_PICKLE}.new)
+zephyr_file_copy(${EDT_BIN}.new ${EDT_BIN} ONLY_IF_DIFFERENT)
+zephyr_file_copy(${EDT_PICKLE}.cmake.new ${EDT_PICKLE}.cmake ONLY_IF_DIFFERENT)
+# Marks the CMake property file as up to date for zephyr_dt_import(), which
+# only runs gen_dts_cmake.py when the pickle is newer
+file(TOUCH_NOCREATE ${EDT_PICKLE}.cmake)
+file(REMOVE ${ZEPHYR_DTS}.new ${EDT_PICKLE}.new ${EDT_BIN}.new ${EDT_PICKLE}.cmake.new)
 message(STATUS "Generated zephyr.dts: ${ZEPHYR_DTS}")
 message(STATUS "Generated pickled edt: ${EDT_PICKLE}")
-
-#
-# Run GEN_DEFINES_SCRIPT.
-#
-
-set(CMD_GEN_DEFINES ${PYTHON_EXECUTABLE} ${GEN_DEFINES_SCRIPT}
---header-out ${DEVICETREE_GENERATED_H}.new
---edt-pickle ${EDT_PICKLE}
-${EXTRA_GEN_DEFINES_ARGS}
-)
-
-execute_process(
-  COMMAND ${CMD_GEN_DEFINES}
-  WORKING_DIRECTORY ${PROJECT_BINARY_DIR}
-  COMMAND_ERROR_IS_FATAL ANY
-  )
-zephyr_file_copy(${DEVICETREE_GENERATED_H}.new ${DEVICETREE_GENERATED_H} ONLY_IF_DIFFERENT)
-file(REMOVE ${DEVICETREE_GENERATED_H}.new)
 message(STATUS "Generated devicetree_generated.h: ${DEVICETREE_GENERATED_H}")
 
 #
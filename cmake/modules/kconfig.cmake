@@ -160,6 +160,7 @@ set(COMMON_KCONFIG_ENV_SETTINGS
   TOOLCHAIN_HAS_NEWLIB=${_local_TOOLCHAIN_HAS_NEWLIB}
   TOOLCHAIN_HAS_PICOLIBC=${_local_TOOLCHAIN_HAS_PICOLIBC}
   EDT_PICKLE=${EDT_PICKLE}
+  EDT_BIN=${EDT_BIN}
   # Export all Zephyr modules to Kconfig
   ${ZEPHYR_KCONFIG_MODULES_DIR}
 )
@@ -387,6 +388,29 @@ if(NOT EXISTS ${autoconf_h_path})
   file(MAKE_DIRECTORY ${autoconf_h_path})
 endif()
 
+# With KCONFIG_SYMBOL_DEPS, kconfig.py keeps a file for each symbol, which is
+# touched when the value of the symbol changes. fixdep.py makes each object
+# depend on the files of the symbols it uses instead of autoconf.h, so that
+# changing the configuration only rebuilds the objects affected by it.
+zephyr_get(KCONFIG_SYMBOL_DEPS)
+set(KCONFIG_DEPS_DIR ${PROJECT_BINARY_DIR}/kconfig/include/config)
+if(KCONFIG_SYMBOL_DEPS)
+  set(sync_deps_flags --sync-deps=${KCONFIG_DEPS_DIR})
+  get_property(launch_compile GLOBAL PROPERTY RULE_LAUNCH_COMPILE)
+  set_property(GLOBAL PROPERTY RULE_LAUNCH_COMPILE "${PYTHON_EXECUTABLE} \
+${ZEPHYR_BASE}/scripts/build/fixdep.py --autoconf=${AUTOCONF_H} --deps-dir=${KCONFIG_DEPS_DIR} \
+-- ${launch_compile}"
+  )
+elseif(EXISTS ${KCONFIG_DEPS_DIR}/auto.conf)
+  # Objects built with KCONFIG_SYMBOL_DEPS don't depend on autoconf.h. Touch
+  # the symbol files instead, to rebuild them with a dependency on it.
+  file(GLOB_RECURSE symbol_files ${KCONFIG_DEPS_DIR}/*.h)
+  if(symbol_files)
+    file(TOUCH ${symbol_files})
+  endif()
+  file(REMOVE ${KCONFIG_DEPS_DIR}/auto.conf)
+endif()
+
 execute_process(
   COMMAND ${CMAKE_COMMAND} -E env
   ${COMMON_KCONFIG_ENV_SETTINGS}
@@ -394,6 +418,8 @@ execute_process(
   ${PYTHON_EXECUTABLE}
   ${ZEPHYR_BASE}/scripts/kconfig/kconfig.py
   --zephyr-base=${ZEPHYR_BASE}
+  --parse-cache=${KCONFIG_BINARY_DIR}/parsed-tree.pickle
+  ${sync_deps_flags}
   ${input_configs_flags}
   ${KCONFIG_ROOT}
   ${DOTCONFIG}
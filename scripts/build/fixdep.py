@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+#
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Compiler launcher which narrows the dependency of an object file on autoconf.h
+down to the Kconfig symbols the object refers to, like fixdep in Linux.
+
+It runs the compile command given after '--', then rewrites the dependency
+file written by the compiler (-MF). autoconf.h is replaced by the files
+Kconfiglib's sync_deps() keeps for every symbol named in the source file and
+the headers it includes, so that changing a symbol only rebuilds the objects
+which mention it.
+
+Objects with files which paste symbol names together, e.g. CONFIG_UART_##n,
+keep depending on autoconf.h, as the symbols they use can't be found by
+scanning for them.
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+
+# Kconfig symbol references in the source files and headers. A name followed
+# by '##', or a bare 'CONFIG_' followed by ',' or ')' as in
+# 'CONCAT(CONFIG_, n)', is pasted together with other tokens. Starting with
+# a literal keeps the search fast.
+SYMBOL_RE = re.compile(rb'CONFIG_([A-Za-z0-9_]*)\s*(##|[,)])?')
+
+# Bytes which make 'CONFIG_' the tail of a longer identifier
+IDENTIFIER_CHARS = frozenset(b'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_')
+
+# Separators of the paths in a dependency file, i.e. unescaped whitespace
+DEP_SEP_RE = re.compile(r'(?<!\\)\s+')
+
+# Separator of the target from its dependencies, not the colon of a Windows
+# drive letter
+TARGET_SEP_RE = re.compile(r'(?<!\\):(?:\s|$)')
+
+
+def depfile_arg(command):
+    # Returns the dependency file given to the compiler with -MF, or None
+
+    for i, arg in enumerate(command):
+        if arg == '-MF' and i + 1 < len(command):
+            return command[i + 1]
+        if arg.startswith('-MF'):
+            return arg[3:]
+    return None
+
+
+def unescape(path):
+    # Undoes the escaping of special characters in paths in dependency files
+
+    return path.replace('\\ ', ' ').replace('\\#', '#').replace('$$', '$')
+
+
+def escape(path):
+    return path.replace('$', '$$').replace('#', '\\#').replace(' ', '\\ ')
+
+
+def symbol_file(deps_dir, name):
+    # Returns the file sync_deps() touches when the value of the symbol 'name'
+    # changes, e.g. <deps_dir>/foo/bar.h for FOO_BAR
+
+    return os.path.normpath(os.path.join(deps_dir, name.lower().replace('_', os.sep) + '.h'))
+
+
+def referenced_symbols(paths):
+    # Returns the names of the symbols referenced in the files 'paths', or
+    # None if some file builds symbol names with token pasting
+
+    names = set()
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                contents = f.read()
+        except OSError:
+            # E.g. a header which was removed since, the compiler has reported
+            # any problem with it already
+            continue
+
+        for match in SYMBOL_RE.finditer(contents):
+            start = match.start()
+            if start and contents[start - 1] in IDENTIFIER_CHARS:
+                continue
+            name, after = match.groups()
+            if after == b'##' or (after and not name):
+                return None
+            names.add(name)
+
+    # Names ending in '_' are prefixes, e.g. from CONFIG_LOG_BACKEND_* in a
+    # comment
+    return {name.decode() for name in names if name and not name.endswith(b'_')}
+
+
+def create_symbol_file(path):
+    # Creates the file for a symbol which sync_deps() has not touched yet,
+    # dated to the epoch, so that it exists for make and is older than the
+    # object file. The files of other symbols are left alone.
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    try:
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644))
+    except FileExistsError:
+        return
+    os.utime(path, (0, 0))
+
+
+def fix_depfile(depfile, autoconf, deps_dir):
+    # Replaces autoconf.h in the dependencies of the first rule in the
+    # dependency file 'depfile' with the files of the symbols they use
+
+    try:
+        with open(depfile, encoding='utf-8') as f:
+            contents = f.read().replace('\\\n', ' ')
+    except FileNotFoundError:
+        return
+
+    rule, sep, rest = contents.partition('\n')
+    match = TARGET_SEP_RE.search(rule)
+    if not match:
+        return
+    target = rule[: match.start()]
+    deps = [dep for dep in DEP_SEP_RE.split(rule[match.end() :]) if dep]
+
+    autoconf = os.path.normpath(autoconf)
+    kept = [dep for dep in deps if os.path.normpath(unescape(dep)) != autoconf]
+    if len(kept) == len(deps):
+        return
+
+    names = referenced_symbols(unescape(dep) for dep in kept)
+    if names is None:
+        return
+
+    symbol_deps = []
+    for name in sorted(names):
+        path = symbol_file(deps_dir, name)
+        create_symbol_file(path)
+        symbol_deps.append(escape(path))
+
+    with open(depfile + '.tmp', 'w', encoding='utf-8') as f:
+        f.write(f'{target}:')
+        for dep in kept + symbol_deps:
+            f.write(f' \\\n {dep}')
+        f.write('\n' + rest if sep else '\n')
+    os.replace(depfile + '.tmp', depfile)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        allow_abbrev=False,
+    )
+    parser.add_argument('--autoconf', required=True, help='path to autoconf.h')
+    parser.add_argument(
+        '--deps-dir',
+        required=True,
+        help='directory with the symbol files written by Kconfiglib sync_deps()',
+    )
+    parser.add_argument('command', nargs=argparse.REMAINDER, help='compile command, after --')
+
+    args = parser.parse_args()
+    if args.command[:1] == ['--']:
+        args.command = args.command[1:]
+    if not args.command:
+        parser.error('no compile command given')
+
+    return args
+
+
+def main():
+    args = parse_args()
+
+    ret = subprocess.run(args.command).returncode
+    if ret:
+        sys.exit(ret)
+
+    depfile = depfile_arg(args.command)
+    if depfile:
+        fix_depfile(depfile, args.autoconf, args.deps_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -52,11 +52,16 @@ This script can generate five different output files:
 """
 
 import argparse
+import contextlib
+import hashlib
 import json
 import math
 import os
+import pickle
 import struct
 import sys
+import tempfile
+import time
 
 import elftools
 from elftools.elf.elffile import ELFFile
@@ -162,6 +167,10 @@ def debug(text):
     sys.stdout.write(scr + ": " + text + "\n")
 
 
+def debug_time(phase, start):
+    debug(f"{phase} took {time.perf_counter() - start:.3f} seconds")
+
+
 def error(text):
     sys.exit(f"{scr} ERROR: {text}")
 
@@ -525,51 +534,145 @@ def device_get_api_addr(elf, addr):
     return addr_deref(elf, addr + offset)
 
 
-def find_kobjects(elf, syms):
-    global thread_counter
-    global sys_mutex_counter
-    global futex_counter
-    global stack_counter
+# --- DWARF type graph ---
+
+# Tags of the DIEs whose children are examined when looking for types and
+# variables. The subtrees of other DIEs (formal parameters, inlined
+# subroutines, call sites, enumerators, ...) never hold named variables or
+# type definitions, and pyelftools skips them without parsing them when the
+# producer emits DW_AT_sibling.
+SCOPE_TAGS = {
+    "DW_TAG_namespace",
+    "DW_TAG_subprogram",
+    "DW_TAG_lexical_block",
+    "DW_TAG_structure_type",
+    "DW_TAG_union_type",
+    "DW_TAG_class_type",
+}
 
-    if not elf.has_dwarf_info():
-        sys.exit("ELF file has no DWARF information")
+# Bump when the contents of the type graph cache change
+TYPE_GRAPH_CACHE_VERSION = 1
 
-    app_smem_start = syms["_app_smem_start"]
-    app_smem_end = syms["_app_smem_end"]
 
-    if "CONFIG_LINKER_USE_PINNED_SECTION" in syms and "_app_smem_pinned_start" in syms:
-        app_smem_pinned_start = syms["_app_smem_pinned_start"]
-        app_smem_pinned_end = syms["_app_smem_pinned_end"]
+def die_defines_kobject_types(die):
+    # Returns True if the compilation unit or namespace 'die' defines a
+    # kernel object or subsystem struct. These are defined at file scope,
+    # so only the top-level DIEs need to be parsed.
+    for child in die.iter_children():
+        if child.tag == "DW_TAG_structure_type":
+            if "DW_AT_name" not in child.attributes or not die_get_byte_size(child):
+                continue
+
+            name = child.attributes["DW_AT_name"].value.decode("utf-8")
+            if name in kobjects or name in subsystems or name in net_sockets:
+                return True
+        elif child.tag == "DW_TAG_namespace" and die_defines_kobject_types(child):
+            return True
+
+    return False
+
+
+def analyze_die_tree(die, variables):
+    for child in die.iter_children():
+        # Unions are disregarded, kernel objects should never be union
+        # members since the memory is not dedicated to that object and
+        # could be something else
+        if child.tag == "DW_TAG_structure_type":
+            analyze_die_struct(child)
+        elif child.tag == "DW_TAG_const_type":
+            analyze_die_const(child)
+        elif child.tag == "DW_TAG_array_type":
+            analyze_die_array(child)
+        elif child.tag == "DW_TAG_typedef":
+            analyze_typedef(child)
+        elif child.tag == "DW_TAG_variable":
+            variables.append(child)
+
+        if child.tag in SCOPE_TAGS and child.has_children:
+            analyze_die_tree(child, variables)
+
+
+def die_get_kobject_addr(die, syms):
+    # Returns the address of the kernel object variable 'die', or None if
+    # it doesn't have a static address
+
+    name = die_get_name(die)
+
+    if "DW_AT_location" not in die.attributes:
+        debug_die(die, f"No location information for object '{name}'; possibly stack allocated")
+        return None
+
+    loc = die.attributes["DW_AT_location"]
+    if loc.form not in ("DW_FORM_exprloc", "DW_FORM_block1"):
+        debug_die(die, f"kernel object '{name}' unexpected location format")
+        return None
+
+    opcode = loc.value[0]
+    if opcode != DW_OP_addr:
+        # Check if frame pointer offset DW_OP_fbreg
+        if opcode == DW_OP_fbreg:
+            debug_die(die, f"kernel object '{name}' found on stack")
+        else:
+            debug_die(die, f"kernel object '{name}' unexpected exprloc opcode {hex(opcode)}")
+        return None
+
+    if "CONFIG_64BIT" in syms:
+        addr = (
+            (loc.value[1] << 0)
+            | (loc.value[2] << 8)
+            | (loc.value[3] << 16)
+            | (loc.value[4] << 24)
+            | (loc.value[5] << 32)
+            | (loc.value[6] << 40)
+            | (loc.value[7] << 48)
+            | (loc.value[8] << 56)
+        )
     else:
-        app_smem_pinned_start = app_smem_start
-        app_smem_pinned_end = app_smem_end
+        addr = (
+            (loc.value[1] << 0) | (loc.value[2] << 8) | (loc.value[3] << 16) | (loc.value[4] << 24)
+        )
 
-    user_stack_start = syms["z_user_stacks_start"]
-    user_stack_end = syms["z_user_stacks_end"]
+        # Handle a DW_FORM_exprloc that contains a DW_OP_addr, followed immediately by
+        # a DW_OP_plus_uconst.
+        if len(loc.value) >= 7 and loc.value[5] == DW_OP_plus_uconst:
+            addr += loc.value[6]
 
-    di = elf.get_dwarf_info()
+    return addr
 
-    variables = []
 
-    # Step 1: collect all type information.
+def get_type_graph(elf, syms):
+    # Returns a (type_env, variables) tuple, where type_env only contains
+    # kernel objects and the structs and arrays containing them, and
+    # variables is a list of (name, type offset, address) tuples for the
+    # variables with one of these types. type_env is populated as a side
+    # effect.
+
+    di = elf.get_dwarf_info()
+
+    # Step 1: collect all type information. Types only refer to other types
+    # within the same compilation unit, so the compilation units which
+    # don't define any kernel object or subsystem struct can't have
+    # variables containing kernel objects, and are skipped after a look at
+    # their top-level DIEs.
+    start = time.perf_counter()
+    cus = []
+    n_cus = 0
     for CU in di.iter_CUs():
-        for die in CU.iter_DIEs():
-            # Unions are disregarded, kernel objects should never be union
-            # members since the memory is not dedicated to that object and
-            # could be something else
-            if die.tag == "DW_TAG_structure_type":
-                analyze_die_struct(die)
-            elif die.tag == "DW_TAG_const_type":
-                analyze_die_const(die)
-            elif die.tag == "DW_TAG_array_type":
-                analyze_die_array(die)
-            elif die.tag == "DW_TAG_typedef":
-                analyze_typedef(die)
-            elif die.tag == "DW_TAG_variable":
-                variables.append(die)
+        n_cus += 1
+        if die_defines_kobject_types(CU.get_top_DIE()):
+            cus.append(CU)
+    debug(f"{len(cus)} of {n_cus} compilation units define kernel object types")
+    debug_time("compilation unit indexing", start)
+
+    start = time.perf_counter()
+    variables = []
+    for CU in cus:
+        analyze_die_tree(CU.get_top_DIE(), variables)
+    debug_time("type collection", start)
 
     # Step 2: filter type_env to only contain kernel objects, or structs
     # and arrays of kernel objects
+    start = time.perf_counter()
     bad_offsets = []
     for offset, type_object in type_env.items():
         if not type_object.has_kobject():
@@ -580,7 +683,7 @@ def find_kobjects(elf, syms):
 
     # Step 3: Now that we know all the types we are looking for, examine
     # all variables
-    all_objs = {}
+    kobject_vars = []
 
     for die in variables:
         name = die_get_name(die)
@@ -603,52 +706,128 @@ def find_kobjects(elf, syms):
             extern_env[die.offset] = die
             continue
 
-        if "DW_AT_location" not in die.attributes:
-            debug_die(die, f"No location information for object '{name}'; possibly stack allocated")
+        addr = die_get_kobject_addr(die, syms)
+        if addr is None:
             continue
 
-        loc = die.attributes["DW_AT_location"]
-        if loc.form not in ("DW_FORM_exprloc", "DW_FORM_block1"):
-            debug_die(die, f"kernel object '{name}' unexpected location format")
+        if addr == 0:
+            # Never linked; gc-sections deleted it
             continue
 
-        opcode = loc.value[0]
-        if opcode != DW_OP_addr:
-            # Check if frame pointer offset DW_OP_fbreg
-            if opcode == DW_OP_fbreg:
-                debug_die(die, f"kernel object '{name}' found on stack")
-            else:
-                debug_die(die, f"kernel object '{name}' unexpected exprloc opcode {hex(opcode)}")
-            continue
+        kobject_vars.append((name, type_offset, addr))
+    debug_time("variable lookup", start)
 
-        if "CONFIG_64BIT" in syms:
-            addr = (
-                (loc.value[1] << 0)
-                | (loc.value[2] << 8)
-                | (loc.value[3] << 16)
-                | (loc.value[4] << 24)
-                | (loc.value[5] << 32)
-                | (loc.value[6] << 40)
-                | (loc.value[7] << 48)
-                | (loc.value[8] << 56)
-            )
-        else:
-            addr = (
-                (loc.value[1] << 0)
-                | (loc.value[2] << 8)
-                | (loc.value[3] << 16)
-                | (loc.value[4] << 24)
-            )
+    return dict(type_env), kobject_vars
 
-            # Handle a DW_FORM_exprloc that contains a DW_OP_addr, followed immediately by
-            # a DW_OP_plus_uconst.
-            if len(loc.value) >= 7 and loc.value[5] == DW_OP_plus_uconst:
-                addr += loc.value[6]
 
-        if addr == 0:
-            # Never linked; gc-sections deleted it
-            continue
+def get_build_id(elf):
+    section = elf.get_section_by_name(".note.gnu.build-id")
+    if section is None:
+        return None
+
+    for note in section.iter_notes():
+        if note["n_type"] == "NT_GNU_BUILD_ID":
+            return note["n_desc"]
+
+    return None
+
+
+def type_graph_cache_path(elf, cache_dir):
+    # The type graph only depends on the ELF file and the names of the
+    # kernel object types. Zephyr links without a build ID by default, in
+    # which case the contents of the ELF file are hashed instead.
+    start = time.perf_counter()
+    h = hashlib.sha256()
+
+    build_id = get_build_id(elf)
+    if build_id:
+        h.update(f"build-id:{build_id}".encode())
+    else:
+        elf.stream.seek(0)
+        for chunk in iter(lambda: elf.stream.read(1 << 20), b""):
+            h.update(chunk)
+
+    names = [TYPE_GRAPH_CACHE_VERSION, list(kobjects), sorted(subsystems), sorted(net_sockets)]
+    h.update(json.dumps(names).encode())
+    debug_time("cache key computation", start)
+
+    return os.path.join(cache_dir, f"{h.hexdigest()}.pickle")
+
+
+def load_type_graph(path):
+    try:
+        with open(path, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        # Truncated or written by an incompatible version of the script
+        debug(f"ignoring type graph cache {path}: {e}")
+        return None
+
+
+def save_type_graph(path, graph):
+    # Written through a temporary file, so that concurrent builds sharing
+    # the cache directory never see partially written files
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    except OSError as e:
+        # The cache is only an optimization
+        debug(f"could not write type graph cache {path}: {e}")
+        return
+
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(graph, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        debug(f"could not write type graph cache {path}: {e}")
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+
+
+def find_kobjects(elf, syms, cache_dir=None):
+    global thread_counter
+    global sys_mutex_counter
+    global futex_counter
+    global stack_counter
 
+    if not elf.has_dwarf_info():
+        sys.exit("ELF file has no DWARF information")
+
+    app_smem_start = syms["_app_smem_start"]
+    app_smem_end = syms["_app_smem_end"]
+
+    if "CONFIG_LINKER_USE_PINNED_SECTION" in syms and "_app_smem_pinned_start" in syms:
+        app_smem_pinned_start = syms["_app_smem_pinned_start"]
+        app_smem_pinned_end = syms["_app_smem_pinned_end"]
+    else:
+        app_smem_pinned_start = app_smem_start
+        app_smem_pinned_end = app_smem_end
+
+    user_stack_start = syms["z_user_stacks_start"]
+    user_stack_end = syms["z_user_stacks_end"]
+
+    graph = None
+    if cache_dir:
+        cache_path = type_graph_cache_path(elf, cache_dir)
+        graph = load_type_graph(cache_path)
+
+    if graph is None:
+        graph = get_type_graph(elf, syms)
+        if cache_dir:
+            save_type_graph(cache_path, graph)
+    else:
+        debug(f"using cached type information from {cache_path}")
+        type_env.update(graph[0])
+
+    # Expand the variables found in step 3 into their kernel objects
+    start = time.perf_counter()
+    all_objs = {}
+
+    for name, type_offset, addr in graph[1]:
         type_obj = type_env[type_offset]
         objs = type_obj.get_kobjects(addr)
         all_objs.update(objs)
@@ -715,6 +894,7 @@ def find_kobjects(elf, syms):
         ret[addr] = ko
 
     debug(f"found {len(ret)} kernel object instances total")
+    debug_time("kernel object instance lookup", start)
 
     # 1. Before python 3.7 dict order is not guaranteed. With Python
     #    3.5 it doesn't seem random with *integer* keys but can't
@@ -1030,6 +1210,14 @@ def parse_args():
         -i file1 -i file2 ...''',
     )
 
+    parser.add_argument(
+        "--cache-dir",
+        required=False,
+        help='''Directory where the kernel object types and variables found in the
+        DWARF information of the --kernel ELF are cached, keyed by its build ID or
+        by its contents if it has none''',
+    )
+
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Print extra debugging information"
     )
@@ -1048,9 +1236,11 @@ def main():
     if args.gperf_output:
         assert args.kernel, "--kernel ELF required for --gperf-output"
         elf = ELFFile(open(args.kernel, "rb"))  # noqa: SIM115
+        start = time.perf_counter()
         syms = get_symbols(elf)
+        debug_time("symbol table read", start)
         max_threads = syms["CONFIG_MAX_THREAD_BYTES"] * 8
-        objs = find_kobjects(elf, syms)
+        objs = find_kobjects(elf, syms, args.cache_dir)
         if not objs:
             sys.stderr.write(f"WARNING: zero kobject found in {args.kernel}\n")
 
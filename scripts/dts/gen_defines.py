@@ -15,6 +15,7 @@
 
 import argparse
 from collections import defaultdict
+import io
 import os
 import pathlib
 import pickle
@@ -30,9 +31,6 @@ from devicetree import edtlib
 
 
 def main():
-    global header_file
-    global flash_area_num
-
     args = parse_args()
 
     edtlib_logger.setup_edtlib_logging()
@@ -40,10 +38,23 @@ def main():
     with open(args.edt_pickle, 'rb') as f:
         edt = pickle.load(f)
 
+    write_header(edt, args.header_out)
+
+
+def write_header(edt: edtlib.EDT, header_out: str) -> None:
+    # Writes the generated header for 'edt' to 'header_out'. Used by
+    # gen_edt.py as well.
+    #
+    # Sets a 'z_path_id' attribute on each node of 'edt'.
+
+    global header_file
+    global flash_area_num
+
     flash_area_num = 0
 
-    # Create the generated header.
-    with open(args.header_out, "w", encoding="utf-8") as header_file:
+    # Create the generated header. It is built up in memory and only written
+    # if it changed, to keep its mtime.
+    with io.StringIO() as header_file:
         write_top_comment(edt)
 
         write_utils()
@@ -108,6 +119,8 @@ def main():
         write_chosen(edt)
         write_global_macros(edt)
 
+        update_file_if_changed(header_out, header_file.getvalue())
+
 
 def node_z_path_id(node: edtlib.Node) -> str:
     # Return the node specific bit of the node's path identifier:
@@ -1201,6 +1214,21 @@ def escape_unquoted(s: str) -> str:
     return s.replace("\r", " ").replace("\n", " ")
 
 
+def update_file_if_changed(path: str, contents: str) -> None:
+    # Writes 'contents' to 'path', unless the file already has them. Leaving
+    # an unchanged header alone means nothing that includes it is rebuilt.
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            if f.read() == contents:
+                return
+    except FileNotFoundError:
+        pass
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(contents)
+
+
 def err(s: str) -> NoReturn:
     raise Exception(s)
 
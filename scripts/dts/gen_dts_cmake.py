@@ -85,6 +85,13 @@ def main():
     with open(args.edt_pickle, 'rb') as f:
         edt = pickle.load(f)
 
+    write_cmake(edt, args.cmake_out)
+
+
+def write_cmake(edt, cmake_out):
+    # Writes the CMake property file for 'edt' to 'cmake_out'. gen_edt.py
+    # calls this directly with the EDT it built.
+
     # In what looks like an undocumented implementation detail, CMake
     # target properties are stored in a C++ standard library map whose
     # keys and values are each arbitrary strings, so we can use
@@ -188,7 +195,7 @@ def main():
     cmake_props = map(
         'set_target_properties(${{DEVICETREE_TARGET}} PROPERTIES {})'.format, cmake_props
     )
-    with open(args.cmake_out, "w", encoding="utf-8") as cmake_file:
+    with open(cmake_out, "w", encoding="utf-8") as cmake_file:
         print("\n".join(cmake_props), file=cmake_file)
 
 
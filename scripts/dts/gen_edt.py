@@ -8,7 +8,10 @@
 
 # This script uses edtlib to generate a pickled edt from a devicetree
 # (.dts) file. Information from binding files in YAML format is used
-# as well.
+# as well. The edt can also be written in the binary format of edtbin, which
+# can be read without rebuilding the whole EDT object graph. The outputs of
+# gen_defines.py and gen_dts_cmake.py can be written directly from the same
+# edt, instead of running those scripts on the pickle.
 #
 # Bindings are files that describe devicetree nodes. Devicetree nodes are
 # usually mapped to bindings via their 'compatible = "..."' property.
@@ -30,7 +33,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'python-devicetree',
                                 'src'))
 
 import edtlib_logger
-from devicetree import edtlib
+from devicetree import edtbin, edtlib
 
 
 def main():
@@ -52,7 +55,8 @@ def main():
                          infer_binding_for_paths=["/zephyr,user", "/cpus"],
                          werror=args.edtlib_Werror,
                          vendor_prefixes=vendor_prefixes,
-                         warn_bus_mismatch=args.warn_bus_mismatch)
+                         warn_bus_mismatch=args.warn_bus_mismatch,
+                         binding_cache_dir=args.binding_cache_dir)
     except edtlib.EDTError as e:
         sys.exit(f"devicetree error: {e}")
 
@@ -62,6 +66,24 @@ def main():
 
     write_pickled_edt(edt, args.edt_pickle_out)
 
+    if args.edt_bin_out:
+        try:
+            edtbin.write(edt, args.edt_bin_out)
+        except edtlib.EDTError as e:
+            sys.exit(f"devicetree error: {e}")
+
+    # Run as separate scripts, gen_dts_cmake.py and gen_defines.py would
+    # each start Python, import edtlib and unpickle the EDT again
+
+    if args.cmake_out:
+        import gen_dts_cmake
+        gen_dts_cmake.write_cmake(edt, args.cmake_out)
+
+    if args.header_out:
+        # Last, as it adds attributes to the nodes
+        import gen_defines
+        gen_defines.write_header(edt, args.header_out)
+
 
 def parse_args() -> argparse.Namespace:
     # Returns parsed command-line arguments
@@ -82,6 +104,15 @@ def parse_args() -> argparse.Namespace:
                              "as a debugging aid)")
     parser.add_argument("--edt-pickle-out",
                         help="path to write pickled edtlib.EDT object to", required=True)
+    parser.add_argument("--edt-bin-out",
+                        help="path to write the edtlib.EDT object to, in the "
+                             "memory-mappable format of devicetree.edtbin")
+    parser.add_argument("--header-out",
+                        help="path to write the header generated by "
+                             "gen_defines.py to")
+    parser.add_argument("--cmake-out",
+                        help="path to write the CMake property file generated "
+                             "by gen_dts_cmake.py to")
     parser.add_argument("--vendor-prefixes", action='append', default=[],
                         help="vendor-prefixes.txt path; used for validation; "
                              "may be given multiple times")
@@ -92,6 +123,9 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--warn-bus-mismatch", action="store_true",
                         help="warn when devicetree nodes are on buses that "
                              "don't match available binding expectations")
+    parser.add_argument("--binding-cache-dir",
+                        help="directory for caching parsed bindings; can be "
+                             "shared between builds")
 
     return parser.parse_args()
 
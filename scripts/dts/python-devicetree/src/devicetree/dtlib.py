@@ -1087,6 +1087,24 @@ class DT:
     def _parse_file(self, filename: str, include_path: Iterable[str]):
         self._include_path = list(include_path)
 
+        self._init_lexer(filename)
+
+        self._parse_header()
+        self._parse_memreserves()
+        self._parse_dt()
+
+        # Don't keep (and pickle) the last batch of tokens
+        self._batch = []
+
+        self._register_phandles()
+        self._fixup_props()
+        self._register_aliases()
+        self._remove_unreferenced()
+        self._register_labels()
+
+    def _init_lexer(self, filename: str):
+        # Sets up lexing of the file 'filename' from the start
+
         with open(filename, encoding="utf-8") as f:
             self._file_contents = f.read()
 
@@ -1098,15 +1116,14 @@ class DT:
 
         self._lineno: int = 1
 
-        self._parse_header()
-        self._parse_memreserves()
-        self._parse_dt()
-
-        self._register_phandles()
-        self._fixup_props()
-        self._register_aliases()
-        self._remove_unreferenced()
-        self._register_labels()
+        # Tokens lexed ahead by _lex_batch(), as (token, start index, line
+        # number) tuples, and the index of the next one to return
+        self._batch: list[tuple[_Token, int, int]] = []
+        self._batch_i: int = 0
+        # Line number and start index of the last match (including skipped
+        # whitespace and comments) at the lexer's position
+        self._lex_lineno: int = 1
+        self._lex_tok_i: int = 0
 
     def _parse_header(self):
         # Parses /dts-v1/ (expected) and /plugin/ (unsupported) at the start of
@@ -1629,101 +1646,160 @@ class DT:
             return tmp
 
         while True:
-            tok_id = None
-
-            match = _token_re.match(self._file_contents, self._tok_end_i)
-            if match:
-                tok_id = match.lastindex
-                if tok_id == _T.CHAR_LITERAL:
-                    val = self._unescape(match.group(tok_id).encode("utf-8"))
-                    if len(val) != 1:
-                        self._parse_error("character literals must be length 1")
-                    tok_val = ord(val)
-                else:
-                    tok_val = match.group(tok_id)
-
-            elif self._lexer_state is _DEFAULT:
-                match = _num_re.match(self._file_contents, self._tok_end_i)
-                if match:
-                    tok_id = _T.NUM
-                    num_s = match.group(1)
-                    tok_val = int(num_s,
-                                  16 if num_s.startswith(("0x", "0X")) else
-                                  8 if num_s[0] == "0" else
-                                  10)
-
-            elif self._lexer_state is _EXPECT_PROPNODENAME:
-                match = _propnodename_re.match(self._file_contents,
-                                               self._tok_end_i)
-                if match:
-                    tok_id = _T.PROPNODENAME
-                    tok_val = match.group(1)
-                    self._lexer_state = _DEFAULT
-
-            else:  # self._lexer_state is _EXPECT_BYTE
-                match = _byte_re.match(self._file_contents, self._tok_end_i)
-                if match:
-                    tok_id = _T.BYTE
-                    tok_val = int(match.group(), 16)
-
-            if not tok_id:
-                match = _misc_re.match(self._file_contents, self._tok_end_i)
-                if match:
-                    tok_id = _T.MISC
-                    tok_val = match.group()
-                else:
-                    self._tok_i = self._tok_end_i
-                    # Could get here due to a node/property naming appearing in
-                    # an unexpected context as well as for bad characters in
-                    # files. Generate a token for it so that the error can
-                    # trickle up to some context where we can give a more
-                    # helpful error message.
-                    return _Token(_T.BAD, "<unknown token>")
-
-            self._tok_i = match.start()
-            self._tok_end_i = match.end()
-
-            if tok_id == _T.SKIP:
-                self._lineno += tok_val.count("\n")
-                continue
+            if self._batch_i == len(self._batch):
+                self._lex_batch()
+
+            tok, self._tok_i, self._lineno = self._batch[self._batch_i]
+            self._batch_i += 1
+
+            if tok.id not in _CONTROL_TOKENS:
+                return tok
+
+            # Tokens that end a batch, see _lex_batch()
+
+            if tok.id == _T.CHAR_LITERAL:
+                # Errors are reported at the position the lexer was at
+                # before the literal
+                raw, err_i = tok.val
+                tok_i, self._tok_i = self._tok_i, err_i
+                val = self._unescape(raw.encode("utf-8"))
+                if len(val) != 1:
+                    self._parse_error("character literals must be length 1")
+                self._tok_i = tok_i
+                return _Token(_T.CHAR_LITERAL, ord(val))
 
             # /include/ is handled in the lexer in the C tools as well, and can
             # appear anywhere
-            if tok_id == _T.INCLUDE:
+            if tok.id == _T.INCLUDE:
                 # Can have newlines between /include/ and the filename
-                self._lineno += tok_val.count("\n")
+                self._lineno += tok.val.count("\n")
                 # Do this manual extraction instead of doing it in the regex so
                 # that we can properly count newlines
-                filename = tok_val[tok_val.find('"') + 1:-1]
+                filename = tok.val[tok.val.find('"') + 1:-1]
                 self._enter_file(filename)
                 continue
 
-            if tok_id == _T.LINE:
+            if tok.id == _T.LINE:
                 # #line directive
-                self._lineno = int(tok_val.split()[0]) - 1
-                self.filename = tok_val[tok_val.find('"') + 1:-1]
+                self._lineno = self._lex_lineno = int(tok.val.split()[0]) - 1
+                self.filename = tok.val[tok.val.find('"') + 1:-1]
                 continue
 
-            if tok_id == _T.EOF:
-                if self._filestack:
-                    self._leave_file()
-                    continue
-                return _Token(_T.EOF, "<EOF>")
+            # tok.id == _T.EOF
+            if self._filestack:
+                self._leave_file()
+                continue
+            return _EOF_TOKEN
+
+    def _lex_batch(self):
+        # Lexes tokens from the lexer's position in the current file into
+        # self._batch.
+        #
+        # Lexing doesn't depend on the parser, only on the preceding tokens,
+        # so it can run ahead of it. A batch ends after at most _BATCH_SIZE
+        # tokens, or at a token from _CONTROL_TOKENS, which needs the parser's
+        # position (e.g. to enter an /include/d file or to report an error)
+        # and is handled in _next_token(). A batch also ends at an unknown
+        # token, which is not consumed, and is returned again if lexing
+        # continues.
+        #
+        # There is one regex per lexer state, see _init_tokens(). This
+        # should agree with what tools/dtc/dtc-lexer.l in dtc does, though
+        # it's not a full reimplementation.
+
+        contents = self._file_contents
+        pos = self._tok_end_i
+        state = self._lexer_state
+        lineno = self._lex_lineno
+        last_i = self._lex_tok_i
+
+        batch: list[tuple[_Token, int, int]] = []
+        append = batch.append
+
+        while len(batch) < _BATCH_SIZE:
+            match = _state_token_res[state](contents, pos)
+            if not match:
+                # Could get here due to a node/property naming appearing in
+                # an unexpected context as well as for bad characters in
+                # files. Generate a token for it so that the error can
+                # trickle up to some context where we can give a more
+                # helpful error message.
+                last_i = pos
+                append((_BAD_TOKEN, pos, lineno))
+                break
+
+            group = match.lastindex
+            start = match.start()
+            pos = match.end()
+
+            if group == _MISC_GROUP:
+                tok_val = match.group(group)
+                append((_misc_tokens[tok_val], start, lineno))
+                last_i = start
+                if tok_val in ("{", ";"):
+                    state = _EXPECT_PROPNODENAME
+                elif tok_val == "[":
+                    state = _EXPECT_BYTE
+                elif tok_val == "]":
+                    state = _DEFAULT
+                continue
+
+            if group == _STATE_GROUP:
+                if state == _DEFAULT:
+                    num_s = match.group(group)
+                    tok = _Token(_T.NUM,
+                                 int(num_s,
+                                     16 if num_s.startswith(("0x", "0X")) else
+                                     8 if num_s[0] == "0" else
+                                     10))
+                elif state == _EXPECT_PROPNODENAME:
+                    tok = _Token(_T.PROPNODENAME, match.group(group))
+                    state = _DEFAULT
+                else:  # state == _EXPECT_BYTE
+                    tok = _Token(_T.BYTE, int(match.group(group), 16))
+                append((tok, start, lineno))
+                last_i = start
+                continue
+
+            tok_val = match.group(group)
+
+            if group == _T.SKIP:
+                lineno += tok_val.count("\n")
+                last_i = start
+                continue
+
+            if group == _T.CHAR_LITERAL:
+                # Unescaped in _next_token(), which also reports errors at
+                # the start of the previous match, like the C tools
+                append((_Token(group, (tok_val, last_i)), start, lineno))
+                last_i = start
+                break
+
+            append((_Token(group, tok_val), start, lineno))
+            last_i = start
+
+            if group in _CONTROL_TOKENS:
+                break
 
             # State handling
 
-            if (tok_id in (_T.DEL_PROP, _T.DEL_NODE, _T.OMIT_IF_NO_REF)
+            if (group in (_T.DEL_PROP, _T.DEL_NODE, _T.OMIT_IF_NO_REF)
                 or tok_val in ("{", ";")):
 
-                self._lexer_state = _EXPECT_PROPNODENAME
+                state = _EXPECT_PROPNODENAME
 
             elif tok_val == "[":
-                self._lexer_state = _EXPECT_BYTE
+                state = _EXPECT_BYTE
 
-            elif tok_id in (_T.MEMRESERVE, _T.BITS) or tok_val == "]":
-                self._lexer_state = _DEFAULT
+            elif group in (_T.MEMRESERVE, _T.BITS) or tok_val == "]":
+                state = _DEFAULT
 
-            return _Token(tok_id, tok_val)
+        self._batch = batch
+        self._batch_i = 0
+        self._tok_end_i = pos
+        self._lexer_state = state
+        self._lex_lineno = lineno
+        self._lex_tok_i = last_i
 
     def _expect_token(self, tok_val):
         # Raises an error if the next token does not have the string value
@@ -1781,7 +1857,7 @@ class DT:
                     [filename]))
 
         self.filename = f.name
-        self._lineno = 1
+        self._lineno = self._lex_lineno = 1
         self._tok_end_i = 0
 
     def _leave_file(self):
@@ -1789,6 +1865,7 @@ class DT:
 
         self.filename, self._lineno, self._file_contents, self._tok_end_i = (
             self._filestack.pop())
+        self._lex_lineno = self._lineno
 
     def _next_ref2node(self):
         # Checks that the next token is a label/path reference and returns the
@@ -2195,33 +2272,43 @@ _DEFAULT = 0
 _EXPECT_PROPNODENAME = 1
 _EXPECT_BYTE = 2
 
-_num_re = re.compile(r"(0[xX][0-9a-fA-F]+|[0-9]+)(?:ULL|UL|LL|U|L)?")
+_num_re = r"(0[xX][0-9a-fA-F]+|[0-9]+)(?:ULL|UL|LL|U|L)?"
 
 # A leading \ is allowed property and node names, probably to allow weird node
 # names that would clash with other stuff
-_propnodename_re = re.compile(r"\\?([a-zA-Z0-9,._+*#?@-]+)")
+_propnodename_re = r"\\?([a-zA-Z0-9,._+*#?@-]+)"
 
 # Node names are more restrictive than property names.
 _nodename_chars = set(string.ascii_letters + string.digits + ',._+-@')
 
 # Misc. tokens that are tried after a property/node name. This is important, as
 # there's overlap with the allowed characters in names.
-_misc_re = re.compile(
-    "|".join(re.escape(pat) for pat in (
-        "==", "!=", "!", "=", ",", ";", "+", "-", "*", "/", "%", "~", "?", ":",
-        "^", "(", ")", "{", "}", "[", "]", "<<", "<=", "<", ">>", ">=", ">",
-        "||", "|", "&&", "&")))
+_misc_vals = (
+    "==", "!=", "!", "=", ",", ";", "+", "-", "*", "/", "%", "~", "?", ":",
+    "^", "(", ")", "{", "}", "[", "]", "<<", "<=", "<", ">>", ">=", ">",
+    "||", "|", "&&", "&")
+_misc_re = "(" + "|".join(re.escape(pat) for pat in _misc_vals) + ")"
+
+# Misc. tokens are immutable, so they're shared
+_misc_tokens = {val: _Token(_T.MISC, val) for val in _misc_vals}
 
-_byte_re = re.compile(r"[0-9a-fA-F]{2}")
+_byte_re = r"([0-9a-fA-F]{2})"
 
 # Matches a backslash escape within a 'bytes' array. Captures the 'c' part of
 # '\c', where c might be a single character or an octal/hex escape.
 _unescape_re = re.compile(br'\\([0-7]{1,3}|x[0-9A-Fa-f]{1,2}|.)')
 
 def _init_tokens():
-    # Builds a (<token 1>)|(<token 2>)|... regex and returns it. The
-    # way this is constructed makes the token's value as an int appear
-    # in match.lastindex after a match.
+    # Builds a (<token 1>)|(<token 2>)|...|(<state token>)|(<misc token>) regex
+    # for each lexer state, and returns their match() methods in a tuple
+    # indexed by the state. The way this is constructed makes the token's
+    # value as an int appear in match.lastindex after a match, for the tokens
+    # up to _T.EOF. The state-specific token (a number, property/node name or
+    # byte, depending on the state) is in group _STATE_GROUP, and misc. tokens
+    # are in group _MISC_GROUP.
+    #
+    # Alternatives are tried in order, so this matches the first of the
+    # tokens, then the state-specific token, then the misc. tokens.
 
     # Each pattern must have exactly one capturing group, which can capture any
     # part of the pattern. This makes match.lastindex match the token type.
@@ -2252,12 +2339,29 @@ def _init_tokens():
         _T.EOF: r"(\Z)",
     }
 
+    token_re = "|".join(token_spec[tok_id] for tok_id in range(1, _T.EOF + 1))
+
     # MULTILINE is needed for C++ comments and #line directives
-    return re.compile("|".join(token_spec[tok_id] for tok_id in
-                               range(1, _T.EOF + 1)),
-                      re.MULTILINE | re.ASCII)
+    return tuple(
+        re.compile("|".join((token_re, state_re, _misc_re)),
+                   re.MULTILINE | re.ASCII).match
+        for state_re in (_num_re, _propnodename_re, _byte_re))
+
+# Group numbers of the state-specific and misc. tokens in the regexes from
+# _init_tokens()
+_STATE_GROUP = _T.EOF + 1
+_MISC_GROUP = _T.EOF + 2
+
+_state_token_res = _init_tokens()
+
+# Tokens that end a batch in DT._lex_batch()
+_CONTROL_TOKENS = frozenset((_T.INCLUDE, _T.LINE, _T.CHAR_LITERAL, _T.EOF))
+
+_BAD_TOKEN = _Token(_T.BAD, "<unknown token>")
+_EOF_TOKEN = _Token(_T.EOF, "<EOF>")
 
-_token_re = _init_tokens()
+# Maximum number of tokens lexed ahead of the parser
+_BATCH_SIZE = 512
 
 _TYPE_TO_N_BYTES = {
     _MarkerType.UINT8: 1,
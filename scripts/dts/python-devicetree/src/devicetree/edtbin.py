@@ -0,0 +1,667 @@
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""
+Compact binary serialization of an edtlib.EDT, readable through mmap.
+
+Loading edt.pickle rebuilds the whole EDT object graph (and the dtlib one
+below it), even if the caller only looks at a couple of nodes. The format
+written by write() instead keeps everything in offset-indexed tables, and
+load() returns an EDT object which decodes nodes and property values from
+the mapped file only when they are accessed.
+
+The reader mirrors the edtlib.EDT and edtlib.Node accessors used by the
+build scripts (nodes, get_node(), chosen_node(), compat2nodes, compat2okay,
+compat2notokay, label2node, dep_ord2node, and on nodes: name, path, status,
+compats, props, regs, parent, children, depends_on, ...). Property values
+come back with the same types as in edtlib; registers and phandle-array
+entries are edtlib.Register and edtlib.ControllerAndData instances.
+
+Layout (all integers little endian):
+
+  header        magic, format version, node count and section offsets
+  strings       string count, count + 1 offsets into the string data,
+                string data (UTF-8)
+  nodes         fixed size records, in edt.nodes order
+  dep ordinals  node index for every dependency ordinal
+  tables        compat/label/alias/chosen lookup tables: entry count,
+                then (key string, value) pairs sorted by key
+  data          node lists and tagged property values
+
+Strings, node lists and values are referred to by index or offset, and
+identical lists and values are stored once.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from typing import Any, Optional
+
+from devicetree.edtlib import EDT as _EDT
+from devicetree.edtlib import ControllerAndData, EDTError, Register
+from devicetree.edtlib import Node as _Node
+
+MAGIC = b"ZEDT"
+VERSION = 1
+
+# Index value used for "no string"/"no node"
+NONE = 0xFFFFFFFF
+
+# magic, version, node count, then the offsets of: strings, nodes,
+# dependency ordinals and the compat2nodes, compat2okay, compat2notokay,
+# label2node, alias2node and chosen tables, and of the data blob
+_HEADER = struct.Struct("<4sII10I")
+
+# name, path, status, matching_compat, binding_path, label, parent,
+# dep_ordinal, then the offsets of: unit_addr, compats, labels, aliases,
+# children, depends_on, required_by, buses, on_buses, regs, interrupts,
+# gpio_hogs, read_only and props
+_NODE = struct.Struct("<8I14I")
+
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_PAIR = struct.Struct("<II")
+_PROP = struct.Struct("<III")
+
+# Value tags
+_T_NONE = b"N"[0]
+_T_TRUE = b"T"[0]
+_T_FALSE = b"F"[0]
+_T_INT = b"i"[0]
+_T_BIGINT = b"I"[0]
+_T_STR = b"s"[0]
+_T_BYTES = b"b"[0]
+_T_LIST = b"l"[0]
+_T_DICT = b"d"[0]
+_T_NODE = b"n"[0]
+_T_REG = b"r"[0]
+_T_CTRL = b"c"[0]
+_T_ERROR = b"E"[0]
+
+
+class EDTBinError(EDTError):
+    "Exception raised for files that can't be read as a binary EDT"
+
+
+#
+# Writer
+#
+
+
+class _Writer:
+    def __init__(self, edt: _EDT):
+        self.edt = edt
+        self.strings: dict[str, int] = {}
+        self.node2index = {node: i for i, node in enumerate(edt.nodes)}
+        # Data blob, and offsets of already stored blocks, for deduplication
+        self.data = bytearray()
+        self.blocks: dict[bytes, int] = {}
+
+    def string(self, s: str | None) -> int:
+        if s is None:
+            return NONE
+        if s not in self.strings:
+            self.strings[s] = len(self.strings)
+        return self.strings[s]
+
+    def block(self, block: bytes) -> int:
+        # Returns the offset of 'block' in the data blob
+        if block not in self.blocks:
+            self.blocks[block] = len(self.data)
+            self.data += block
+        return self.blocks[block]
+
+    def node_list(self, nodes) -> int:
+        indices = [self.node2index[node] for node in nodes]
+        return self.block(struct.pack(f"<I{len(indices)}I", len(indices), *indices))
+
+    def string_list(self, strings) -> int:
+        indices = [self.string(s) for s in strings]
+        return self.block(struct.pack(f"<I{len(indices)}I", len(indices), *indices))
+
+    def value(self, val: Any) -> int:
+        out = bytearray()
+        self._encode(val, out)
+        return self.block(bytes(out))
+
+    def attr(self, node: _Node, name: str) -> int:
+        # Stores the value of a node attribute, or the error raised when
+        # computing it, so that the reader raises it at the same point
+        try:
+            val = getattr(node, name)
+        except EDTError as e:
+            out = bytearray((_T_ERROR,))
+            out += _U32.pack(self.string(str(e)))
+            return self.block(bytes(out))
+        return self.value(val)
+
+    def _encode(self, val: Any, out: bytearray) -> None:
+        if val is None:
+            out.append(_T_NONE)
+        elif val is True:
+            out.append(_T_TRUE)
+        elif val is False:
+            out.append(_T_FALSE)
+        elif isinstance(val, int):
+            if -(1 << 63) <= val < (1 << 63):
+                out.append(_T_INT)
+                out += _I64.pack(val)
+            else:
+                raw = val.to_bytes((val.bit_length() + 8) // 8, "little", signed=True)
+                out.append(_T_BIGINT)
+                out += _U32.pack(len(raw))
+                out += raw
+        elif isinstance(val, str):
+            out.append(_T_STR)
+            out += _U32.pack(self.string(val))
+        elif isinstance(val, bytes):
+            out.append(_T_BYTES)
+            out += _U32.pack(len(val))
+            out += val
+        elif isinstance(val, list):
+            out.append(_T_LIST)
+            out += _U32.pack(len(val))
+            for item in val:
+                self._encode(item, out)
+        elif isinstance(val, dict):
+            out.append(_T_DICT)
+            out += _U32.pack(len(val))
+            for key, item in val.items():
+                out += _U32.pack(self.string(key))
+                self._encode(item, out)
+        elif isinstance(val, _Node):
+            out.append(_T_NODE)
+            out += _U32.pack(self.node2index[val])
+        elif isinstance(val, Register):
+            out.append(_T_REG)
+            out += _U32.pack(self.node2index[val.node])
+            for item in (val.name, val.addr, val.size):
+                self._encode(item, out)
+        elif isinstance(val, ControllerAndData):
+            out.append(_T_CTRL)
+            out += _PAIR.pack(self.node2index[val.node], self.node2index[val.controller])
+            for item in (val.data, val.name, val.basename):
+                self._encode(item, out)
+        else:
+            raise EDTBinError(f"can't serialize value {val!r} of type {type(val)}")
+
+    def node(self, node: _Node) -> bytes:
+        props = bytearray(_U32.pack(len(node.props)))
+        for name, prop in node.props.items():
+            props += _PROP.pack(self.string(name), self.string(prop.type), self.value(prop.val))
+
+        return _NODE.pack(
+            self.string(node.name),
+            self.string(node.path),
+            self.string(node.status),
+            self.string(node.matching_compat),
+            self.string(node.binding_path),
+            self.string(node.label),
+            self.node2index[node.parent] if node.parent else NONE,
+            node.dep_ordinal,
+            self.attr(node, "unit_addr"),
+            self.string_list(node.compats),
+            self.string_list(node.labels),
+            self.string_list(node.aliases),
+            self.node_list(node.children.values()),
+            self.node_list(node.depends_on),
+            self.node_list(node.required_by),
+            self.string_list(node.buses),
+            self.string_list(node.on_buses),
+            self.value(node.regs),
+            self.value(node.interrupts),
+            self.attr(node, "gpio_hogs"),
+            self.value(node.read_only),
+            self.block(bytes(props)),
+        )
+
+    def table(self, mapping: dict[str, Any], encode: Callable[[Any], int]) -> bytes:
+        # Lookup table sorted by the UTF-8 encoding of the keys, for bisection
+        keys = sorted(mapping, key=lambda key: key.encode("utf-8"))
+        table = bytearray(_U32.pack(len(keys)))
+        for key in keys:
+            table += _PAIR.pack(self.string(key), encode(mapping[key]))
+        return bytes(table)
+
+    def write(self) -> bytes:
+        edt = self.edt
+        nodes = b"".join(self.node(node) for node in edt.nodes)
+
+        ord2index = [NONE] * len(edt.nodes)
+        for node in edt.nodes:
+            ord2index[node.dep_ordinal] = self.node2index[node]
+        ords = struct.pack(f"<{len(ord2index)}I", *ord2index)
+
+        aliases = {alias: edt._node2enode[node] for alias, node in edt._dt.alias2node.items()}
+        node_index = self.node2index.__getitem__
+        tables = [
+            self.table(edt.compat2nodes, self.node_list),
+            self.table(edt.compat2okay, self.node_list),
+            self.table(edt.compat2notokay, self.node_list),
+            self.table(edt.label2node, node_index),
+            self.table(aliases, node_index),
+            self.table(edt.chosen_nodes, node_index),
+        ]
+
+        # All strings are known now
+        encoded = [s.encode("utf-8") for s in self.strings]
+        offsets = [0]
+        for s in encoded:
+            offsets.append(offsets[-1] + len(s))
+        strings = (
+            _U32.pack(len(encoded)) + struct.pack(f"<{len(offsets)}I", *offsets) + b"".join(encoded)
+        )
+
+        sections = [strings, nodes, ords, *tables]
+        section_offsets = []
+        pos = _HEADER.size
+        for section in sections:
+            section_offsets.append(pos)
+            pos += len(section)
+        # The data blob comes last; offsets into it are relative to its start
+        section_offsets.append(pos)
+
+        header = _HEADER.pack(MAGIC, VERSION, len(edt.nodes), *section_offsets)
+        return header + b"".join(sections) + self.data
+
+
+def write(edt: _EDT, out_file: str | os.PathLike) -> None:
+    """
+    Writes 'edt' in the binary format to 'out_file'.
+    """
+    with open(out_file, "wb") as f:
+        f.write(_Writer(edt).write())
+
+
+#
+# Reader
+#
+
+
+class _Table(Mapping):
+    # Read-only mapping over a sorted lookup table in the file, with an
+    # optional default for missing keys (like the defaultdicts of edtlib.EDT)
+
+    def __init__(
+        self,
+        edt: 'EDT',
+        offset: int,
+        decode: Callable[[int], Any],
+        default: Callable[[], Any] | None = None,
+    ):
+        self._edt = edt
+        self._offset = offset + 4
+        self._len = _U32.unpack_from(edt._mm, offset)[0]
+        self._decode = decode
+        self._default = default
+        self._cache: dict[str, Any] = {}
+
+    def _key(self, i: int) -> int:
+        return _PAIR.unpack_from(self._edt._mm, self._offset + 8 * i)[0]
+
+    def _find(self, key: str) -> int | None:
+        raw = key.encode("utf-8")
+        lo, hi = 0, self._len
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._edt._raw_string(self._key(mid)) < raw:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._len and self._edt._raw_string(self._key(lo)) == raw:
+            return _PAIR.unpack_from(self._edt._mm, self._offset + 8 * lo)[1]
+        return None
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._cache:
+            value = self._find(key) if isinstance(key, str) else None
+            if value is None:
+                if self._default is None:
+                    raise KeyError(key)
+                return self._default()
+            self._cache[key] = self._decode(value)
+        return self._cache[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._cache or (isinstance(key, str) and self._find(key) is not None)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._len):
+            yield self._edt._string(self._key(i))
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class _Nodes(Sequence):
+    # edt.nodes, with Node objects created on access
+
+    def __init__(self, edt: 'EDT'):
+        self._edt = edt
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._edt._node(j) for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._edt._node(i)
+
+    def __len__(self) -> int:
+        return self._edt._n_nodes
+
+
+class _DepOrdinals(Mapping):
+    # edt.dep_ord2node
+
+    def __init__(self, edt: 'EDT'):
+        self._edt = edt
+
+    def __getitem__(self, dep_ordinal: int) -> 'Node':
+        if not (isinstance(dep_ordinal, int) and 0 <= dep_ordinal < self._edt._n_nodes):
+            raise KeyError(dep_ordinal)
+        return self._edt._node(
+            _U32.unpack_from(self._edt._mm, self._edt._ords + 4 * dep_ordinal)[0]
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self._edt._n_nodes))
+
+    def __len__(self) -> int:
+        return self._edt._n_nodes
+
+
+class Property:
+    """
+    A property of a Node in a binary EDT. Mirrors edtlib.Property: 'name',
+    'type', 'node' and 'val', which is decoded on first access.
+    """
+
+    def __init__(self, node: 'Node', name: str, type_: str, offset: int):
+        self.node = node
+        self.name = name
+        self.type = type_
+        self._offset = offset
+
+    @property
+    def val(self) -> Any:
+        "See the class docstring"
+        if not hasattr(self, "_val"):
+            self._val = self.node.edt._value(self._offset)
+        return self._val
+
+    def __repr__(self) -> str:
+        return f"<Property '{self.name}' at '{self.node.path}' of type '{self.type}'>"
+
+
+class Node:
+    """
+    A devicetree node in a binary EDT. Mirrors the data accessors of
+    edtlib.Node; see that class for their meaning. Attributes are decoded
+    from the file on first access.
+    """
+
+    def __init__(self, edt: 'EDT', index: int):
+        self.edt = edt
+        self._index = index
+        self._rec = _NODE.unpack_from(edt._mm, edt._nodes + _NODE.size * index)
+
+    def _str(self, i: int) -> str | None:
+        return self.edt._string(i)
+
+    def _nodes(self, i: int) -> list['Node']:
+        return [self.edt._node(j) for j in self.edt._u32_list(i)]
+
+    def _strs(self, i: int) -> list[str]:
+        return [self.edt._string(j) for j in self.edt._u32_list(i)]
+
+    name = property(lambda self: self._str(self._rec[0]))
+    path = property(lambda self: self._str(self._rec[1]))
+    status = property(lambda self: self._str(self._rec[2]))
+    matching_compat = property(lambda self: self._str(self._rec[3]))
+    binding_path = property(lambda self: self._str(self._rec[4]))
+    label = property(lambda self: self._str(self._rec[5]))
+    dep_ordinal = property(lambda self: self._rec[7])
+    unit_addr = property(lambda self: self.edt._value(self._rec[8]))
+    compats = property(lambda self: self._strs(self._rec[9]))
+    labels = property(lambda self: self._strs(self._rec[10]))
+    aliases = property(lambda self: self._strs(self._rec[11]))
+    depends_on = property(lambda self: self._nodes(self._rec[13]))
+    required_by = property(lambda self: self._nodes(self._rec[14]))
+    buses = property(lambda self: self._strs(self._rec[15]))
+    on_buses = property(lambda self: self._strs(self._rec[16]))
+    regs = property(lambda self: self.edt._value(self._rec[17]))
+    interrupts = property(lambda self: self.edt._value(self._rec[18]))
+    gpio_hogs = property(lambda self: self.edt._value(self._rec[19]))
+    read_only = property(lambda self: self.edt._value(self._rec[20]))
+
+    @property
+    def parent(self) -> Optional['Node']:
+        "See the class docstring"
+        parent = self._rec[6]
+        return None if parent == NONE else self.edt._node(parent)
+
+    @property
+    def children(self) -> dict[str, 'Node']:
+        "See the class docstring"
+        return {child.name: child for child in self._nodes(self._rec[12])}
+
+    @property
+    def props(self) -> dict[str, Property]:
+        "See the class docstring"
+        if not hasattr(self, "_props"):
+            mm = self.edt._mm
+            offset = self.edt._data + self._rec[21]
+            n_props = _U32.unpack_from(mm, offset)[0]
+            self._props: dict[str, Property] = {}
+            for i in range(n_props):
+                name, type_, value = _PROP.unpack_from(mm, offset + 4 + _PROP.size * i)
+                name = self._str(name)
+                self._props[name] = Property(self, name, self._str(type_), value)
+        return self._props
+
+    def __repr__(self) -> str:
+        return f"<Node {self.path} in binary EDT>"
+
+
+class EDT:
+    """
+    Read-only view of a binary EDT file, see the module docstring. Mirrors
+    the lookup accessors of edtlib.EDT.
+
+    Use load() to open a file.
+    """
+
+    def __init__(self, buf):
+        self._mm = buf
+        try:
+            magic, version, n_nodes, *offsets = _HEADER.unpack_from(buf, 0)
+        except struct.error as e:
+            raise EDTBinError(f"truncated binary EDT: {e}") from e
+        if magic != MAGIC:
+            raise EDTBinError("not a binary EDT file")
+        if version != VERSION:
+            raise EDTBinError(f"unsupported binary EDT version {version} (expected {VERSION})")
+
+        self._n_nodes = n_nodes
+        (
+            strings,
+            self._nodes,
+            self._ords,
+            compat2nodes,
+            compat2okay,
+            compat2notokay,
+            label2node,
+            aliases,
+            chosen,
+            self._data,
+        ) = offsets
+
+        self._n_strings = _U32.unpack_from(buf, strings)[0]
+        self._string_offsets = strings + 4
+        self._string_data = self._string_offsets + 4 * (self._n_strings + 1)
+        self._strings: dict[int, str] = {}
+        self._node_cache: dict[int, Node] = {}
+
+        self.nodes: Sequence[Node] = _Nodes(self)
+        self.dep_ord2node: Mapping[int, Node] = _DepOrdinals(self)
+        self.compat2nodes: Mapping[str, list[Node]] = _Table(
+            self, compat2nodes, self._node_list, list
+        )
+        self.compat2okay: Mapping[str, list[Node]] = _Table(
+            self, compat2okay, self._node_list, list
+        )
+        self.compat2notokay: Mapping[str, list[Node]] = _Table(
+            self, compat2notokay, self._node_list, list
+        )
+        self.label2node: Mapping[str, Node] = _Table(self, label2node, self._node)
+        self._alias2node: Mapping[str, Node] = _Table(self, aliases, self._node)
+        self._chosen: Mapping[str, Node] = _Table(self, chosen, self._node)
+
+    def close(self) -> None:
+        """
+        Unmaps the file. Nodes and values must not be accessed afterwards.
+        """
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def __enter__(self) -> 'EDT':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @property
+    def chosen_nodes(self) -> dict[str, Node]:
+        "See edtlib.EDT.chosen_nodes"
+        return dict(self._chosen.items())
+
+    def chosen_node(self, name: str) -> Node | None:
+        "See edtlib.EDT.chosen_node()"
+        return self._chosen.get(name)
+
+    def get_node(self, path: str) -> Node:
+        """
+        Returns the Node at the DT path or alias 'path'. Raises EDTError if the
+        path or alias doesn't exist.
+        """
+        if path.startswith("/"):
+            cur, rest = self._node(0), path
+        else:
+            alias, _, rest = path.partition("/")
+            if alias not in self._alias2node:
+                raise EDTError(
+                    f"no alias '{alias}' found -- did you forget the leading '/' in the node path?"
+                )
+            cur = self._alias2node[alias]
+
+        for component in rest.split("/"):
+            # Collapse multiple / in a row, and allow a / at the end
+            if not component:
+                continue
+            children = cur.children
+            if component not in children:
+                raise EDTError(f"component '{component}' in path '{path}' does not exist")
+            cur = children[component]
+        return cur
+
+    def _raw_string(self, i: int) -> bytes:
+        start, end = struct.unpack_from("<II", self._mm, self._string_offsets + 4 * i)
+        return self._mm[self._string_data + start : self._string_data + end]
+
+    def _string(self, i: int) -> str | None:
+        if i == NONE:
+            return None
+        if i not in self._strings:
+            self._strings[i] = self._raw_string(i).decode("utf-8")
+        return self._strings[i]
+
+    def _node(self, i: int) -> Node:
+        if i not in self._node_cache:
+            self._node_cache[i] = Node(self, i)
+        return self._node_cache[i]
+
+    def _u32_list(self, offset: int) -> tuple[int, ...]:
+        offset += self._data
+        n = _U32.unpack_from(self._mm, offset)[0]
+        return struct.unpack_from(f"<{n}I", self._mm, offset + 4)
+
+    def _node_list(self, offset: int) -> list[Node]:
+        return [self._node(i) for i in self._u32_list(offset)]
+
+    def _value(self, offset: int) -> Any:
+        return self._decode(self._data + offset)[0]
+
+    def _decode(self, pos: int) -> tuple[Any, int]:
+        # Decodes the value at absolute position 'pos'. Returns the value
+        # and the position following it.
+        mm = self._mm
+        tag = mm[pos]
+        pos += 1
+        if tag == _T_NONE:
+            return None, pos
+        if tag == _T_TRUE:
+            return True, pos
+        if tag == _T_FALSE:
+            return False, pos
+        if tag == _T_INT:
+            return _I64.unpack_from(mm, pos)[0], pos + 8
+        if tag == _T_STR:
+            return self._string(_U32.unpack_from(mm, pos)[0]), pos + 4
+        if tag == _T_NODE:
+            return self._node(_U32.unpack_from(mm, pos)[0]), pos + 4
+        if tag == _T_LIST:
+            n = _U32.unpack_from(mm, pos)[0]
+            pos += 4
+            items: list[Any] = []
+            for _ in range(n):
+                item, pos = self._decode(pos)
+                items.append(item)
+            return items, pos
+        if tag == _T_DICT:
+            n = _U32.unpack_from(mm, pos)[0]
+            pos += 4
+            dict_items: dict[str | None, Any] = {}
+            for _ in range(n):
+                key = self._string(_U32.unpack_from(mm, pos)[0])
+                dict_items[key], pos = self._decode(pos + 4)
+            return dict_items, pos
+        if tag in (_T_BYTES, _T_BIGINT):
+            n = _U32.unpack_from(mm, pos)[0]
+            raw = bytes(mm[pos + 4 : pos + 4 + n])
+            if tag == _T_BIGINT:
+                return int.from_bytes(raw, "little", signed=True), pos + 4 + n
+            return raw, pos + 4 + n
+        if tag == _T_REG:
+            node = self._node(_U32.unpack_from(mm, pos)[0])
+            name, pos = self._decode(pos + 4)
+            addr, pos = self._decode(pos)
+            size, pos = self._decode(pos)
+            return Register(node, name, addr, size), pos
+        if tag == _T_CTRL:
+            node, controller = _PAIR.unpack_from(mm, pos)
+            data, pos = self._decode(pos + 8)
+            name, pos = self._decode(pos)
+            basename, pos = self._decode(pos)
+            return ControllerAndData(
+                self._node(node), self._node(controller), data, name, basename
+            ), pos
+        if tag == _T_ERROR:
+            raise EDTError(self._string(_U32.unpack_from(mm, pos)[0]))
+        raise EDTBinError(f"bad value tag {tag:#x} at offset {pos - 1}")
+
+
+def load(path: str | os.PathLike) -> EDT:
+    """
+    Maps the binary EDT file at 'path' and returns an EDT for it.
+    Raises EDTBinError if it is not a binary EDT file of this version.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty file, which can't be mapped
+            buf = b""
+    return EDT(buf)
@@ -69,10 +69,13 @@ bindings_from_paths() helper function.
 #   variables. See the existing @properties for a template.
 
 import base64
+import contextlib
 import hashlib
 import logging
 import os
+import pickle
 import re
+import tempfile
 from collections import defaultdict
 from collections.abc import Callable, Iterable
 from copy import deepcopy
@@ -235,6 +238,8 @@ class Binding:
         """
         self.path: Optional[str] = path
         self._fname2path: dict[str, str] = fname2path
+        # Paths of the files merged in through 'include:'
+        self._include_paths: set[str] = set()
 
         if raw is None:
             if path is None:
@@ -398,6 +403,7 @@ class Binding:
         if not path:
             _err(f"'{fname}' not found")
 
+        self._include_paths.add(path)
         with open(path, encoding="utf-8") as f:
             contents = yaml.load(f, Loader=_BindingLoader)
             if not isinstance(contents, dict):
@@ -2193,7 +2199,8 @@ class EDT:
                  infer_binding_for_paths: Optional[Iterable[str]] = None,
                  vendor_prefixes: Optional[dict[str, str]] = None,
                  werror: bool = False,
-                 warn_bus_mismatch: bool = False):
+                 warn_bus_mismatch: bool = False,
+                 binding_cache_dir: Optional[str] = None):
         """EDT constructor.
 
         dts:
@@ -2241,6 +2248,13 @@ class EDT:
         warn_bus_mismatch (default: False):
           If True, a warning is logged if a node's actual bus does not match
             the bus specified in its binding.
+
+        binding_cache_dir (default: None):
+          If given, a directory where parsed bindings are cached, with their
+          'include:'s resolved. The cache can be shared by EDT instances with
+          different devicetrees and binding directories, also in different
+          processes. Entries are invalidated when the modification time or
+          size of the binding file or of a file it includes changes.
         """
         # All instance attributes should be initialized here.
         # This makes it easy to keep track of them, which makes
@@ -2268,6 +2282,7 @@ class EDT:
         self._vendor_prefixes: dict[str, str] = vendor_prefixes or {}
         self._werror: bool = bool(werror)
         self._warn_bus_mismatch: bool = warn_bus_mismatch
+        self._binding_cache_dir: Optional[str] = binding_cache_dir
 
         # Other internal state
         self._compat2binding: dict[tuple[str, Optional[str]], Binding] = {}
@@ -2357,7 +2372,8 @@ class EDT:
             support_fixed_partitions_on_any_bus=self._fixed_partitions_no_bus,
             infer_binding_for_paths=set(self._infer_binding_for_paths),
             vendor_prefixes=dict(self._vendor_prefixes),
-            werror=self._werror
+            werror=self._werror,
+            binding_cache_dir=self._binding_cache_dir
         )
         ret.dts_path = self.dts_path
         ret._dt = deepcopy(self._dt, memo)
@@ -2464,6 +2480,10 @@ class EDT:
             "|".join(re.escape(compat) for compat in dt_compats)
         ).search
 
+        if self._binding_cache_dir is not None:
+            self._init_compat2binding_cached(dt_compats, dt_compats_search)
+            return
+
         for binding_path in self._binding_paths:
             with open(binding_path, encoding="utf-8") as f:
                 contents = f.read()
@@ -2497,6 +2517,72 @@ class EDT:
                     self._register_binding(binding)
                 binding = binding.child_binding
 
+    def _init_compat2binding_cached(self,
+                                    dt_compats: set[str],
+                                    dt_compats_search: Callable) -> None:
+        # _init_compat2binding() helper for when a binding cache directory
+        # is set. Files already in the cache are neither read nor parsed
+        # unless their compatible appears in the devicetree, and bindings are
+        # loaded with their includes already merged in.
+
+        cache = _BindingCache(self._binding_cache_dir,  # type: ignore
+                              self._binding_fname2path)
+
+        for binding_path in self._binding_paths:
+            # Stamp taken before reading the file, so that changes made
+            # while reading it invalidate the cache entries
+            stamp = _file_stamp(binding_path)
+            raw = None
+            try:
+                compatible = cache.compatible(binding_path, stamp)
+            except KeyError:
+                # Not cached yet, or stale. Parse the file to find its
+                # compatible.
+                with open(binding_path, encoding="utf-8") as f:
+                    contents = f.read()
+                try:
+                    raw = yaml.load(contents, Loader=_BindingLoader)
+                except yaml.YAMLError as e:
+                    # Like in _init_compat2binding(), only an error if the
+                    # file looks like it might be a binding we need. Such
+                    # files are not cached.
+                    if dt_compats_search(contents):
+                        _err(
+                            f"'{binding_path}' appears in binding directories "
+                            f"but isn't valid YAML: {e}")
+                    continue
+                compatible = (raw.get("compatible")
+                              if isinstance(raw, dict) else None)
+                if not isinstance(compatible, str):
+                    compatible = None
+                cache.set_compatible(binding_path, stamp, compatible)
+
+            if compatible not in dt_compats:
+                continue
+
+            binding = None
+            if raw is None:
+                merged = cache.binding(binding_path, stamp)
+                if merged is not None:
+                    binding = Binding(binding_path, self._binding_fname2path,
+                                      raw=merged)
+                else:
+                    with open(binding_path, encoding="utf-8") as f:
+                        raw = yaml.load(f, Loader=_BindingLoader)
+
+            if binding is None:
+                binding = self._binding(raw, binding_path, dt_compats)
+                if binding is None:
+                    continue
+                cache.set_binding(binding_path, stamp, binding)
+
+            while binding is not None:
+                if binding.compatible:
+                    self._register_binding(binding)
+                binding = binding.child_binding
+
+        cache.save()
+
     def _binding(self,
                  raw: Optional[dict],
                  binding_path: str,
@@ -2745,6 +2831,14 @@ def _binding_paths(bindings_dirs: list[str]) -> list[str]:
             if filename.endswith((".yaml", ".yml"))]
 
 
+def _file_stamp(path: str) -> tuple[int, int]:
+    # Returns the modification time and size of the file at 'path', used to
+    # detect stale entries in a _BindingCache
+
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size)
+
+
 def _binding_inc_error(msg):
     # Helper for reporting errors in the !include implementation
 
@@ -3559,6 +3653,133 @@ class _BindingLoader(Loader):
     pass
 
 
+class _BindingCache:
+    # On-disk cache of bindings, see the 'binding_cache_dir' argument to
+    # EDT.__init__().
+    #
+    # The cache directory has an index file mapping the path of each binding
+    # file seen so far to its stamp (see _file_stamp()) and its top-level
+    # 'compatible:', so that bindings for compatibles that are not in the
+    # devicetree are skipped without reading the files. Bindings that were
+    # loaded are stored in a file per binding, with their includes merged
+    # in, along with the paths and stamps of the included files.
+    #
+    # Writes go through a temporary file and os.replace(), so that EDT
+    # instances in other processes never see partially written files.
+
+    # Bumped whenever the format of the files changes
+    VERSION = 1
+
+    def __init__(self, cache_dir: str, fname2path: dict[str, str]):
+        self._dir = cache_dir
+        self._fname2path = fname2path
+        self._index_path = os.path.join(cache_dir, "index.pickle")
+
+        # Binding path -> (stamp, compatible)
+        self._index: dict[str, tuple[tuple[int, int], Optional[str]]] = \
+            self._load(self._index_path) or {}
+        self._new_index: dict[str, tuple[tuple[int, int], Optional[str]]] = {}
+
+    def compatible(self, path: str, stamp: tuple[int, int]) -> Optional[str]:
+        # Returns the compatible of the binding at 'path', which has the
+        # stamp 'stamp'. Raises KeyError if the file is not in the index or
+        # has changed since it was added.
+
+        cached_stamp, compatible = self._index[path]
+        if cached_stamp != stamp:
+            raise KeyError(path)
+        return compatible
+
+    def set_compatible(self, path: str, stamp: tuple[int, int],
+                       compatible: Optional[str]) -> None:
+        self._index[path] = self._new_index[path] = (stamp, compatible)
+
+    def binding(self, path: str, stamp: tuple[int, int]) -> Optional[dict]:
+        # Returns the raw binding at 'path' with its includes merged in, or
+        # None if it is not cached or any of the files it was built from has
+        # changed
+
+        entry = self._load(self._entry_path(path))
+        if entry is None:
+            return None
+
+        cached_stamp, deps, raw = entry
+        if cached_stamp != stamp:
+            return None
+        for dep_path, dep_stamp in deps.items():
+            # Includes are looked up by file name, so a binding directory
+            # with another file of the same name also invalidates the entry
+            if self._fname2path.get(os.path.basename(dep_path)) != dep_path:
+                return None
+            try:
+                if _file_stamp(dep_path) != dep_stamp:
+                    return None
+            except OSError:
+                return None
+        return raw
+
+    def set_binding(self, path: str, stamp: tuple[int, int],
+                    binding: Binding) -> None:
+        include_paths: set[str] = set()
+        child: Optional[Binding] = binding
+        while child is not None:
+            include_paths |= child._include_paths
+            child = child.child_binding
+
+        try:
+            deps = {dep_path: _file_stamp(dep_path)
+                    for dep_path in include_paths}
+        except OSError:
+            return
+        self._store(self._entry_path(path), (stamp, deps, binding.raw))
+
+    def save(self) -> None:
+        # Merges the index entries added by this instance into the index
+        # file, keeping the ones added by others in the meantime
+
+        if not self._new_index:
+            return
+
+        index = self._load(self._index_path) or {}
+        index.update(self._new_index)
+        self._store(self._index_path, index)
+        self._new_index = {}
+
+    def _entry_path(self, path: str) -> str:
+        return os.path.join(
+            self._dir, hashlib.sha256(path.encode()).hexdigest() + ".pickle")
+
+    def _load(self, path: str) -> Any:
+        # Returns the data in the cache file 'path', or None if it doesn't
+        # exist or can't be read (e.g. from an older version)
+
+        try:
+            with open(path, "rb") as f:
+                version, data = pickle.load(f)
+        except Exception:
+            return None
+        return data if version == self.VERSION else None
+
+    def _store(self, path: str, data: Any) -> None:
+        try:
+            os.makedirs(self._dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self._dir, suffix=".tmp")
+        except OSError as e:
+            # The cache is only an optimization
+            _LOG.debug("could not write binding cache file %s: %s", path, e)
+            return
+
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((self.VERSION, data), f,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            _LOG.debug("could not write binding cache file %s: %s", path, e)
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+
 class HexInt(int):
     """
     An integer subclass that indicates the value was expressed in hexadecimal
@@ -1136,6 +1136,40 @@ def test_include_misc(tmp_path):
                           "expected '/dts-v1/;' at start of file"):
             dtlib.DT("tmp.dts")
 
+def test_include_long_files(tmp_path):
+    '''Test /include/ and line numbers in files with more tokens than the
+    lexer reads ahead at a time.'''
+
+    n_props = 300
+
+    with temporary_chdir(tmp_path):
+        with open("tmp2.dts", "w") as f:
+            f.write("".join(f"\tinc{i} = <{i}>;\n" for i in range(n_props)))
+        with open("tmp.dts", "w") as f:
+            f.write("/dts-v1/;\n/ {\n")
+            f.write("".join(f"\ta{i} = <{i}>;\n" for i in range(n_props)))
+            f.write('\t/include/ "tmp2.dts"\n')
+            f.write("".join(f"\tb{i} = <{i}>;\n" for i in range(n_props)))
+            f.write("};\n")
+
+        dt = dtlib.DT("tmp.dts")
+
+    props = dt.root.props
+    assert list(props) == ([f"a{i}" for i in range(n_props)] +
+                           [f"inc{i}" for i in range(n_props)] +
+                           [f"b{i}" for i in range(n_props)])
+    assert props[f"a{n_props - 1}"].to_num() == n_props - 1
+    assert props[f"inc{n_props - 1}"].to_num() == n_props - 1
+    assert props[f"b{n_props - 1}"].to_num() == n_props - 1
+
+    assert props["a0"].lineno == 3
+    assert props["inc0"].lineno == 1
+    assert props[f"inc{n_props - 1}"].lineno == n_props
+    assert props["b0"].lineno == n_props + 4
+    assert props[f"b{n_props - 1}"].lineno == 2 * n_props + 3
+    assert props["inc0"].filename.endswith("tmp2.dts")
+    assert props["b0"].filename.endswith("tmp.dts")
+
 def test_include_recursion(tmp_path):
     '''Test recursive /include/ detection'''
 
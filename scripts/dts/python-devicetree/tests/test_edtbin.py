@@ -0,0 +1,175 @@
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: BSD-3-Clause
+
+import contextlib
+import os
+
+import pytest
+from devicetree import edtbin, edtlib
+
+# Test suite for edtbin.py.
+#
+# The tests write test.dts in the binary format and check that the reader
+# gives back the same values as the edtlib.EDT it was written from.
+
+HERE = os.path.dirname(__file__)
+
+
+@contextlib.contextmanager
+def from_here():
+    cwd = os.getcwd()
+    try:
+        os.chdir(HERE)
+        yield
+    finally:
+        os.chdir(cwd)
+
+
+@pytest.fixture(scope="module")
+def edts(tmp_path_factory):
+    with from_here():
+        edt = edtlib.EDT("test.dts", ["test-bindings"])
+    path = tmp_path_factory.mktemp("edtbin") / "edt.bin"
+    edtbin.write(edt, path)
+    with edtbin.load(path) as bin_edt:
+        yield edt, bin_edt
+
+
+def same(val, bin_val):
+    # Compares an edtlib value with the corresponding edtbin one
+
+    if isinstance(val, edtlib.Node):
+        return isinstance(bin_val, edtbin.Node) and val.path == bin_val.path
+    if isinstance(val, list):
+        return (
+            isinstance(bin_val, list)
+            and len(val) == len(bin_val)
+            and all(same(a, b) for a, b in zip(val, bin_val, strict=True))
+        )
+    if isinstance(val, dict):
+        return (
+            isinstance(bin_val, dict)
+            and val.keys() == bin_val.keys()
+            and all(same(val[key], bin_val[key]) for key in val)
+        )
+    if isinstance(val, edtlib.Register):
+        return (
+            same(val.node, bin_val.node)
+            and val.name == bin_val.name
+            and val.addr == bin_val.addr
+            and val.size == bin_val.size
+        )
+    if isinstance(val, edtlib.ControllerAndData):
+        return (
+            same(val.node, bin_val.node)
+            and same(val.controller, bin_val.controller)
+            and same(val.data, bin_val.data)
+            and val.name == bin_val.name
+            and val.basename == bin_val.basename
+        )
+    return type(val) is type(bin_val) and val == bin_val
+
+
+def test_nodes(edts):
+    '''Test that node attributes and property values round-trip.'''
+
+    edt, bin_edt = edts
+
+    assert len(bin_edt.nodes) == len(edt.nodes)
+    for node, bin_node in zip(edt.nodes, bin_edt.nodes, strict=True):
+        for attr in (
+            "name",
+            "path",
+            "status",
+            "matching_compat",
+            "binding_path",
+            "label",
+            "dep_ordinal",
+            "compats",
+            "labels",
+            "aliases",
+            "parent",
+            "children",
+            "depends_on",
+            "required_by",
+            "buses",
+            "on_buses",
+            "regs",
+            "interrupts",
+            "read_only",
+        ):
+            assert same(getattr(node, attr), getattr(bin_node, attr)), f"{attr} of {node.path}"
+
+        assert node.props.keys() == bin_node.props.keys()
+        for name, prop in node.props.items():
+            bin_prop = bin_node.props[name]
+            assert bin_prop.type == prop.type
+            assert same(prop.val, bin_prop.val), f"{name} of {node.path}"
+
+
+def test_node_errors(edts):
+    '''Test that errors raised by node attributes are raised by the reader.'''
+
+    edt, bin_edt = edts
+
+    for node, bin_node in zip(edt.nodes, bin_edt.nodes, strict=True):
+        for attr in ("unit_addr", "gpio_hogs"):
+            try:
+                val = getattr(node, attr)
+            except edtlib.EDTError as e:
+                with pytest.raises(edtlib.EDTError, match=str(e)):
+                    getattr(bin_node, attr)
+            else:
+                assert same(val, getattr(bin_node, attr))
+
+
+def test_lookups(edts):
+    '''Test the EDT-level lookup tables.'''
+
+    edt, bin_edt = edts
+
+    for table in ("compat2nodes", "compat2okay", "compat2notokay", "label2node", "chosen_nodes"):
+        assert same(dict(getattr(edt, table)), dict(getattr(bin_edt, table))), table
+
+    assert same(dict(edt.dep_ord2node), dict(bin_edt.dep_ord2node))
+
+    assert bin_edt.compat2okay["no-such-compat"] == []
+    assert "no-such-compat" not in bin_edt.compat2okay
+    assert bin_edt.label2node.get("no-such-label") is None
+    assert bin_edt.chosen_node("no-such-chosen") is None
+
+
+def test_get_node(edts):
+    '''Test EDT.get_node() with paths and aliases.'''
+
+    edt, bin_edt = edts
+
+    for node in edt.nodes:
+        assert bin_edt.get_node(node.path).path == node.path
+        for alias in node.aliases:
+            assert bin_edt.get_node(alias).path == node.path
+
+    assert bin_edt.get_node("//interrupt-parent-test//node/").path == "/interrupt-parent-test/node"
+
+    with pytest.raises(edtlib.EDTError, match="does not exist"):
+        bin_edt.get_node("/no-such-node")
+    with pytest.raises(edtlib.EDTError, match="no alias"):
+        bin_edt.get_node("no-such-alias")
+
+
+def test_bad_file(tmp_path):
+    '''Test that files which aren't binary EDTs are rejected.'''
+
+    path = tmp_path / "bad.bin"
+
+    path.write_bytes(b"")
+    with pytest.raises(edtbin.EDTBinError, match="truncated"):
+        edtbin.load(path)
+
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(edtbin.EDTBinError, match="not a binary EDT"):
+        edtbin.load(path)
+
+    path.write_bytes(edtbin.MAGIC + (edtbin.VERSION + 1).to_bytes(4, "little") + b"\0" * 64)
+    with pytest.raises(edtbin.EDTBinError, match="unsupported"):
+        edtbin.load(path)
@@ -1092,6 +1092,71 @@ def test_deepcopy():
     assert edt_copy._dt is not edt._dt
 
 
+def test_binding_cache(tmp_path):
+    '''Test the on-disk binding cache'''
+
+    cache_dir = tmp_path / "cache"
+
+    with from_here():
+        edt = edtlib.EDT("test.dts", ["test-bindings"])
+        for _ in range(2):
+            # Populates the cache the first time, and uses it the second time
+            cached_edt = edtlib.EDT("test.dts", ["test-bindings"],
+                                    binding_cache_dir=str(cache_dir))
+
+            assert cached_edt._compat2binding.keys() == edt._compat2binding.keys()
+            for key, binding in edt._compat2binding.items():
+                cached_binding = cached_edt._compat2binding[key]
+                assert cached_binding.path == binding.path
+                assert cached_binding.raw == binding.raw
+            assert [repr(node) for node in cached_edt.nodes] == \
+                [repr(node) for node in edt.nodes]
+
+    assert (cache_dir / "index.pickle").is_file()
+
+    # Changing an included file invalidates the bindings which include it
+    bindings_dir = tmp_path / "bindings"
+    bindings_dir.mkdir()
+    (bindings_dir / "base.yaml").write_text("""\
+properties:
+  foo:
+    type: int
+""")
+    (bindings_dir / "dev.yaml").write_text("""\
+description: Test device
+compatible: "test-dev"
+include: base.yaml
+""")
+    dts_file = tmp_path / "test.dts"
+    dts_file.write_text("""\
+/dts-v1/;
+
+/ {
+\tdev {
+\t\tcompatible = "test-dev";
+\t\tfoo = <1>;
+\t};
+};
+""")
+
+    def dev_props():
+        edt = edtlib.EDT(str(dts_file), [str(bindings_dir)],
+                         binding_cache_dir=str(cache_dir))
+        return sorted(edt.get_node("/dev").props)
+
+    assert dev_props() == ["foo"]
+    assert dev_props() == ["foo"]
+
+    (bindings_dir / "base.yaml").write_text("""\
+properties:
+  foo:
+    type: int
+  bar:
+    type: int
+    default: 2
+""")
+    assert dev_props() == ["bar", "foo"]
+
 def verify_error(dts, dts_file, expected_err):
     # Verifies that parsing a file 'dts_file' with the contents 'dts'
     # (a string) raises an EDTError with the message 'expected_err'.
@@ -16,12 +16,20 @@
 # Also does various checks (most via Kconfiglib warnings).
 
 import argparse
+import contextlib
+import copyreg
+import gc
+import hashlib
+import importlib.util
 import json
+import operator
 import os
 import pickle
 import re
 import sys
 import textwrap
+import time
+from glob import iglob
 
 # Zephyr doesn't use tristate symbols. They're supported here just to make the
 # script a bit more generic.
@@ -32,8 +40,11 @@ from kconfiglib import (
     TRI_TO_STR,
     TRISTATE,
     TYPE_TO_STR,
+    Choice,
     Kconfig,
+    MenuNode,
     Symbol,
+    Variable,
     expr_str,
     expr_value,
     split_expr,
@@ -46,9 +57,18 @@ def main():
     if args.zephyr_base:
         os.environ['ZEPHYR_BASE'] = args.zephyr_base
 
-    print("Parsing " + args.kconfig_file)
-    kconf = Kconfig(args.kconfig_file, warn_to_stderr=False,
-                    suppress_traceback=True)
+    kconf = load_parse_cache(args.parse_cache, args.kconfig_file)
+    if kconf is None:
+        print("Parsing " + args.kconfig_file)
+        start = time.perf_counter()
+        kconf = Kconfig(args.kconfig_file, warn_to_stderr=False,
+                        suppress_traceback=True)
+        print(f"Parsed Kconfig tree in {time.perf_counter() - start:.2f} s")
+
+        # Only write the cache when reconfiguring, as one-off builds would
+        # just pay for writing it
+        if args.parse_cache and os.path.exists(args.config_out):
+            write_parse_cache(args.parse_cache, args.kconfig_file, kconf)
 
     if args.handwritten_input_configs:
         # Warn for assignments to undefined symbols, but only for handwritten
@@ -136,6 +156,10 @@ def main():
     print(kconf.write_config(args.config_out))
     print(kconf.write_autoconf(args.header_out))
 
+    if args.sync_deps:
+        # Touch the files of the symbols which changed value, for fixdep.py
+        kconf.sync_deps(args.sync_deps)
+
     # Write value origin information for the merged configuration
     trace_data = collect_trace_data(kconf)
     with open(args.config_out + '-trace.pickle', 'wb') as f:
@@ -347,6 +371,209 @@ def write_kconfig_filenames(kconf, kconfig_list_path):
             print(path, file=out)
 
 
+# Version of the parse cache format. Increase it when making changes to it.
+PARSE_CACHE_VERSION = 1
+
+# Environment variables read when the Kconfig files are parsed, but not with
+# the $(FOO) syntax, so they are not in Kconfig.env_vars
+PARSE_ENV_VARS = (
+    "srctree",
+    "CONFIG_",
+    "KCONFIG_FUNCTIONS",
+    "KCONFIG_WARN_UNDEF",
+    "KCONFIG_STRICT",
+    "KCONFIG_WARN_UNDEF_ASSIGN",
+    "KCONFIG_CONFIG_HEADER",
+    "KCONFIG_AUTOHEADER_HEADER",
+    # Read by kconfigfunctions.py
+    "KCONFIG_DOC_MODE",
+    "EDT_BIN",
+    "EDT_PICKLE",
+    "SHIELD_AS_LIST",
+)
+
+# Devicetree files read by the preprocessor functions in kconfigfunctions.py,
+# in order of preference. Only the first one that exists is read. The pickled
+# EDT differs between runs of gen_edt.py, so it must not be looked at when
+# there is a binary one.
+PARSE_FILE_ENV_VARS = ("EDT_BIN", "EDT_PICKLE")
+
+# Kconfiglib classes of the objects in a parsed Kconfig tree
+TREE_CLASSES = (Kconfig, Symbol, Choice, MenuNode, Variable)
+
+
+def file_digest(path):
+    # Returns the SHA-256 hex digest of the file at 'path', or None if it
+    # can't be read
+
+    try:
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def parse_inputs(kconfig_file, env_vars):
+    # Returns what the Kconfig tree parsed from 'kconfig_file' depends on,
+    # apart from the files it sources. 'env_vars' are the names of the
+    # environment variables referenced in the Kconfig files.
+
+    env_vars = set(PARSE_ENV_VARS) | set(env_vars)
+
+    files = [__file__, sys.modules[Kconfig.__module__].__file__]
+    for var in PARSE_FILE_ENV_VARS:
+        path = os.environ.get(var)
+        if path and os.path.isfile(path):
+            files.append(path)
+            break
+    try:
+        functions = importlib.util.find_spec(
+            os.environ.get("KCONFIG_FUNCTIONS", "kconfigfunctions"))
+    except (ImportError, ValueError):
+        functions = None
+    if functions is not None and functions.origin:
+        files.append(functions.origin)
+
+    return {
+        "version": (PARSE_CACHE_VERSION, sys.version_info[:2]),
+        "kconfig_file": kconfig_file,
+        "cwd": os.getcwd(),
+        "env": {var: os.environ.get(var) for var in sorted(env_vars)},
+        "files": {path: file_digest(path) for path in files},
+    }
+
+
+def sources_unchanged(sources):
+    # Returns True if the Kconfig files recorded in 'sources' still exist with
+    # the same contents, and their 'source' statements match the same files
+
+    for path, digest in sources["files"].items():
+        if file_digest(path) != digest:
+            return False
+
+    return all(sorted(iglob(pattern)) == filenames
+               for pattern, filenames in sources["patterns"])
+
+
+class _TreePickler(pickle.Pickler):
+    # Pickles the objects of a parsed Kconfig tree without recursing through
+    # the references between them, which are too deeply nested for pickle.
+    #
+    # The list of all objects is pickled first, with just their classes. The
+    # pickled list of BuildItem then fills in their attributes. Unpickling it
+    # sets the attributes of each object in one go, which is a lot faster
+    # than setting them with setattr().
+
+    def __init__(self, file, objs):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+
+        ids = {id(obj) for obj in objs}
+
+        def reduce_tree_obj(obj):
+            if id(obj) in ids:
+                return copyreg.__newobj__, (type(obj),)
+            # An object not listed in 'objs', pickled as a whole
+            return copyreg.__newobj__, (type(obj),), (None, slot_state(obj))
+
+        self.dispatch_table = copyreg.dispatch_table.copy()
+        self.dispatch_table.update((cls, reduce_tree_obj)
+                                   for cls in TREE_CLASSES)
+        # itemgetter(0)((obj,)) gives back 'obj', which gets its state then
+        self.dispatch_table[BuildItem] = lambda item: (
+            operator.itemgetter(0), ((item.obj,),), (None, item.state))
+
+
+class BuildItem:
+    # Sets the attributes of an object in the pickled Kconfig tree
+
+    __slots__ = ("obj", "state")
+
+    def __init__(self, obj):
+        self.obj = obj
+        self.state = slot_state(obj)
+
+
+def slot_state(obj):
+    # Returns the attributes of a Kconfiglib object as a dict
+
+    state = {name: getattr(obj, name) for name in type(obj).__slots__
+             if hasattr(obj, name)}
+
+    # The readline() method of the closed top-level Kconfig file
+    state.pop("_readline", None)
+    return state
+
+
+def write_parse_cache(cache_file, kconfig_file, kconf):
+    # Writes the parsed Kconfig tree 'kconf' to 'cache_file', together with
+    # what it depends on
+
+    sources = {
+        "files": {},
+        "patterns": kconf.source_patterns,
+    }
+    for path in kconf.kconfig_filenames:
+        path = os.path.join(kconf.srctree, path)
+        if path not in sources["files"]:
+            sources["files"][path] = file_digest(path)
+
+    objs = [kconf, *kconf.syms.values(), *kconf.const_syms.values(),
+            *kconf.choices, *kconf.variables.values(), *kconf.node_iter()]
+
+    # The tree is made of lots of small objects, which makes the cyclic
+    # garbage collector run often without finding anything
+    gc.disable()
+    try:
+        with open(cache_file + ".tmp", "wb") as f:
+            pickle.dump(parse_inputs(kconfig_file, kconf.env_vars), f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+            pickler = _TreePickler(f, objs)
+            pickler.dump(sources)
+            pickler.dump(objs)
+            pickler.dump([BuildItem(obj) for obj in objs])
+        os.replace(cache_file + ".tmp", cache_file)
+    except (OSError, pickle.PicklingError, AttributeError, TypeError,
+            RecursionError) as e:
+        # The cache is only an optimization, so don't fail the build on it,
+        # and don't leave a partially written file behind
+        with contextlib.suppress(OSError):
+            os.remove(cache_file + ".tmp")
+        warn(f"could not write Kconfig parse cache {cache_file}: {e}")
+    finally:
+        gc.enable()
+
+
+def load_parse_cache(cache_file, kconfig_file):
+    # Returns the Kconfig tree for 'kconfig_file' from 'cache_file', or None
+    # if there is none or it's outdated
+
+    if not cache_file:
+        return None
+
+    start = time.perf_counter()
+    gc.disable()
+    try:
+        with open(cache_file, "rb") as f:
+            inputs = pickle.load(f)
+            if inputs != parse_inputs(kconfig_file, inputs["env"]):
+                return None
+
+            unpickler = pickle.Unpickler(f)
+            if not sources_unchanged(unpickler.load()):
+                return None
+            objs = unpickler.load()
+            unpickler.load()
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError,
+            ImportError, KeyError, TypeError):
+        return None
+    finally:
+        gc.enable()
+
+    print(f"Loaded Kconfig tree from {cache_file} in "
+          f"{time.perf_counter() - start:.2f} s")
+    return objs[0]
+
+
 def parse_args():
     parser = argparse.ArgumentParser(allow_abbrev=False)
 
@@ -366,6 +593,14 @@ def parse_args():
                              " adjustments.")
     parser.add_argument("--zephyr-base",
                         help="Path to current Zephyr installation")
+    parser.add_argument("--parse-cache",
+                        help="File to cache the parsed Kconfig tree in, "
+                             "to load it from instead of parsing the "
+                             "Kconfig files again when reconfiguring")
+    parser.add_argument("--sync-deps",
+                        help="Directory with a file for each symbol, touched "
+                             "when its value changes. See "
+                             "Kconfig.sync_deps().")
     parser.add_argument("kconfig_file",
                         help="Top-level Kconfig file")
     parser.add_argument("config_out",
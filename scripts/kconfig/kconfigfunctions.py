@@ -3,6 +3,8 @@
 #
 # SPDX-License-Identifier: Apache-2.0
 
+import atexit
+import collections
 import functools
 import inspect
 import operator
@@ -10,6 +12,7 @@ import os
 import pickle
 import re
 import sys
+import time
 from pathlib import Path
 
 ZEPHYR_BASE = str(Path(__file__).resolve().parents[2])
@@ -22,10 +25,16 @@ sys.path.insert(0, os.path.join(ZEPHYR_BASE, "scripts", "dts",
 doc_mode = os.environ.get('KCONFIG_DOC_MODE') == "1"
 
 if not doc_mode:
+    EDT_BIN = os.environ.get("EDT_BIN")
     EDT_PICKLE = os.environ.get("EDT_PICKLE")
 
-    # The "if" handles a missing dts.
-    if EDT_PICKLE is not None and os.path.isfile(EDT_PICKLE):
+    # The "if" handles a missing dts. The binary EDT is preferred, as it
+    # only decodes the nodes that are looked at.
+    if EDT_BIN is not None and os.path.isfile(EDT_BIN):
+        from devicetree import edtbin as edtlib
+
+        edt = edtlib.load(EDT_BIN)
+    elif EDT_PICKLE is not None and os.path.isfile(EDT_PICKLE):
         with open(EDT_PICKLE, 'rb') as f:
             edt = pickle.load(f)
             edtlib = inspect.getmodule(edt)
@@ -38,6 +47,42 @@ def _warn(kconf, msg):
     print("{}:{}: WARNING: {}".format(kconf.filename, kconf.linenr, msg))
 
 
+_DtIndex = collections.namedtuple("_DtIndex", "compats okay_compats labels")
+
+
+@functools.cache
+def _dt_index():
+    """
+    Returns the compatibles with nodes, the compatibles with enabled nodes
+    and the node labels in the devicetree, as sets built once.
+
+    Most compatibles the Kconfig files ask about are not in the devicetree.
+    The sets answer for those without a lookup in the EDT, which for the
+    binary EDT is a binary search through the file.
+    """
+    return _DtIndex(
+        frozenset(compat for compat, nodes in edt.compat2nodes.items() if nodes),
+        frozenset(compat for compat, nodes in edt.compat2okay.items() if nodes),
+        frozenset(edt.label2node),
+    )
+
+
+def _okay_nodes(compat):
+    # Returns the enabled nodes with compatible 'compat'
+
+    if compat not in _dt_index().okay_compats:
+        return []
+    return edt.compat2okay[compat]
+
+
+def _label_node(label):
+    # Returns the node with the node label 'label', or None
+
+    if label not in _dt_index().labels:
+        return None
+    return edt.label2node[label]
+
+
 def _dt_units_to_scale(unit):
     if not unit:
         return 0
@@ -156,7 +201,7 @@ def dt_nodelabel_exists(kconf, _, label):
     if doc_mode or edt is None:
         return "n"
 
-    node = edt.label2node.get(label)
+    node = _label_node(label)
 
     return "y" if node else "n"
 
@@ -171,7 +216,7 @@ def dt_nodelabel_enabled(kconf, _, label):
     if doc_mode or edt is None:
         return "n"
 
-    node = edt.label2node.get(label)
+    node = _label_node(label)
 
     return "y" if node and node.status == "okay" else "n"
 
@@ -530,7 +575,7 @@ def dt_nodelabel_reg(kconf, name, label, index=0, unit=None):
     if doc_mode or edt is None:
         node = None
     else:
-        node = edt.label2node.get(label)
+        node = _label_node(label)
 
     if name == "dt_nodelabel_reg_size_int":
         return str(_dt_node_reg_size(kconf, node.path, index, unit)) if node else "0"
@@ -590,7 +635,7 @@ def dt_nodelabel_bool_prop(kconf, _, label, prop):
     if doc_mode or edt is None:
         return "n"
 
-    return _dt_node_bool_prop_generic(edt.label2node.get, label, prop)
+    return _dt_node_bool_prop_generic(_label_node, label, prop)
 
 def dt_nodelabel_int_prop(kconf, _, label, prop):
     """
@@ -603,7 +648,7 @@ def dt_nodelabel_int_prop(kconf, _, label, prop):
         return "0"
 
     try:
-        node = edt.label2node.get(label)
+        node = _label_node(label)
     except edtlib.EDTError:
         return "0"
 
@@ -661,7 +706,7 @@ def dt_nodelabel_has_prop(kconf, _, label, prop):
     if doc_mode or edt is None:
         return "n"
 
-    return _dt_node_has_prop_generic(edt.label2node.get, label, prop)
+    return _dt_node_has_prop_generic(_label_node, label, prop)
 
 def dt_node_int_prop(kconf, name, path, prop, unit=None):
     """
@@ -811,7 +856,7 @@ def dt_has_compat(kconf, _, compat):
     if doc_mode or edt is None:
         return "n"
 
-    return "y" if compat in edt.compat2nodes else "n"
+    return "y" if compat in _dt_index().compats else "n"
 
 
 def dt_compat_enabled(kconf, _, compat):
@@ -822,7 +867,7 @@ def dt_compat_enabled(kconf, _, compat):
     if doc_mode or edt is None:
         return "n"
 
-    return "y" if compat in edt.compat2okay else "n"
+    return "y" if compat in _dt_index().okay_compats else "n"
 
 
 def dt_compat_enabled_num(kconf, _, compat):
@@ -833,7 +878,7 @@ def dt_compat_enabled_num(kconf, _, compat):
     if doc_mode or edt is None:
         return "0"
 
-    return str(len(edt.compat2okay[compat]))
+    return str(len(_okay_nodes(compat)))
 
 
 def dt_compat_on_bus(kconf, _, compat, bus):
@@ -844,10 +889,9 @@ def dt_compat_on_bus(kconf, _, compat, bus):
     if doc_mode or edt is None:
         return "n"
 
-    if compat in edt.compat2okay:
-        for node in edt.compat2okay[compat]:
-            if node.on_buses is not None and bus in node.on_buses:
-                return "y"
+    for node in _okay_nodes(compat):
+        if node.on_buses is not None and bus in node.on_buses:
+            return "y"
 
     return "n"
 
@@ -863,10 +907,11 @@ def dt_compat_all_has_prop(kconf, _, compat, prop, value=None):
     if doc_mode or edt is None:
         return "n"
 
-    if compat not in edt.compat2okay or len(edt.compat2okay[compat]) == 0:
+    nodes = _okay_nodes(compat)
+    if not nodes:
         return "n"
 
-    for node in edt.compat2okay[compat]:
+    for node in nodes:
         if prop not in node.props:
             return "n"
         if value is None:
@@ -890,10 +935,7 @@ def dt_compat_any_has_prop(kconf, _, compat, prop, value=None):
     if doc_mode or edt is None:
         return "n"
 
-    if compat not in edt.compat2okay:
-        return "n"
-
-    for node in edt.compat2okay[compat]:
+    for node in _okay_nodes(compat):
         if prop not in node.props:
             continue
         if value is None:
@@ -915,10 +957,9 @@ def dt_compat_any_not_has_prop(kconf, _, compat, prop):
     if doc_mode or edt is None:
         return "n"
 
-    if compat in edt.compat2okay:
-        for node in edt.compat2okay[compat]:
-            if prop not in node.props:
-                return "y"
+    for node in _okay_nodes(compat):
+        if prop not in node.props:
+            return "y"
 
     return "n"
 
@@ -931,7 +972,7 @@ def dt_nodelabel_has_compat(kconf, _, label, compat):
     if doc_mode or edt is None:
         return "n"
 
-    node = edt.label2node.get(label)
+    node = _label_node(label)
 
     if node and compat in node.compats:
         return "y"
@@ -967,10 +1008,9 @@ def dt_nodelabel_enabled_with_compat(kconf, _, label, compat):
     if doc_mode or edt is None:
         return "n"
 
-    if compat in edt.compat2okay:
-        for node in edt.compat2okay[compat]:
-            if label in node.labels:
-                return "y"
+    for node in _okay_nodes(compat):
+        if label in node.labels:
+            return "y"
 
     return "n"
 
@@ -1028,7 +1068,7 @@ def dt_nodelabel_array_prop_has_val(kconf, _, label, prop, val):
     if doc_mode or edt is None:
         return "n"
 
-    return _dt_node_array_prop_has_val_generic(edt.label2node.get, label, prop, val)
+    return _dt_node_array_prop_has_val_generic(_label_node, label, prop, val)
 
 def dt_nodelabel_path(kconf, _, label):
     """
@@ -1039,7 +1079,7 @@ def dt_nodelabel_path(kconf, _, label):
     if doc_mode or edt is None:
         return ""
 
-    node = edt.label2node.get(label)
+    node = _label_node(label)
 
     return node.path if node else ""
 
@@ -1280,3 +1320,72 @@ functions = {
         "dec": (inc_dec, 1, 255),
         "dec_hex": (inc_dec, 1, 255),
 }
+
+
+# Calls of the devicetree functions, printed at exit if KCONFIG_DT_STATS is
+# "1". Maps function names to [calls, evaluations, seconds spent evaluating].
+_dt_stats = None
+if os.environ.get("KCONFIG_DT_STATS") == "1":
+    _dt_stats = collections.defaultdict(lambda: [0, 0, 0.0])
+
+
+class _MemoizedDtFunction:
+    """
+    Wraps the devicetree function 'func' to return the result of an earlier
+    call with the same arguments. The results only depend on the devicetree,
+    which doesn't change while the Kconfig files are parsed.
+
+    Pickled as a reference to the entry 'name' in 'functions', like the plain
+    functions there, for the parse cache of kconfig.py.
+    """
+
+    def __init__(self, name, func):
+        self.name = name
+        self.func = func
+        self.cache = {}
+
+    def __call__(self, kconf, name, *args):
+        key = (name, args)
+        if _dt_stats is None:
+            if key not in self.cache:
+                self.cache[key] = self.func(kconf, name, *args)
+            return self.cache[key]
+
+        stats = _dt_stats[name]
+        stats[0] += 1
+        if key not in self.cache:
+            start = time.perf_counter()
+            self.cache[key] = self.func(kconf, name, *args)
+            stats[1] += 1
+            stats[2] += time.perf_counter() - start
+        return self.cache[key]
+
+    def __reduce__(self):
+        return _dt_function, (self.name,)
+
+
+def _dt_function(name):
+    # Returns the wrapped devicetree function 'name' when unpickling
+
+    return functions[name][0]
+
+
+def _print_dt_stats():
+    if not _dt_stats:
+        return
+
+    print(f"{'devicetree function':40} {'calls':>6} {'evaluated':>9} {'time':>10}")
+    for name, (calls, evaluations, seconds) in sorted(
+            _dt_stats.items(), key=lambda item: item[1][2], reverse=True):
+        print(f"{name:40} {calls:6} {evaluations:9} {seconds * 1000:7.2f} ms")
+    print(f"{'total':40} {sum(stats[0] for stats in _dt_stats.values()):6} "
+          f"{sum(stats[1] for stats in _dt_stats.values()):9} "
+          f"{sum(stats[2] for stats in _dt_stats.values()) * 1000:7.2f} ms")
+
+
+for _name, (_func, _min_args, _max_args) in functions.items():
+    if _name.startswith("dt_"):
+        functions[_name] = (_MemoizedDtFunction(_name, _func), _min_args, _max_args)
+
+if _dt_stats is not None:
+    atexit.register(_print_dt_stats)
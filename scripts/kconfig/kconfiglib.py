@@ -663,6 +663,14 @@ class Kconfig(object):
 
       The note from the 'kconfig_filenames' documentation applies here too.
 
+    source_patterns:
+      A list of (pattern, filenames) tuples for all 'source' statements
+      (including 'rsource', 'osource' and 'orsource') in the Kconfig files, in
+      the order they are parsed. 'pattern' is the glob pattern searched for,
+      including $srctree, and 'filenames' is the sorted list of files it
+      matched. Repeating the searches tells if files were added or removed in
+      a way that changes the configuration.
+
     n/m/y:
       The predefined constant symbols n/m/y. Also available in const_syms.
 
@@ -832,6 +840,7 @@ class Kconfig(object):
         "modules",
         "n",
         "named_choices",
+        "source_patterns",
         "srctree",
         "syms",
         "top_node",
@@ -1059,6 +1068,7 @@ class Kconfig(object):
         # Not used internally. Provided as a convenience.
         self.kconfig_filenames = [filename]
         self.env_vars = set()
+        self.source_patterns = []
 
         # Keeps track of the location in the parent Kconfig files. Kconfig
         # files usually source other Kconfig files. See _enter_file().
@@ -2980,7 +2990,9 @@ class Kconfig(object):
                 # - Sort the glob results to ensure a consistent ordering of
                 #   Kconfig symbols, which indirectly ensures a consistent
                 #   ordering in e.g. .config files
-                filenames = sorted(iglob(join(self._srctree_prefix, pattern)))
+                glob_pattern = join(self._srctree_prefix, pattern)
+                filenames = sorted(iglob(glob_pattern))
+                self.source_patterns.append((glob_pattern, filenames))
 
                 if not filenames and t0 in _OBL_SOURCE_TOKENS:
                     raise KconfigError(
@@ -13,7 +13,7 @@ import copy
 import json
 
 from .mipi_syst import gen_syst_xml_file
-from .utils import extract_one_string_in_section, find_string_in_mappings
+from .utils import StringMappingIndex, extract_one_string_in_section
 
 ARCHS = {
     "arc": {
@@ -74,6 +74,7 @@ class LogDatabase:
         new_db['kconfigs'] = {}
 
         self.database = new_db
+        self.string_index = None
 
     def get_version(self):
         """Get Database Version"""
@@ -153,6 +154,7 @@ class LogDatabase:
     def set_string_mappings(self, database):
         """Add string mappings to database"""
         self.database['string_mappings'] = database
+        self.string_index = None
 
     def has_string_mappings(self):
         """Return True if there are string mappings in database"""
@@ -170,7 +172,10 @@ class LogDatabase:
         Find string pointed by string_ptr in the string mapping
         list. Return None if not found.
         """
-        return find_string_in_mappings(self.database['string_mappings'], string_ptr)
+        if self.string_index is None:
+            self.string_index = StringMappingIndex(self.database['string_mappings'])
+
+        return self.string_index.find(string_ptr)
 
     def __find_string_in_sections(self, string_ptr):
         """
@@ -9,6 +9,7 @@ Abstract Class for Dictionary-based Logging Parsers
 """
 
 import abc
+import functools
 import re
 
 from colorama import Fore
@@ -32,6 +33,8 @@ def get_log_level_str_color(lvl):
     return LOG_LEVELS[lvl]
 
 
+# Messages use few distinct format strings
+@functools.lru_cache(maxsize=1024)
 def formalize_fmt_string(fmt_str):
     """Replace unsupported formatter"""
     new_str = fmt_str
@@ -63,7 +66,28 @@ class LogParser(abc.ABC):
 
         self.data_types = DataTypes(self.database)
 
+        # Start of a message which has not been received completely
+        self.pending = bytearray()
+
     @abc.abstractmethod
     def parse_log_data(self, logdata, debug=False):
         """Parse log data"""
         return None
+
+    def feed(self, logdata):
+        """
+        Parse the next part of a stream of log data and print the
+        messages completed by it. The data of an incomplete message
+        at the end is kept until the rest of it is fed.
+
+        Return the number of bytes waiting for the rest of a message.
+        """
+        if self.pending:
+            self.pending += logdata
+            logdata = self.pending
+
+        offset = self.parse_log_data(logdata)
+
+        # Only the incomplete message is copied
+        self.pending = bytearray(memoryview(logdata)[offset:])
+        return len(self.pending)
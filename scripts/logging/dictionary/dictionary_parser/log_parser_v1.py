@@ -361,7 +361,9 @@ class LogParserV1(LogParser):
         msg_type = struct.unpack_from(self.fmt_msg_type, logdata, offset)[0]
 
         if msg_type == MSG_TYPE_DROPPED:
-            if offset + struct.calcsize(self.fmt_dropped_cnt) > len(logdata):
+            if offset + struct.calcsize(self.fmt_msg_type) + struct.calcsize(
+                self.fmt_dropped_cnt
+            ) > len(logdata):
                 return False, offset
             offset += struct.calcsize(self.fmt_msg_type)
 
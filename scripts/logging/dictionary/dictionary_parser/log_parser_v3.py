@@ -76,6 +76,9 @@ class LogParserV3(LogParser):
             endian = ">"
             self.is_big_endian = True
 
+        # Decode plans of format strings, see compile_fmt_str()
+        self.fmt_plans = {}
+
         self.fmt_msg_type = endian + FMT_MSG_TYPE
         self.fmt_dropped_cnt = endian + FMT_DROPPED_CNT
 
@@ -105,17 +108,21 @@ class LogParserV3(LogParser):
 
         return ret
 
-    def process_one_fmt_str(self, fmt_str, arg_list, string_tbl):
-        """Parse the format string to extract arguments from
-        the binary arglist and return a tuple usable with
-        Python's string formatting"""
+    def compile_fmt_str(self, fmt_str):
+        """Parse the format string to find the arguments in
+        the binary arglist and return a struct.Struct to extract
+        all of them, and the positions and arglist offsets of
+        the string arguments"""
         idx = 0
         arg_offset = 0
         arg_data_type = None
         is_parsing = False
         do_extract = False
 
-        args = []
+        unpack_fmts = ['>' if self.is_big_endian else '<']
+        unpack_end = 0
+        num_args = 0
+        str_args = []
 
         # Translated from cbvprintf_package()
         for idx, fmt in enumerate(fmt_str):
@@ -190,18 +197,41 @@ class LogParserV3(LogParser):
                 if stack_align > 1:
                     arg_offset = int((arg_offset + (align - 1)) / align) * align
 
-                one_arg = struct.unpack_from(unpack_fmt, arg_list, arg_offset)[0]
+                # Skip the padding before the argument
+                unpack_fmts.append('x' * (arg_offset - unpack_end))
+                unpack_fmts.append(unpack_fmt[1:])
+                unpack_end = arg_offset + struct.calcsize(unpack_fmt)
 
                 if fmt == 's':
-                    one_arg = self.__get_string(one_arg, arg_offset, string_tbl)
+                    str_args.append((num_args, arg_offset))
+                num_args += 1
 
-                args.append(one_arg)
                 arg_offset += size
 
                 # Align the offset
                 if stack_align > 1:
                     arg_offset = int((arg_offset + align - 1) / align) * align
 
+        return struct.Struct(''.join(unpack_fmts)), str_args
+
+    def process_one_fmt_str(self, fmt_str, arg_list, string_tbl):
+        """Extract the arguments of the format string from
+        the binary arglist and return a tuple usable with
+        Python's string formatting"""
+        plan = self.fmt_plans.get(fmt_str)
+        if plan is None:
+            plan = self.compile_fmt_str(fmt_str)
+            self.fmt_plans[fmt_str] = plan
+
+        unpacker, str_args = plan
+        args = unpacker.unpack_from(arg_list)
+        if not str_args:
+            return args
+
+        args = list(args)
+        for idx, arg_offset in str_args:
+            args[idx] = self.__get_string(args[idx], arg_offset, string_tbl)
+
         return tuple(args)
 
     @staticmethod
@@ -373,7 +403,9 @@ class LogParserV3(LogParser):
         msg_type = struct.unpack_from(self.fmt_msg_type, logdata, offset)[0]
 
         if msg_type == MSG_TYPE_DROPPED:
-            if offset + struct.calcsize(self.fmt_dropped_cnt) > len(logdata):
+            if offset + struct.calcsize(self.fmt_msg_type) + struct.calcsize(
+                self.fmt_dropped_cnt
+            ) > len(logdata):
                 return False, offset
 
             offset += struct.calcsize(self.fmt_msg_type)
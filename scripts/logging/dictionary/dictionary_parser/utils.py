@@ -9,6 +9,7 @@ Utilities for Dictionary-based Logging Parser
 """
 
 import binascii
+from bisect import bisect_right
 
 
 def convert_hex_file_to_bin(hexfile):
@@ -34,13 +35,12 @@ def extract_one_string_in_section(section, str_ptr):
     if offset < 0 or offset >= max_offset:
         return None
 
-    ret_str = ""
+    end = data.find(b'\0', offset, max_offset)
+    if end < 0:
+        end = max_offset
 
-    while (offset < max_offset) and (data[offset] != 0):
-        ret_str += chr(data[offset])
-        offset += 1
-
-    return ret_str
+    # Each byte is one character, as with chr()
+    return data[offset:end].decode("iso-8859-1")
 
 
 def find_string_in_mappings(string_mappings, str_ptr):
@@ -65,3 +65,44 @@ def find_string_in_mappings(string_mappings, str_ptr):
             return whole_str[str_ptr - ptr :]
 
     return None
+
+
+class StringMappingIndex:
+    """
+    Index of a string mapping for finding strings by pointer,
+    including pointers into the middle of strings.
+    """
+
+    def __init__(self, string_mappings):
+        self.string_mappings = string_mappings
+
+        entries = sorted(string_mappings.items())
+        self.ptrs = [ptr for ptr, _ in entries]
+
+        # For each entry, the one up to it in address order which
+        # extends furthest, as strings may overlap
+        self.furthest = []
+        last = None
+        for ptr, string in entries:
+            if last is None or ptr + len(string) > last[0] + len(last[1]):
+                last = (ptr, string)
+            self.furthest.append(last)
+
+    def find(self, str_ptr):
+        """
+        Find string pointed by string_ptr. Return None if not found.
+        """
+        if str_ptr in self.string_mappings:
+            return self.string_mappings[str_ptr]
+
+        # No direct match on pointer value.
+        # This may be a combined string. So check for that.
+        idx = bisect_right(self.ptrs, str_ptr) - 1
+        if idx < 0:
+            return None
+
+        ptr, whole_str = self.furthest[idx]
+        if str_ptr < ptr + len(whole_str):
+            return whole_str[str_ptr - ptr :]
+
+        return None
@@ -207,8 +207,6 @@ def main():
 
     log_parser = parserlib.get_log_parser(args.dbfile, logger)
 
-    data = b''
-
     if args.mode == "serial":
         reader = SerialReader(args.port, args.baudrate)
     elif args.mode == "file":
@@ -226,9 +224,7 @@ def main():
                 _, _, _ = select.select([reader], [], [])
             else:
                 time.sleep(args.polling_interval)
-            data += reader.read_non_blocking()
-            parsed_data_offset = parserlib.parser(data, log_parser, logger)
-            data = data[parsed_data_offset:]
+            log_parser.feed(reader.read_non_blocking())
 
 
 if __name__ == "__main__":
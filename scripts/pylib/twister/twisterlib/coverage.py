@@ -8,13 +8,16 @@ import contextlib
 import filecmp
 import glob
 import logging
+import multiprocessing
 import os
 import pathlib
 import re
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 
 logger = logging.getLogger('twister')
 
@@ -23,13 +26,135 @@ supported_coverage_formats = {
     "lcov":  ["html", "lcov"]
 }
 
+# Values from subsys/testsuite/coverage/coverage.h
+GCOV_TAG_FUNCTION = 0x01000000
+GCOV_TAG_COUNTER_ARCS = 0x01a10000
+# The GCC 12 format has a checksum in the header and the record lengths
+# in bytes instead of 32-bit words
+GCOV_12_TAG_FUNCTION_LENGTH = 12
+
+
+class GcdaFormatError(Exception):
+    """ Raised for coverage dumps which merge_gcda() can't merge
+    """
+
+
+def gcda_counter_ranges(data):
+    """
+    Return the byte order of a .gcda file written by gcov_populate_buffer()
+    and the (start, end) offsets of its arc counter values. Raise
+    GcdaFormatError for files with any other content.
+    """
+    if data[:4] == b"adcg":
+        order = "<"
+    elif data[:4] == b"gcda":
+        order = ">"
+    else:
+        raise GcdaFormatError("bad magic")
+
+    record = struct.Struct(order + "II")
+    if len(data) == 16 or (
+        len(data) >= 24
+        and record.unpack_from(data, 16) == (GCOV_TAG_FUNCTION, GCOV_12_TAG_FUNCTION_LENGTH)
+    ):
+        pos, unit = 16, 1
+    else:
+        pos, unit = 12, 4
+
+    ranges = []
+    while pos < len(data):
+        if pos + record.size > len(data):
+            raise GcdaFormatError("truncated record header")
+        tag, length = record.unpack_from(data, pos)
+        start = pos + record.size
+        pos = start + length * unit
+        if pos > len(data):
+            raise GcdaFormatError(f"truncated record {tag:#010x}")
+        if tag == GCOV_TAG_COUNTER_ARCS:
+            if (pos - start) % 8:
+                raise GcdaFormatError("bad arc counter record length")
+            ranges.append((start, pos))
+        elif tag != GCOV_TAG_FUNCTION:
+            raise GcdaFormatError(f"unsupported record {tag:#010x}")
+    return order, ranges
+
+
+def merge_gcda(dumps):
+    """
+    Merge .gcda files of the same object file by adding up their arc
+    counters, which is what "gcov-tool merge" does with them. All files
+    have to be identical apart from the counter values.
+    """
+    order, ranges = gcda_counter_ranges(dumps[0])
+    merged = bytearray(dumps[0])
+    if any(len(dump) != len(merged) for dump in dumps[1:]):
+        raise GcdaFormatError("dumps differ in size")
+
+    prev_end = 0
+    for start, end in [*ranges, (len(merged), len(merged))]:
+        layout = merged[prev_end:start]
+        if any(dump[prev_end:start] != layout for dump in dumps[1:]):
+            raise GcdaFormatError("dumps differ in layout")
+        prev_end = end
+
+    for start, end in ranges:
+        counters = struct.Struct(f"{order}{(end - start) // 8}Q")
+        # gcov_type is 64 bits wide and wraps around
+        values = [
+            sum(vals) & 0xFFFFFFFFFFFFFFFF
+            for vals in zip(*(counters.unpack_from(dump, start) for dump in dumps), strict=True)
+        ]
+        counters.pack_into(merged, start, *values)
+    return bytes(merged)
+
+
+def gcov_tool_merge(gcov_tool, dumps):
+    """
+    Merge .gcda files by calling gcov-tool for each pair of them.
+    """
+    with tempfile.TemporaryDirectory() as dir:
+        # Write each hexdump to a dedicated temporary folder
+        dirs = []
+        for idx, dump in enumerate(dumps):
+            subdir = dir + f'/{idx}'
+            os.mkdir(subdir)
+            dirs.append(subdir)
+            with open(f'{subdir}/tmp.gcda', 'wb') as fp:
+                fp.write(dump)
+
+        # Iteratively call gcov-tool (not gcov) to merge the files
+        merge_tool = gcov_tool + '-tool'
+        for d1, d2 in zip(dirs[:-1], dirs[1:], strict=False):
+            cmd = [merge_tool, 'merge', d1, d2, '--output', d2]
+            subprocess.call(cmd)
+
+        # Read back the final output file
+        with open(f'{dirs[-1]}/tmp.gcda', 'rb') as fp:
+            return fp.read(-1)
+
+
+def retrieve_merged_gcov_data(input_file):
+    """
+    Return the coverage data of a handler.log like
+    CoverageTool.retrieve_gcov_data(), with the hexdumps of every file
+    merged into one where merge_gcda() can do that. The others are left
+    for gcov-tool.
+    """
+    gcov_data = CoverageTool.retrieve_gcov_data(input_file)
+    for hexdumps in gcov_data['data'].values():
+        if len(hexdumps) > 1:
+            with contextlib.suppress(GcdaFormatError):
+                hexdumps[:] = [merge_gcda(hexdumps)]
+    return gcov_data
+
 
 class CoverageTool:
     """ Base class for every supported coverage tool
     """
 
-    def __init__(self):
+    def __init__(self, jobs=None):
         self.gcov_tool = None
+        self.jobs = jobs
         self.base_dir = None
         self.output_formats = None
         self.coverage_capture = True
@@ -42,7 +167,7 @@ class CoverageTool:
         if tool == 'lcov':
             t =  Lcov(jobs)
         elif tool == 'gcovr':
-            t =  Gcovr()
+            t =  Gcovr(jobs)
         else:
             logger.error(f"Unsupported coverage tool specified: {tool}")
             return None
@@ -57,12 +182,12 @@ class CoverageTool:
         capture_data = False
         capture_complete = False
         with open(input_file) as fp:
-            for line in fp.readlines():
-                if re.search("GCOV_COVERAGE_DUMP_START", line):
+            for line in fp:
+                if "GCOV_COVERAGE_DUMP_START" in line:
                     capture_data = True
                     capture_complete = False
                     continue
-                if re.search("GCOV_COVERAGE_DUMP_END", line):
+                if "GCOV_COVERAGE_DUMP_END" in line:
                     capture_complete = True
                     # Keep searching for additional dumps
                 # Loop until the coverage data is found.
@@ -93,25 +218,11 @@ class CoverageTool:
         if len(hexdumps) == 1:
             return hexdumps[0]
 
-        with tempfile.TemporaryDirectory() as dir:
-            # Write each hexdump to a dedicated temporary folder
-            dirs = []
-            for idx, dump in enumerate(hexdumps):
-                subdir = dir + f'/{idx}'
-                os.mkdir(subdir)
-                dirs.append(subdir)
-                with open(f'{subdir}/tmp.gcda', 'wb') as fp:
-                    fp.write(dump)
-
-            # Iteratively call gcov-tool (not gcov) to merge the files
-            merge_tool = self.gcov_tool + '-tool'
-            for d1, d2 in zip(dirs[:-1], dirs[1:], strict=False):
-                cmd = [merge_tool, 'merge', d1, d2, '--output', d2]
-                subprocess.call(cmd)
-
-            # Read back the final output file
-            with open(f'{dirs[-1]}/tmp.gcda', 'rb') as fp:
-                return fp.read(-1)
+        try:
+            return merge_gcda(hexdumps)
+        except GcdaFormatError as e:
+            logger.debug(f"Merging coverage dumps with gcov-tool: {e}")
+            return gcov_tool_merge(self.gcov_tool, hexdumps)
 
     def create_gcda_files(self, extracted_coverage_info):
         gcda_created = True
@@ -134,10 +245,31 @@ class CoverageTool:
                 gcda_created = False
         return gcda_created
 
+    def retrieve_all_gcov_data(self, handler_logs):
+        """
+        Yield the handler logs with their coverage data, with the hexdumps
+        of every file already merged. The logs are processed in a pool of
+        "jobs" processes.
+        """
+        jobs = os.cpu_count() if self.jobs is None else self.jobs
+        if jobs <= 1 or len(handler_logs) <= 1:
+            for filename in handler_logs:
+                yield filename, retrieve_merged_gcov_data(filename)
+            return
+
+        jobs = min(jobs, len(handler_logs))
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            mp_context=multiprocessing.get_context(),
+        ) as executor:
+            yield from zip(
+                handler_logs, executor.map(retrieve_merged_gcov_data, handler_logs), strict=True
+            )
+
     def capture_data(self, outdir):
         coverage_completed = True
-        for filename in glob.glob(f"{outdir}/**/handler.log", recursive=True):
-            gcov_data = self.__class__.retrieve_gcov_data(filename)
+        handler_logs = glob.glob(f"{outdir}/**/handler.log", recursive=True)
+        for filename, gcov_data in self.retrieve_all_gcov_data(handler_logs):
             capture_complete = gcov_data['complete']
             extracted_coverage_info = gcov_data['data']
             if capture_complete:
@@ -197,12 +329,11 @@ class CoverageTool:
 class Lcov(CoverageTool):
 
     def __init__(self, jobs=None):
-        super().__init__()
+        super().__init__(jobs)
         self.ignores = []
         self.ignore_branch_patterns = []
         self.output_formats = "lcov,html"
         self.version = self.get_version()
-        self.jobs = jobs
 
     def get_version(self):
         try:
@@ -353,8 +484,8 @@ class Lcov(CoverageTool):
 
 class Gcovr(CoverageTool):
 
-    def __init__(self):
-        super().__init__()
+    def __init__(self, jobs=None):
+        super().__init__(jobs)
         self.ignores = []
         self.ignore_branch_patterns = []
         self.output_formats = "html"
@@ -659,6 +659,28 @@ structure in the main Zephyr tree: boards/<vendor>/<board_name>/""")
         help="Re-use the outdir before building. Will result in "
              "faster compilation since builds will be incremental.")
 
+    parser.add_argument(
+        "--filter-cache",
+        metavar="DIR",
+        help="Cache the verdicts of filters which need a CMake run in DIR and reuse them "
+             "in later runs with the same board files, test configuration, arguments "
+             "and state of the Zephyr tree, including its local changes. Changes "
+             "outside of the Zephyr tree, e.g. in modules, are not detected, clean "
+             "DIR after making such changes.")
+
+    parser.add_argument(
+        "--binding-cache",
+        metavar="DIR",
+        help="Cache the parsed devicetree bindings in DIR, shared by all builds. Entries "
+             "are invalidated when a binding file or a file it includes changes.")
+
+    parser.add_argument(
+        "--scan-cache",
+        metavar="FILE",
+        help="Cache the test cases found in the sources of ztest based test suites in FILE. "
+             "Later runs only scan source files whose modification time, size or inode "
+             "changed.")
+
     parser.add_argument(
         "--aggressive-no-clean", action="store_true",
         help="Re-use the outdir before building and do not re-run cmake. Will result in "
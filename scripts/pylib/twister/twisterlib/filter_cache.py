@@ -0,0 +1,224 @@
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Persistent cache of the verdicts of twister's CMake based runtime filters.
+
+Evaluating a ``filter:`` expression which refers to devicetree or Kconfig
+data requires a (partial) CMake configuration of the test instance. The
+verdict only depends on the inputs of that configuration, so it is stored
+in a content-addressed cache: the key is a SHA-256 digest over the filter
+expression, the platform, the arguments and the contents of the board and
+test directories, and later runs with the same inputs skip CMake entirely.
+
+Other files are covered through the state of the Zephyr tree: its revision
+plus a digest of its local changes. Changes in other repositories, e.g. in
+Zephyr modules, are not detected, so the cache directory has to be cleaned
+if such files are modified.
+"""
+
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import subprocess
+import tempfile
+from multiprocessing import Value
+
+logger = logging.getLogger('twister')
+
+# Bumped whenever the layout of the key or of the entries changes
+CACHE_VERSION = 1
+
+# Files which can affect the devicetree or Kconfig of a build
+CONFIG_SUFFIXES = (
+    '.conf',
+    '.overlay',
+    '.dts',
+    '.dtsi',
+    '.yaml',
+    '.yml',
+    '.cmake',
+    '.txt',
+    '_defconfig',
+)
+
+_identifier_re = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+def is_config_file(name: str) -> bool:
+    return name.startswith('Kconfig') or name.endswith(CONFIG_SUFFIXES)
+
+
+def hash_file(path, digest=None):
+    if digest is None:
+        digest = hashlib.sha256()
+    with open(path, 'rb') as fp:
+        for chunk in iter(lambda: fp.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest
+
+
+def zephyr_tree_id(zephyr_base, version) -> str | None:
+    """Return an identifier of the state of the Zephyr tree.
+
+    The revision is combined with a digest of the uncommitted changes and of
+    the untracked configuration files. Returns None if the state can't be
+    determined, e.g. outside of a git checkout.
+    """
+    if not version or version == 'Unknown':
+        return None
+
+    digest = hashlib.sha256()
+    outputs = []
+    for args in (
+        ['status', '--porcelain', '-z', '--untracked-files=all'],
+        ['diff', '--binary', 'HEAD'],
+    ):
+        try:
+            proc = subprocess.run(
+                ['git', *args], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, cwd=zephyr_base
+            )
+        except OSError:
+            return None
+        if proc.returncode != 0:
+            return None
+        digest.update(proc.stdout)
+        outputs.append(proc.stdout)
+
+    # git diff doesn't cover untracked files, and the status only has
+    # their names
+    for entry in outputs[0].decode(errors='surrogateescape').split('\0'):
+        if not entry.startswith('?? '):
+            continue
+        path = entry[3:]
+        if is_config_file(os.path.basename(path)):
+            digest.update(path.encode(errors='surrogateescape'))
+            with contextlib.suppress(OSError):
+                hash_file(os.path.join(zephyr_base, path), digest)
+
+    return f'{version}-{digest.hexdigest()[:16]}'
+
+
+class FilterCache:
+    """On-disk cache of filter verdicts, shared by all twister workers.
+
+    Must be created before the worker processes are started, so that the
+    hit and miss counters are shared.
+    """
+
+    def __init__(self, cache_dir, tree_id):
+        self.cache_dir = cache_dir
+        self.tree_id = tree_id
+        self._hits = Value('l', 0)
+        self._misses = Value('l', 0)
+        # Digests of board and test directories, per process
+        self._dir_digests = {}
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    @property
+    def hits(self) -> int:
+        return self._hits.value
+
+    @property
+    def misses(self) -> int:
+        return self._misses.value
+
+    def _dir_digest(self, path):
+        if path not in self._dir_digests:
+            digest = hashlib.sha256()
+            for root, dirs, files in os.walk(path):
+                dirs.sort()
+                for name in sorted(files):
+                    if not is_config_file(name):
+                        continue
+                    file_path = os.path.join(root, name)
+                    digest.update(os.path.relpath(file_path, path).encode())
+                    hash_file(file_path, digest)
+            self._dir_digests[path] = digest.hexdigest()
+        return self._dir_digests[path]
+
+    def _file_digest(self, path):
+        if not os.path.isfile(path):
+            return None
+        return hash_file(path).hexdigest()
+
+    def key(self, instance, extra_args, filter_stages) -> str:
+        """Return the cache key of a filter evaluation for an instance."""
+        testsuite = instance.testsuite
+        platform = instance.platform
+        source_dir = testsuite.source_dir
+
+        extra_files = (
+            testsuite.extra_conf_files
+            + testsuite.extra_overlay_confs
+            + testsuite.extra_dtc_overlay_files
+        )
+        handler = instance.handler
+        inputs = {
+            'version': CACHE_VERSION,
+            'tree': self.tree_id,
+            'filter': testsuite.filter,
+            'stages': sorted(filter_stages),
+            'platform': platform.name,
+            'arch': platform.arch,
+            'toolchain': instance.toolchain,
+            'sysbuild': instance.sysbuild,
+            'extra_args': testsuite.extra_args,
+            'cmake_extra_args': extra_args,
+            'conf_files': testsuite.conf_files,
+            'extra_files': {f: self._file_digest(os.path.join(source_dir, f)) for f in extra_files},
+            'snippets': testsuite.required_snippets,
+            'handler_args': handler.args if handler and handler.ready else [],
+            'board_dirs': {d: self._dir_digest(d) for d in platform.board_dirs},
+            'source_dir': self._dir_digest(source_dir),
+            'build_overlay': self._file_digest(
+                os.path.join(instance.build_dir, 'twister', 'testsuite_extra.conf')
+            ),
+            # the filter data includes the environment, but only the
+            # variables named in the expression can make a difference
+            'env': {
+                name: os.environ.get(name)
+                for name in sorted(set(_identifier_re.findall(testsuite.filter or '')))
+                if name in os.environ
+            },
+        }
+        encoded = json.dumps(inputs, sort_keys=True, default=str).encode()
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f'{key}.json')
+
+    def get(self, key) -> bool | None:
+        """Return the cached verdict, True if the instance is filtered out."""
+        try:
+            with open(self._path(key)) as fp:
+                entry = json.load(fp)
+            filtered = bool(entry['filtered'])
+        except (OSError, ValueError, KeyError):
+            with self._misses.get_lock():
+                self._misses.value += 1
+            return None
+
+        with self._hits.get_lock():
+            self._hits.value += 1
+        return filtered
+
+    def put(self, key, filtered: bool, name=''):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first, other workers may read the entry
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump({'filtered': filtered, 'instance': name}, fp)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Failed to write filter cache entry {path}: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def summary(self) -> str:
+        total = self.hits + self.misses
+        rate = f" ({self.hits / total:.0%} hit rate)" if total else ""
+        return f"Filter cache: {self.hits} hits, {self.misses} misses{rate}"
@@ -8,6 +8,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import argparse
+import codecs
 import contextlib
 import csv
 import logging
@@ -15,6 +16,7 @@ import math
 import os
 import re
 import select
+import selectors
 import shlex
 import signal
 import subprocess
@@ -54,6 +56,12 @@ except ImportError as capture_error:
 
 logger = logging.getLogger('twister')
 
+# Maximum number of bytes read from the QEMU console FIFO at once
+QEMU_FIFO_READ_SIZE = 64 * 1024
+
+# Maximum number of bytes read from the output pipe of a binary at once
+BINARY_OUTPUT_READ_SIZE = 64 * 1024
+
 
 def terminate_process(proc):
     """
@@ -240,7 +248,6 @@ class BinaryHandler(Handler):
 
         self.seed = None
         self.extra_test_args = None
-        self.line = b""
         self.binary: str | None = None
 
     def try_kill_process_by_pid(self):
@@ -252,30 +259,48 @@ class BinaryHandler(Handler):
             with contextlib.suppress(ProcessLookupError, psutil.NoSuchProcess):
                 os.kill(pid, signal.SIGKILL)
 
-    def _output_reader(self, proc):
-        self.line = proc.stdout.readline()
-
     def _output_handler(self, proc, harness):
         suffix = '\\r\\n'
 
-        with open(self.log, "w") as log_out_fp:
+        fd = proc.stdout.fileno()
+        with (
+            open(self.log, "w") as log_out_fp,
+            selectors.DefaultSelector() as sel
+        ):
+            sel.register(fd, selectors.EVENT_READ)
             timeout_extended = False
             timeout_time = time.time() + self.get_test_timeout()
-            while True:
+            # Incomplete last line of the output read so far
+            partial = b""
+            done = False
+            while not done:
                 this_timeout = timeout_time - time.time()
-                if this_timeout < 0:
+                if this_timeout < 0 or not sel.select(this_timeout):
                     break
-                reader_t = threading.Thread(target=self._output_reader, args=(proc,), daemon=True)
-                reader_t.start()
-                reader_t.join(this_timeout)
-                if not reader_t.is_alive() and self.line != b"":
-                    line_decoded = self.line.decode('utf-8', "replace")
+
+                # Read whatever output is available, and split it into the
+                # lines proc.stdout.readline() would return
+                chunk = os.read(fd, BINARY_OUTPUT_READ_SIZE)
+                if chunk:
+                    lines = (partial + chunk).split(b"\n")
+                    partial = lines.pop()
+                    newline = "\n"
+                else:
+                    # EOF, the last line may lack a newline
+                    done = True
+                    lines = [partial] if partial else []
+                    newline = ""
+
+                for i, line in enumerate(lines):
+                    if i and time.time() > timeout_time:
+                        done = True
+                        break
+                    line_decoded = line.decode('utf-8', "replace") + newline
                     stripped_line = line_decoded.rstrip()
                     if stripped_line.endswith(suffix):
                         stripped_line = stripped_line[:-len(suffix)].rstrip()
                     logger.debug(f"OUTPUT: {stripped_line}")
                     log_out_fp.write(strip_ansi_sequences(line_decoded))
-                    log_out_fp.flush()
                     harness.handle(stripped_line)
                     if (
                         harness.status != TwisterStatus.NONE
@@ -287,9 +312,7 @@ class BinaryHandler(Handler):
                             timeout_time = time.time() + 30
                         else:
                             timeout_time = time.time() + 2
-                else:
-                    reader_t.join(0)
-                    break
+                log_out_fp.flush()
             try:
                 # POSIX arch based ztests end on their own,
                 # so let's give it up to 100ms to do so
@@ -1018,7 +1041,11 @@ class QEMUHandler(Handler):
             _status = TwisterStatus.NONE
             _reason = None
 
-            line = ""
+            # Output is read in chunks, decoded incrementally so that multi-byte
+            # characters may straddle chunks, and split into lines. 'partial'
+            # holds the incomplete last line of the output read so far.
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            partial = ""
             timeout_extended = False
 
             pid = 0
@@ -1058,50 +1085,55 @@ class QEMUHandler(Handler):
                         pid = int(pid_file.read())
 
                 try:
-                    c = in_fp.read(1).decode("utf-8")
+                    data = in_fp.read(QEMU_FIFO_READ_SIZE)
+                    text = decoder.decode(data)
                 except UnicodeDecodeError:
                     # Test is writing something weird, fail
                     _status = TwisterStatus.FAIL
                     _reason = "unexpected byte"
                     break
 
-                if c == "":
+                if not data:
                     # EOF, this shouldn't happen unless QEMU crashes
                     if not ignore_unexpected_eof:
                         _status = TwisterStatus.FAIL
                         _reason = "unexpected eof"
                     break
-                line = line + c
-                if c != "\n":
+
+                lines = (partial + text).split("\n")
+                partial = lines.pop()
+                if not lines:
                     continue
 
-                # line contains a full line of data output from QEMU
-                log_out_fp.write(strip_ansi_sequences(line))
+                # lines contains full lines of data output from QEMU, which are
+                # logged with a single write
+                log_out_fp.write(strip_ansi_sequences("\n".join(lines) + "\n"))
                 log_out_fp.flush()
-                line = line.rstrip()
-                logger.debug(f"QEMU ({pid}): {line}")
-
-                harness.handle(line)
-                if harness.status != TwisterStatus.NONE:
-                    # if we have registered a fail make sure the status is not
-                    # overridden by a false success message coming from the
-                    # testsuite
-                    if _status != TwisterStatus.FAIL:
-                        _status = harness.status
-                        _reason = harness.reason
-
-                    # if we get some status, that means test is doing well, we reset
-                    # the timeout and wait for 2 more seconds to catch anything
-                    # printed late. We wait much longer if code
-                    # coverage is enabled since dumping this information can
-                    # take some time.
-                    if not timeout_extended or harness.capture_coverage:
-                        timeout_extended = True
-                        if harness.capture_coverage:
-                            timeout_time = time.time() + 30
-                        else:
-                            timeout_time = time.time() + 2
-                line = ""
+
+                for line in lines:
+                    line = line.rstrip()
+                    logger.debug(f"QEMU ({pid}): {line}")
+
+                    harness.handle(line)
+                    if harness.status != TwisterStatus.NONE:
+                        # if we have registered a fail make sure the status is not
+                        # overridden by a false success message coming from the
+                        # testsuite
+                        if _status != TwisterStatus.FAIL:
+                            _status = harness.status
+                            _reason = harness.reason
+
+                        # if we get some status, that means test is doing well, we reset
+                        # the timeout and wait for 2 more seconds to catch anything
+                        # printed late. We wait much longer if code
+                        # coverage is enabled since dumping this information can
+                        # take some time.
+                        if not timeout_extended or harness.capture_coverage:
+                            timeout_extended = True
+                            if harness.capture_coverage:
+                                timeout_time = time.time() + 30
+                            else:
+                                timeout_time = time.time() + 2
 
             handler.execution_time = time.time() - start_time
             logger.debug(
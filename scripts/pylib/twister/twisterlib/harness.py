@@ -34,6 +34,23 @@ logger = logging.getLogger('twister')
 _WINDOWS = platform.system() == 'Windows'
 
 
+def dispatch_pattern(patterns):
+    """Combine (name, pattern, search) tuples into a single pattern
+
+    The combined pattern matches a line if one of the patterns does, the
+    first one taking precedence, and the name of that one is the lastgroup
+    of the match. Patterns with search set may match anywhere in the line,
+    the others only at its start, as with re.search() and re.match().
+    """
+    alternatives = []
+    for name, pattern, search in patterns:
+        # Group names have to be unique in the combined pattern
+        body = re.sub(r"\(\?P<\w+>", "(", pattern.pattern)
+        prefix = "(?s:.*?)" if search else ""
+        alternatives.append(f"(?P<{name}>{prefix}{body})")
+    return re.compile("|".join(alternatives))
+
+
 class Harness:
     GCOV_START = "GCOV_COVERAGE_DUMP_START"
     GCOV_END = "GCOV_COVERAGE_DUMP_END"
@@ -156,7 +173,7 @@ class Harness:
 
         self.parse_record(line)
 
-        runid_match = re.search(self.run_id_pattern, line)
+        runid_match = "RunID: " in line and re.search(self.run_id_pattern, line)
         if runid_match:
             run_id = runid_match.group("run_id")
             self.run_id_exists = True
@@ -843,6 +860,21 @@ class Test(Harness):
     )
 
 
+    ztest_dispatch_pattern = dispatch_pattern([
+        ("suite_start", test_suite_start_pattern, True),
+        ("suite_end", test_suite_end_pattern, True),
+        ("case_start", test_case_start_pattern, True),
+        ("case_end", test_case_end_pattern, False),
+        ("suite_summary", test_suite_summary_pattern, False),
+        ("case_summary", test_case_summary_pattern, False),
+    ])
+
+    @staticmethod
+    def may_be_ztest_line(line):
+        # Every line matched by one of the patterns above contains one of these
+        # strings, most console lines contain none of them
+        return "TESTSUITE" in line or "START - " in line or "seconds" in line
+
     def get_testcase(self, tc_name, phase, ts_name=None):
         """ Search a Ztest case among detected in the test image binary
             expecting the same test names as already known from the ELF.
@@ -938,16 +970,40 @@ class Test(Harness):
             logger.warning(f"{phase}: END case '{tc_name}' without START detected")
 
     def handle(self, line):
-        testcase_match = None
         if self._match:
             self.testcase_output += line + "\n"
-        if test_suite_start_match := re.search(self.test_suite_start_pattern, line):
+
+        if self.may_be_ztest_line(line):
+            self.handle_ztest_line(line)
+
+        self.process_test(line)
+
+        if not self.ztest and self.status != TwisterStatus.NONE:
+            logger.debug(f"{self.id} is not a Ztest, status:{self.status}")
+            tc = self.instance.get_case_or_create(self.id)
+            if self.status == TwisterStatus.PASS:
+                tc.status = TwisterStatus.PASS
+            else:
+                tc.status = TwisterStatus.FAIL
+                tc.reason = "Test failure"
+
+    def handle_ztest_line(self, line):
+        dispatch_match = self.ztest_dispatch_pattern.match(line)
+        if not dispatch_match:
+            return
+
+        # Only the pattern which matched is run again, for its groups
+        kind = dispatch_match.lastgroup
+        if kind == "suite_start":
+            test_suite_start_match = self.test_suite_start_pattern.search(line)
             self.start_suite(test_suite_start_match.group("suite_name"))
-        elif test_suite_end_match := re.search(self.test_suite_end_pattern, line):
+        elif kind == "suite_end":
+            test_suite_end_match = self.test_suite_end_pattern.search(line)
             suite_name=test_suite_end_match.group("suite_name")
             self.end_suite(suite_name)
             self.ztest = True
-        elif testcase_match := re.search(self.test_case_start_pattern, line):
+        elif kind == "case_start":
+            testcase_match = self.test_case_start_pattern.search(line)
             tc_name = testcase_match.group(2)
             tc = self.get_testcase(tc_name, 'TC_START')
             self.start_case(tc.name)
@@ -961,7 +1017,8 @@ class Test(Harness):
         # some testcases are skipped based on predicates and do not show up
         # during test execution, however they are listed in the summary. Parse
         # the summary for status and use that status instead.
-        elif result_match := self.test_case_end_pattern.match(line):
+        elif kind == "case_end":
+            result_match = self.test_case_end_pattern.match(line)
             matched_status = result_match.group(1)
             tc_name = result_match.group(3)
             tc = self.get_testcase(tc_name, 'TC_END')
@@ -975,13 +1032,15 @@ class Test(Harness):
             self.testcase_output = ""
             self._match = False
             self.ztest = True
-        elif test_suite_summary_match := self.test_suite_summary_pattern.match(line):
+        elif kind == "suite_summary":
+            test_suite_summary_match = self.test_suite_summary_pattern.match(line)
             suite_name=test_suite_summary_match.group("suite_name")
             suite_status=test_suite_summary_match.group("suite_status")
             self._match = False
             self.ztest = True
             self.end_suite(suite_name, 'TS_SUM', suite_status=suite_status)
-        elif test_case_summary_match := self.test_case_summary_pattern.match(line):
+        elif kind == "case_summary":
+            test_case_summary_match = self.test_case_summary_pattern.match(line)
             matched_status = test_case_summary_match.group(1)
             suite_name = test_case_summary_match.group(2)
             tc_name = test_case_summary_match.group(4)
@@ -1002,17 +1061,6 @@ class Test(Harness):
             self._match = False
             self.ztest = True
 
-        self.process_test(line)
-
-        if not self.ztest and self.status != TwisterStatus.NONE:
-            logger.debug(f"{self.id} is not a Ztest, status:{self.status}")
-            tc = self.instance.get_case_or_create(self.id)
-            if self.status == TwisterStatus.PASS:
-                tc.status = TwisterStatus.PASS
-            else:
-                tc.status = TwisterStatus.FAIL
-                tc.reason = "Test failure"
-
 
 class Ztest(Test):
     pass
@@ -79,6 +79,7 @@ class Platform:
 
         self.arch = None
         self.vendor = ""
+        self.board_dirs = []
         self.tier = -1
         self.type = "na"
         self.simulators: list[Simulator] = []
@@ -137,6 +138,7 @@ class Platform:
 
         self.arch = variant_data.get('arch', data.get('arch', self.arch))
         self.vendor = board.vendor
+        self.board_dirs = [str(board_dir) for board_dir in board.directories]
         self.tier = variant_data.get("tier", data.get("tier", self.tier))
         self.type = variant_data.get('type', data.get('type', self.type))
 
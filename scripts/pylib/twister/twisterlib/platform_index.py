@@ -0,0 +1,129 @@
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Bitset index of platform attributes used by TestPlan.apply_filters().
+
+Every platform gets one bit. For each attribute the index maps every value
+to the set of platforms having it, stored as a Python int, so a filter like
+"arch not in arch_allow" becomes a couple of OR/AND operations per test
+suite instead of a comparison per test suite and platform.
+"""
+
+import time
+from collections import defaultdict
+
+
+class PlatformIndex:
+    """Bitsets over a fixed list of platforms."""
+
+    def __init__(self, platforms, sim_name=None):
+        self.platforms = list(platforms)
+        self.all = (1 << len(self.platforms)) - 1
+        self._bits = {}
+        self.by_name = defaultdict(int)
+        self.by_alias = defaultdict(int)
+        self.by_arch = defaultdict(int)
+        self.by_vendor = defaultdict(int)
+        self.by_type = defaultdict(int)
+        self.by_feature = defaultdict(int)
+        self.by_toolchain = defaultdict(int)
+        self.by_ignore_tag = defaultdict(int)
+        self.by_only_tag = defaultdict(int)
+        self.has_only_tags = 0
+        self.env_unsatisfied = 0
+        self.native = 0
+        self.host_arch = 0
+        self.renode = 0
+        self._ram = sorted((p.ram, 1 << i) for i, p in enumerate(self.platforms))
+        self._flash = sorted((p.flash, 1 << i) for i, p in enumerate(self.platforms))
+        self._below_cache = {}
+
+        for i, plat in enumerate(self.platforms):
+            bit = 1 << i
+            self._bits[id(plat)] = bit
+            self.by_name[plat.name] |= bit
+            for alias in plat.aliases:
+                self.by_alias[alias] |= bit
+            self.by_arch[plat.arch] |= bit
+            self.by_vendor[plat.vendor] |= bit
+            self.by_type[plat.type] |= bit
+            for feature in plat.supported:
+                self.by_feature[feature] |= bit
+            for toolchain in plat.supported_toolchains:
+                self.by_toolchain[toolchain] |= bit
+            for tag in plat.ignore_tags:
+                self.by_ignore_tag[tag] |= bit
+            for tag in plat.only_tags:
+                self.by_only_tag[tag] |= bit
+            if plat.only_tags:
+                self.has_only_tags |= bit
+            if not plat.env_satisfied:
+                self.env_unsatisfied |= bit
+            if plat.type == 'native':
+                self.native |= bit
+            if plat.arch in ['posix', 'unit']:
+                self.host_arch |= bit
+            sim = plat.simulator_by_name(sim_name)
+            if sim and sim.name == 'renode':
+                self.renode |= bit
+
+    def bit(self, platform) -> int:
+        return self._bits[id(platform)]
+
+    @staticmethod
+    def any_of(table, keys) -> int:
+        """Platforms having at least one of the keys."""
+        mask = 0
+        for key in keys:
+            mask |= table.get(key, 0)
+        return mask
+
+    def all_of(self, table, keys) -> int:
+        """Platforms having all of the keys."""
+        mask = self.all
+        for key in keys:
+            mask &= table.get(key, 0)
+        return mask
+
+    def none_of(self, table, keys) -> int:
+        """Platforms having none of the keys."""
+        return self.all & ~self.any_of(table, keys)
+
+    def _below(self, name, values, limit) -> int:
+        key = (name, limit)
+        if key not in self._below_cache:
+            mask = 0
+            for value, bit in values:
+                if value >= limit:
+                    break
+                mask |= bit
+            self._below_cache[key] = mask
+        return self._below_cache[key]
+
+    def ram_below(self, limit) -> int:
+        return self._below('ram', self._ram, limit)
+
+    def flash_below(self, limit) -> int:
+        return self._below('flash', self._flash, limit)
+
+
+class FilterStats:
+    """Time spent in and instances filtered by each filter of the test plan."""
+
+    def __init__(self):
+        self.seconds = defaultdict(float)
+        self.filtered = defaultdict(int)
+
+    def add_time(self, name, start):
+        """Account the time since ``start`` (a perf_counter value) to a filter."""
+        now = time.perf_counter()
+        self.seconds[name] += now - start
+        return now
+
+    def report(self):
+        names = sorted(
+            set(self.seconds) | set(self.filtered), key=lambda n: self.seconds[n], reverse=True
+        )
+        lines = [f"{'filter':<24} {'seconds':>9} {'filtered':>9}"]
+        for name in names:
+            lines.append(f"{name:<24} {self.seconds[name]:>9.3f} {self.filtered[name]:>9}")
+        return lines
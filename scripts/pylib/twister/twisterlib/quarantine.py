@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import re
+from collections import defaultdict
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -83,6 +84,7 @@ class QuarantineElement:
 @dataclass
 class QuarantineData:
     qlist: list[QuarantineElement] = field(default_factory=list)
+    _index: QuarantineIndex | None = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         qelements = []
@@ -110,6 +112,7 @@ class QuarantineData:
 
     def extend(self, qdata: QuarantineData) -> None:
         self.qlist.extend(qdata.qlist)
+        self._index = None
 
     def get_matched_quarantine(self,
                                scenario: str,
@@ -117,30 +120,95 @@ class QuarantineData:
                                architecture: str,
                                simulator_name: str) -> QuarantineElement | None:
         """Return quarantine element if test is matched to quarantine rules"""
-        for qelem in self.qlist:
-            matched: bool = False
-            if (qelem.scenarios
-                    and (matched := _is_element_matched(scenario, qelem.re_scenarios)) is False):
-                continue
-            if (qelem.platforms
-                    and (matched := _is_element_matched(platform, qelem.re_platforms)) is False):
-                continue
-            if (
-                qelem.architectures
-                and (matched := _is_element_matched(architecture, qelem.re_architectures)) is False
-            ):
-                continue
-            if (
-                qelem.simulations
-                and (matched := _is_element_matched(simulator_name, qelem.re_simulations)) is False
-            ):
-                continue
-
-            if matched:
-                return qelem
-        return None
-
-
-def _is_element_matched(element: str, list_of_elements: list[re.Pattern]) -> bool:
-    """Return True if given element is matching to any of elements from the list"""
-    return any(pattern.fullmatch(element) for pattern in list_of_elements)
+        if self._index is None or self._index.size != len(self.qlist):
+            self._index = QuarantineIndex(self.qlist)
+        return self._index.match(scenario, platform, architecture, simulator_name)
+
+
+class _FieldIndex:
+    """Elements matching a value of one field (scenario, platform...), as a bitmask."""
+
+    def __init__(self) -> None:
+        # elements without filter for this field match any value
+        self.wildcard: int = 0
+        self.exact: dict[str, int] = defaultdict(int)
+        self.patterns: list[tuple[re.Pattern, int]] = []
+        self.prefilter: re.Pattern | None = None
+        self._cache: dict[str, int] = {}
+
+    def add(self, bit: int, patterns: list[str], compiled: list[re.Pattern]) -> None:
+        if not patterns:
+            self.wildcard |= bit
+        for pat, re_pat in zip(patterns, compiled, strict=True):
+            if _REGEX_METACHARS.isdisjoint(pat):
+                self.exact[pat] |= bit
+            else:
+                self.patterns.append((re_pat, bit))
+
+    def compile(self) -> None:
+        # A single alternation rejects most values in one call, without
+        # trying the patterns one by one. Patterns with groups are left out
+        # of it, as joining them would renumber backreferences.
+        if not self.patterns or any(re_pat.groups for re_pat, _ in self.patterns):
+            return
+        try:
+            self.prefilter = re.compile(
+                '|'.join(f'(?:{re_pat.pattern})' for re_pat, _ in self.patterns)
+            )
+        except re.error:
+            self.prefilter = None
+
+    def lookup(self, value: str) -> int:
+        if value not in self._cache:
+            mask = self.wildcard | self.exact.get(value, 0)
+            if self.patterns and (self.prefilter is None or self.prefilter.fullmatch(value)):
+                for re_pat, bit in self.patterns:
+                    if re_pat.fullmatch(value):
+                        mask |= bit
+            self._cache[value] = mask
+        return self._cache[value]
+
+
+class QuarantineIndex:
+    """Quarantine elements compiled into per-field lookup tables.
+
+    Each element gets one bit (the first element the lowest one). Looking up
+    a test ANDs the masks of elements matching each of its fields, and the
+    lowest bit left is the first matching element, as with a linear scan of
+    the list. Lookups are memoized per field value, and the index holds only
+    plain data, so it can be pickled and reused.
+    """
+
+    def __init__(self, qlist: list[QuarantineElement]) -> None:
+        self.elements = list(qlist)
+        self.size = len(self.elements)
+        self.scenarios = _FieldIndex()
+        self.platforms = _FieldIndex()
+        self.architectures = _FieldIndex()
+        self.simulations = _FieldIndex()
+        for i, qelem in enumerate(self.elements):
+            bit = 1 << i
+            self.scenarios.add(bit, qelem.scenarios, qelem.re_scenarios)
+            self.platforms.add(bit, qelem.platforms, qelem.re_platforms)
+            self.architectures.add(bit, qelem.architectures, qelem.re_architectures)
+            self.simulations.add(bit, qelem.simulations, qelem.re_simulations)
+        for field_index in (self.scenarios, self.platforms, self.architectures, self.simulations):
+            field_index.compile()
+
+    def match(self,
+              scenario: str,
+              platform: str,
+              architecture: str,
+              simulator_name: str) -> QuarantineElement | None:
+        mask = (
+            self.scenarios.lookup(scenario)
+            & self.platforms.lookup(platform)
+            & self.architectures.lookup(architecture)
+            & self.simulations.lookup(simulator_name)
+        )
+        if not mask:
+            return None
+        return self.elements[(mask & -mask).bit_length() - 1]
+
+
+_REGEX_METACHARS = frozenset('.^$*+?{}[]\\|()')
@@ -342,6 +342,8 @@ class Reporting:
             used_rom  = instance.metrics.get("used_rom",0)
             available_ram = instance.metrics.get("available_ram", 0)
             available_rom = instance.metrics.get("available_rom", 0)
+            memory_regions = instance.metrics.get("memory_regions")
+            section_sizes = instance.metrics.get("section_sizes")
             suite = {
                 "name": instance.testsuite.name,
                 "arch": instance.platform.arch,
@@ -370,6 +372,10 @@ class Reporting:
                 suite["available_ram"] = available_ram
             if available_rom:
                 suite["available_rom"] = available_rom
+            if memory_regions:
+                suite["memory_regions"] = memory_regions
+            if section_sizes:
+                suite["section_sizes"] = section_sizes
             if instance.status in [TwisterStatus.ERROR, TwisterStatus.FAIL]:
                 suite['status'] = instance.status
                 # FIXME
@@ -511,6 +517,7 @@ class Reporting:
                 d = {}
                 for m, _, _ in interesting_metrics:
                     d[m] = ts.get(m, 0)
+                d.update(self._footprint_details(ts))
                 ts_name = ts.get('name')
                 ts_platform = ts.get('platform')
                 saved_metrics[(ts_name, ts_platform)] = d
@@ -530,8 +537,26 @@ class Reporting:
                     continue
                 results.append((instance, metric, instance.metrics.get(metric, 0), delta,
                                 lower_better))
+            for metric, value in self._footprint_details(instance.metrics).items():
+                if metric not in sm:
+                    continue
+                delta = value - sm[metric]
+                if delta == 0:
+                    continue
+                results.append((instance, metric, value, delta, True))
         return results
 
+    @staticmethod
+    def _footprint_details(metrics):
+        # The usage of each memory region and the size of each section, in
+        # the same form in twister.json as in the metrics of an instance
+        details = {}
+        for region, usage in metrics.get("memory_regions", {}).items():
+            details[f"{region} used"] = usage.get("used", 0)
+        for section, size in metrics.get("section_sizes", {}).items():
+            details[f"{section} size"] = size
+        return details
+
     def footprint_reports(self, report, show_footprint, all_deltas,
                           footprint_threshold, last_metrics):
         if not report:
@@ -19,7 +19,6 @@ import traceback
 from collections import deque
 from math import log10
 from multiprocessing import Lock, Process, Value
-from multiprocessing.managers import BaseManager
 
 import elftools
 import yaml
@@ -30,6 +29,7 @@ from packaging import version
 from twisterlib.cmakecache import CMakeCache
 from twisterlib.constants import canonical_zephyr_base
 from twisterlib.error import BuildError, ConfigurationError, StatusAttributeError
+from twisterlib.filter_cache import FilterCache, zephyr_tree_id
 from twisterlib.hardwaremap import DUT
 from twisterlib.log_helper import setup_logging
 from twisterlib.statuses import TwisterStatus
@@ -44,12 +44,15 @@ if sys.platform == 'linux':
 from twisterlib.constants import ZEPHYR_BASE
 
 sys.path.insert(0, os.path.join(ZEPHYR_BASE, "scripts/pylib/build_helpers"))
+sys.path.insert(0, os.path.join(ZEPHYR_BASE, "scripts/dts/python-devicetree/src"))
+from devicetree import edtbin
 from domains import Domains
 from twisterlib.coverage import run_coverage_instance
 from twisterlib.environment import TwisterEnv
 from twisterlib.harness import Ctest, HarnessImporter, Pytest
 from twisterlib.log_helper import log_command
 from twisterlib.platform import Platform
+from twisterlib.scheduler import DependencyGraph, ReadyTable, WorkStealingScheduler
 from twisterlib.testinstance import TestInstance
 from twisterlib.testplan import change_skip_to_error_if_integration
 from twisterlib.testsuite import TestSuite
@@ -647,6 +650,13 @@ class CMake:
             warnings_as_errors = 'n'
             gen_edt_args = ""
 
+        if self.options.binding_cache:
+            # EXTRA_GEN_EDT_ARGS is a CMake list
+            binding_cache = pathlib.Path(os.path.abspath(self.options.binding_cache)).as_posix()
+            gen_edt_args = ";".join(
+                filter(None, [gen_edt_args, "--binding-cache-dir", binding_cache])
+            )
+
         warning_command = 'CONFIG_COMPILER_WARNINGS_AS_ERRORS'
         if self.instance.sysbuild:
             warning_command = 'SB_' + warning_command
@@ -800,7 +810,9 @@ class FilterBuilder(CMake):
             # dt is compiled before kconfig,
             # so edt_pickle is available regardless of choice of filter stages
             edt_pickle = os.path.join(self.build_dir, "zephyr", "edt.pickle")
-
+        # The binary EDT is written next to the pickle, and only decodes the
+        # nodes the filter looks at
+        edt_bin = os.path.join(os.path.dirname(edt_pickle), "edt.bin")
 
         if not filter_stages or "kconfig" in filter_stages:
             with open(defconfig_path) as fp:
@@ -837,7 +849,9 @@ class FilterBuilder(CMake):
 
         if self.testsuite and self.testsuite.filter:
             try:
-                if os.path.exists(edt_pickle):
+                if os.path.exists(edt_bin):
+                    edt = edtbin.load(edt_bin)
+                elif os.path.exists(edt_pickle):
                     with open(edt_pickle, 'rb') as f:
                         edt = pickle.load(f)
                 else:
@@ -886,6 +900,7 @@ class ProjectBuilder(FilterBuilder):
         self.options = env.options
         self.env = env
         self.duts: list[DUT] = []
+        self.filter_cache: FilterCache | None = None
 
     @property
     def trace(self) -> bool:
@@ -961,7 +976,7 @@ class ProjectBuilder(FilterBuilder):
             logger.error(f"RuntimeError: {e}")
             traceback.print_exc()
 
-    def process(self, processing_queue: deque, processing_ready: dict[str, TestInstance],
+    def process(self, processing_queue: deque, processing_ready: ReadyTable,
                 message, lock, results: ExecutionCounter):
         next_op = None
         additionals = {}
@@ -974,12 +989,21 @@ class ProjectBuilder(FilterBuilder):
 
         if op == "filter":
             try:
-                ret = self.cmake(filter_stages=self.instance.filter_stages)
-                if self.instance.status in [TwisterStatus.FAIL, TwisterStatus.ERROR]:
+                filtered = self.get_cached_filter_verdict(self.instance.filter_stages)
+                if filtered is None:
+                    ret = self.cmake(filter_stages=self.instance.filter_stages)
+                    if self.instance.status not in [TwisterStatus.FAIL, TwisterStatus.ERROR]:
+                        # Here we check the dt/kconfig filter results coming from running cmake
+                        filtered = bool(
+                            self.instance.name in ret['filter']
+                            and ret['filter'][self.instance.name]
+                        )
+                        self.cache_filter_verdict(self.instance.filter_stages, filtered)
+
+                if filtered is None:
                     next_op = 'report'
                 else:
-                    # Here we check the dt/kconfig filter results coming from running cmake
-                    if self.instance.name in ret['filter'] and ret['filter'][self.instance.name]:
+                    if filtered:
                         logger.debug(f"filtering {self.instance.name}")
                         self.instance.status = TwisterStatus.FILTER
                         self.instance.reason = "runtime filter"
@@ -1001,7 +1025,14 @@ class ProjectBuilder(FilterBuilder):
         # The build process, call cmake and build with configured generator
         elif op == "cmake":
             try:
-                ret = self.cmake()
+                filtered = None
+                if not self.options.cmake_only:
+                    filtered = self.get_cached_filter_verdict()
+                if filtered:
+                    # no need to configure an instance which is filtered out anyway
+                    ret = {'filter': {self.instance.name: True}}
+                else:
+                    ret = self.cmake()
                 if self.instance.status in [TwisterStatus.FAIL, TwisterStatus.ERROR]:
                     next_op = 'report'
                 elif self.options.cmake_only:
@@ -1013,6 +1044,8 @@ class ProjectBuilder(FilterBuilder):
                 else:
                     # Here we check the runtime filter results coming from running cmake
                     if self.instance.name in ret['filter'] and ret['filter'][self.instance.name]:
+                        if filtered is None:
+                            self.cache_filter_verdict([], True)
                         logger.debug(f"filtering {self.instance.name}")
                         self.instance.status = TwisterStatus.FILTER
                         self.instance.reason = "runtime filter"
@@ -1020,6 +1053,8 @@ class ProjectBuilder(FilterBuilder):
                         self.instance.add_missing_case_status(TwisterStatus.FILTER)
                         next_op = 'report'
                     else:
+                        if filtered is None:
+                            self.cache_filter_verdict([], False)
                         next_op = 'build'
             except StatusAttributeError as sae:
                 logger.error(str(sae))
@@ -1700,6 +1735,25 @@ class ProjectBuilder(FilterBuilder):
 
         return args_expanded
 
+    def get_cached_filter_verdict(self, filter_stages=None) -> bool | None:
+        """Look up the runtime filter verdict of the instance in the filter cache.
+
+        Returns None if there is no filter cache, no filter, or no entry.
+        """
+        if not self.filter_cache or not self.testsuite.filter:
+            return None
+        key = self.filter_cache.key(self.instance, self.options.extra_args, filter_stages or [])
+        filtered = self.filter_cache.get(key)
+        if filtered is not None:
+            logger.debug(f"Filter cache hit for {self.instance.name}: filtered={filtered}")
+        return filtered
+
+    def cache_filter_verdict(self, filter_stages, filtered):
+        if not self.filter_cache or not self.testsuite.filter:
+            return
+        key = self.filter_cache.key(self.instance, self.options.extra_args, filter_stages or [])
+        self.filter_cache.put(key, bool(filtered), self.instance.name)
+
     def cmake(self, filter_stages=None):
         if filter_stages is None:
             filter_stages = []
@@ -1811,6 +1865,8 @@ class ProjectBuilder(FilterBuilder):
                 instance.metrics["used_rom"] = size_calc.get_used_rom()
                 instance.metrics["available_rom"] = size_calc.get_available_rom()
                 instance.metrics["available_ram"] = size_calc.get_available_ram()
+                instance.metrics["memory_regions"] = size_calc.get_memory_regions()
+                instance.metrics["section_sizes"] = size_calc.get_section_sizes()
             else:
                 instance.metrics["used_ram"] = 0
                 instance.metrics["used_rom"] = 0
@@ -1826,6 +1882,8 @@ class TwisterRunner:
         self.instances: dict[str, TestInstance] = instances
         self.suites: dict[str, TestSuite] = suites
         self.duts: list[DUT] = []
+        self.required_apps_graph = DependencyGraph()
+        self.filter_cache: FilterCache | None = None
         self.jobs = 1
         self.results = None
         self.jobserver = None
@@ -1834,15 +1892,16 @@ class TwisterRunner:
 
         retries = self.options.retry_failed + 1
 
-        BaseManager.register('deque', deque, exposed=['append', 'appendleft', 'pop'])
-        BaseManager.register('get_dict', dict)
-        manager = BaseManager()
-        manager.start()
-
         self.results = ExecutionCounter(total=len(self.instances))
         self.iteration = 0
-        processing_queue: deque = manager.deque()
-        processing_ready: dict[str, TestInstance] = manager.get_dict()
+        processing_ready: dict[str, TestInstance] = {}
+
+        if self.options.filter_cache:
+            tree_id = zephyr_tree_id(ZEPHYR_BASE, self.env.version)
+            if tree_id:
+                self.filter_cache = FilterCache(self.options.filter_cache, tree_id)
+            else:
+                logger.warning("Unable to identify the Zephyr tree, not using the filter cache")
 
         # Set number of jobs
         if self.options.jobs:
@@ -1881,7 +1940,7 @@ class TwisterRunner:
             else:
                 self.results.done = self.results.filtered_static + self.results.skipped
 
-            self.execute(processing_queue, processing_ready)
+            self.execute(processing_ready)
 
             for inst in processing_ready.values():
                 inst.metrics["handler_time"] = inst.execution_time
@@ -1897,6 +1956,9 @@ class TwisterRunner:
             if retries == 0 or ( self.results.failed == 0 and not retry_errors):
                 break
 
+        if self.filter_cache:
+            logger.info(self.filter_cache.summary())
+
         self.show_brief()
 
     def update_counting_before_pipeline(self):
@@ -1978,43 +2040,30 @@ class TwisterRunner:
                     else:
                         processing_queue.append({"op": "cmake", "test": instance})
 
-    def _are_required_apps_ready(
-            self, instance: TestInstance, processing_ready: dict[str, TestInstance]
-    ) -> bool:
-        """Verify that all required applications are ready to be used."""
-        for required_app in instance.required_applications:
-            if processing_ready.get(required_app) is None:
-                return False
-        return True
-
     def _are_all_required_apps_success(
-            self, instance: TestInstance, processing_ready: dict[str, TestInstance]
+            self, instance: TestInstance, processing_ready: ReadyTable
     ) -> bool:
         """Verify that all required applications were successfully built."""
         found_failed_app = False
         for required_app in instance.required_applications:
             inst = processing_ready.get(required_app)
-            if inst.status not in (TwisterStatus.PASS, TwisterStatus.NOTRUN):
-                logger.debug(f"{required_app}: Required application failed: {inst.reason}")
+            if inst is None:
+                logger.error(f"{required_app}: Required application was not processed")
+                found_failed_app = True
+            elif inst.status not in (TwisterStatus.PASS, TwisterStatus.NOTRUN):
+                logger.debug(f"{required_app}: Required application failed: {inst.status}")
                 found_failed_app = True
         return not found_failed_app
 
     def are_required_apps_processed(
             self, instance: TestInstance, processing_queue: deque,
-            processing_ready: dict[str, TestInstance], task
+            processing_ready: ReadyTable
     ) -> bool:
         if not instance.required_applications:
             return True
 
-        if not self._are_required_apps_ready(instance, processing_ready):
-            # required app not ready yet,
-            # add the task back to the pipeline to process it later
-            if self.jobs > 1:
-                # to avoid busy waiting
-                time.sleep(1)
-            processing_queue.appendleft(task)
-            return False
-
+        # The scheduler hands out a task only after all its required
+        # applications were reported, so they only have to be checked for success.
         if not self._are_all_required_apps_success(instance, processing_ready):
             instance.status = TwisterStatus.SKIP
             for tc in instance.testcases:
@@ -2033,78 +2082,102 @@ class TwisterRunner:
         return True
 
     def process_tasks(
-            self, processing_queue: deque, processing_ready: dict[str, TestInstance],
+            self, scheduler: WorkStealingScheduler, worker: int,
             lock, results: ExecutionCounter
     ) -> bool:
-        while True:
-            try:
+        # Follow-up stages of the instances started by this worker
+        processing_queue: deque = deque()
+        while not scheduler.aborted:
+            if processing_queue:
                 task = processing_queue.pop()
-            except IndexError:
-                break
             else:
-                instance: TestInstance = task['test']
+                next_task = scheduler.next_task(worker)
+                if next_task is None:
+                    break
+                name, op = next_task
+                task = {'op': op, 'test': self.instances[name]}
 
-                if not self.are_required_apps_processed(
-                    instance, processing_queue, processing_ready, task
-                ):
-                    # postpone processing task if required applications are not ready
-                    continue
-
-                pb = ProjectBuilder(instance, self.env, self.jobserver)
-                pb.duts = self.duts
-                pb.process(processing_queue, processing_ready, task, lock, results)
-                if (
-                    self.env.options.quit_on_failure
-                    and pb.instance.status in [TwisterStatus.FAIL, TwisterStatus.ERROR]
-                ):
-                    try:
-                        while True:
-                            processing_queue.pop()
-                    except IndexError:
-                        pass
+            instance: TestInstance = task['test']
+
+            if not self.are_required_apps_processed(instance, processing_queue, scheduler.ready):
+                # required applications failed, the instance is reported as skipped
+                continue
+
+            pb = ProjectBuilder(instance, self.env, self.jobserver)
+            pb.duts = self.duts
+            pb.filter_cache = self.filter_cache
+            pb.process(processing_queue, scheduler.ready, task, lock, results)
+            if (
+                self.env.options.quit_on_failure
+                and pb.instance.status in [TwisterStatus.FAIL, TwisterStatus.ERROR]
+            ):
+                scheduler.abort()
         return True
 
-    def pipeline_mgr(self, processing_queue: deque, processing_ready: dict[str, TestInstance],
+    def pipeline_mgr(self, scheduler: WorkStealingScheduler, worker: int,
                      lock, results: ExecutionCounter):
         try:
             if sys.platform == 'linux':
                 with self.jobserver.get_job():
-                    return self.process_tasks(processing_queue, processing_ready, lock, results)
+                    return self.process_tasks(scheduler, worker, lock, results)
             else:
-                return self.process_tasks(processing_queue, processing_ready, lock, results)
+                return self.process_tasks(scheduler, worker, lock, results)
         except Exception as e:
             logger.error(f"General exception: {e}\n{traceback.format_exc()}")
             sys.exit(1)
 
-    def execute(self, processing_queue: deque, processing_ready: dict[str, TestInstance]):
+    def execute(self, processing_ready: dict[str, TestInstance]):
         lock = Lock()
         logger.info("Adding tasks to the queue...")
+        processing_queue: deque = deque()
         self.add_tasks_to_queue(processing_queue, self.options.build_only, self.options.test_only,
                                 retry_build_errors=self.options.retry_build_errors)
+        scheduler = WorkStealingScheduler(self.instances, self.jobs, self.required_apps_graph)
+        scheduler.seed((task['test'].name, task['op']) for task in processing_queue)
+        # Instances which do not go through the pipeline this time are
+        # already final, so publish their status for required applications.
+        queued = {task['test'].name for task in processing_queue}
+        for name, instance in self.instances.items():
+            if name not in queued and instance.status != TwisterStatus.NONE:
+                scheduler.ready.mark(name, instance.status)
         logger.info("Added initial list of jobs to queue")
 
         processes = []
 
-        for _ in range(self.jobs):
+        for worker in range(self.jobs):
             p = Process(target=self.pipeline_mgr,
-                        args=(processing_queue, processing_ready, lock, self.results, ))
+                        args=(scheduler, worker, lock, self.results, ))
             processes.append(p)
             p.start()
         logger.debug(f"Launched {self.jobs} jobs")
 
         try:
+            # Finished instances have to be collected while the workers are
+            # running, they cannot exit before their results were received.
+            while True:
+                alive = any(p.is_alive() for p in processes)
+                scheduler.ready.collect(processing_ready, timeout=0.1 if alive else 0)
+                # Other workers may wait for required applications which a
+                # failed one never reports, so do not wait for them to finish.
+                for p in processes:
+                    if p.exitcode:
+                        logger.error(f"Process {p.pid} failed, aborting execution")
+                        for proc in processes:
+                            proc.terminate()
+                        sys.exit(1)
+                if not alive:
+                    break
+            while scheduler.ready.collect(processing_ready, timeout=0):
+                pass
             for p in processes:
                 p.join()
-                if p.exitcode != 0:
-                    logger.error(f"Process {p.pid} failed, aborting execution")
-                    for proc in processes:
-                        proc.terminate()
-                    sys.exit(1)
         except KeyboardInterrupt:
             logger.info("Execution interrupted")
             for p in processes:
                 p.terminate()
 
+        logger.debug(f"Scheduler: {scheduler.stats()}")
+
     @staticmethod
     def get_cmake_filter_stages(filt, logic_keys):
         """Analyze filter expressions from test yaml
@@ -0,0 +1,324 @@
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""Work-stealing task scheduler for the twister pipeline.
+
+Worker processes are forked with a full copy of every test instance, so only
+compact integer task IDs have to cross process boundaries. The initial tasks
+are laid out in one shared table, split into contiguous per-worker ranges.
+A worker pops tasks from the head of its own range and, once that is empty,
+steals the upper half of another worker's range by taking it over. Follow-up
+pipeline stages of an instance stay local to the worker that started it.
+
+Finished instances are sent back to the parent process exactly once, when
+they are reported, and their final status is published in a shared table so
+that other workers can check required applications without any IPC.
+
+Instances which need required applications are not handed out until all of
+their required applications were reported. Reporting an instance releases
+the dependents for which it was the last missing one, and tasks on long
+dependency chains are handed out first.
+"""
+
+import queue
+from collections import defaultdict, namedtuple
+from collections.abc import Callable, Iterable
+from multiprocessing import Array, Condition, Lock, Queue, Value
+
+from twisterlib.statuses import TwisterStatus
+
+# Every stage a task may carry, in pipeline order. The position of a stage in
+# this tuple is used to encode it in a task ID.
+PIPELINE_OPS = (
+    'filter',
+    'cmake',
+    'build',
+    'gather_metrics',
+    'run',
+    'coverage',
+    'report',
+    'cleanup',
+)
+
+# Status codes stored in the shared ready table, 0 means "not ready yet".
+_STATUS_CODES = {status: code for code, status in enumerate(TwisterStatus, start=1)}
+_STATUSES = {code: status for status, code in _STATUS_CODES.items()}
+
+ReadyInstance = namedtuple('ReadyInstance', ['name', 'status'])
+
+
+class DependencyGraph:
+    """Required applications of the test instances, as a directed acyclic graph.
+
+    Built once by the test plan; ``requires`` maps an instance to the
+    instances it needs and ``dependents`` maps an instance to the ones which
+    need it.
+    """
+
+    def __init__(self):
+        self.requires: dict[str, list[str]] = defaultdict(list)
+        self.dependents: dict[str, list[str]] = defaultdict(list)
+        self._priorities: dict[str, int] = {}
+
+    def add(self, name, required):
+        """Record that instance ``name`` needs instance ``required``."""
+        self.requires[name].append(required)
+        self.dependents[required].append(name)
+        self._priorities.clear()
+
+    def priority(self, name) -> int:
+        """Number of instances on the longest dependency chain starting at ``name``.
+
+        Instances without dependents have priority 1.
+        """
+        if name in self._priorities:
+            return self._priorities[name]
+
+        # Iterative post-order walk, deep chains must not hit the recursion
+        # limit. Instances already on the stack are treated as leaves, which
+        # keeps the walk finite should the graph contain a cycle.
+        on_stack = {name}
+        stack = [(name, iter(self.dependents.get(name, ())))]
+        while stack:
+            node, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                on_stack.discard(node)
+                self._priorities[node] = 1 + max(
+                    (self._priorities.get(c, 1) for c in self.dependents.get(node, ())),
+                    default=0,
+                )
+            elif child not in self._priorities and child not in on_stack:
+                on_stack.add(child)
+                stack.append((child, iter(self.dependents.get(child, ()))))
+        return self._priorities[name]
+
+
+class ReadyTable:
+    """Shared record of the instances which reached the report stage.
+
+    Implements the subset of the dict API used by the pipeline: ``update()``
+    is called by a worker when it reports an instance and ``get()`` returns a
+    ReadyInstance with its final status, or None if it is not ready yet.
+    """
+
+    def __init__(self, ids: dict[str, int], on_ready: Callable[[str], None] | None = None):
+        self._ids = ids
+        self._codes = Array('b', max(1, len(ids)), lock=False)
+        self._finished = Queue()
+        self._on_ready = on_ready
+
+    def mark(self, name, status):
+        """Publish the status of an instance without sending it back."""
+        self._codes[self._ids[name]] = _STATUS_CODES[TwisterStatus(status)]
+
+    def update(self, instances):
+        """Publish reported instances and send them back to the parent."""
+        for name, instance in instances.items():
+            self.mark(name, instance.status)
+            self._finished.put(instance)
+            if self._on_ready:
+                self._on_ready(name)
+
+    def get(self, name, default=None):
+        idx = self._ids.get(name)
+        if idx is None or not self._codes[idx]:
+            return default
+        return ReadyInstance(name, _STATUSES[self._codes[idx]])
+
+    def collect(self, into: dict, timeout=None):
+        """Move instances sent back by the workers into a dict.
+
+        Blocks for up to ``timeout`` seconds for the first instance, then
+        drains whatever else is already available. Returns the number of
+        instances collected.
+        """
+        count = 0
+        try:
+            instance = self._finished.get(timeout=timeout)
+            while True:
+                into[instance.name] = instance
+                count += 1
+                instance = self._finished.get_nowait()
+        except queue.Empty:
+            pass
+        return count
+
+
+class WorkStealingScheduler:
+    """Hand out initial pipeline tasks to a fixed number of workers.
+
+    Tasks are encoded as ``instance_index * len(PIPELINE_OPS) + op_index``.
+    Each worker owns the range ``[head, tail)`` of the shared task table.
+    All range updates happen under the lock of the owning worker, and a
+    thief never holds more than one lock at a time.
+
+    Tasks of instances with required applications are held back until the
+    last of them is reported, then pushed on a shared stack of released
+    tasks which takes precedence over the per-worker ranges.
+    """
+
+    def __init__(self, names: Iterable[str], workers: int, graph: DependencyGraph | None = None):
+        self.names = list(names)
+        self.ids = {name: idx for idx, name in enumerate(self.names)}
+        self.workers = max(1, workers)
+        self.graph = graph if graph is not None else DependencyGraph()
+        self.ready = ReadyTable(self.ids, self._release_dependents)
+        size = max(1, len(self.names))
+        self._tasks = Array('l', size, lock=False)
+        self._heads = Array('l', self.workers, lock=False)
+        self._tails = Array('l', self.workers, lock=False)
+        self._locks = [Lock() for _ in range(self.workers)]
+        self._aborted = Value('b', 0, lock=False)
+        # per worker: tasks popped from own range, tasks stolen, steal operations
+        self._stats = Array('l', 3 * self.workers, lock=False)
+        # Held back tasks by instance index, and the number of required
+        # applications each of them still waits for. Only the counters
+        # change once the workers are started.
+        self._blocked: dict[int, int] = {}
+        self._pending = Array('l', size, lock=False)
+        self._released = Array('l', size, lock=False)
+        self._released_top = Value('l', 0, lock=False)
+        self._unreleased = Value('l', 0, lock=False)
+        self._released_cond = Condition()
+
+    def encode(self, name, op) -> int:
+        return self.ids[name] * len(PIPELINE_OPS) + PIPELINE_OPS.index(op)
+
+    def decode(self, task_id) -> tuple[str, str]:
+        idx, op = divmod(task_id, len(PIPELINE_OPS))
+        return self.names[idx], PIPELINE_OPS[op]
+
+    def seed(self, tasks: Iterable[tuple[str, str]]):
+        """Distribute (instance name, op) pairs over the workers.
+
+        Must be called before the workers are started. Required
+        applications which are not part of ``tasks`` are considered to be
+        processed already. The remaining tasks are sorted by the length of
+        the dependency chain they start and dealt round-robin, so that every
+        worker starts with a similar mix and long chains start first.
+        """
+        tasks = list(tasks)
+        queued = {name for name, _ in tasks}
+        runnable = []
+        for name, op in tasks:
+            pending = sum(1 for req in self.graph.requires.get(name, ()) if req in queued)
+            if pending:
+                idx = self.ids[name]
+                self._blocked[idx] = self.encode(name, op)
+                self._pending[idx] = pending
+            else:
+                runnable.append((name, op))
+        self._unreleased.value = len(self._blocked)
+        runnable.sort(key=lambda task: self.graph.priority(task[0]), reverse=True)
+
+        per_worker = [[] for _ in range(self.workers)]
+        for i, (name, op) in enumerate(runnable):
+            per_worker[i % self.workers].append(self.encode(name, op))
+
+        pos = 0
+        for worker, task_ids in enumerate(per_worker):
+            self._heads[worker] = pos
+            for task_id in task_ids:
+                self._tasks[pos] = task_id
+                pos += 1
+            self._tails[worker] = pos
+
+    def next_task(self, worker) -> tuple[str, str] | None:
+        """Return the next (instance name, op) for a worker.
+
+        Blocks while the only tasks left are waiting for required
+        applications which are still being processed. Returns None once
+        all tasks were handed out, or after abort() was called.
+        """
+        while not self._aborted.value:
+            task_id = self._pop_released()
+            if task_id is None:
+                task_id = self._pop(worker)
+            if task_id is None:
+                task_id = self._steal(worker)
+            if task_id is not None:
+                return self.decode(task_id)
+
+            with self._released_cond:
+                if self._released_top.value or self._aborted.value:
+                    continue
+                if not self._unreleased.value:
+                    return None
+                self._released_cond.wait()
+        return None
+
+    def abort(self):
+        """Stop handing out tasks to all workers."""
+        with self._released_cond:
+            self._aborted.value = 1
+            self._released_cond.notify_all()
+
+    @property
+    def aborted(self) -> bool:
+        return bool(self._aborted.value)
+
+    def stats(self) -> dict[str, int]:
+        popped = sum(self._stats[0::3])
+        steals = sum(self._stats[2::3])
+        return {
+            'dispatched': popped + steals,
+            'stolen': sum(self._stats[1::3]),
+            'steals': steals,
+            'released': len(self._blocked) - self._unreleased.value,
+        }
+
+    def _release_dependents(self, name):
+        for dependent in self.graph.dependents.get(name, ()):
+            idx = self.ids.get(dependent)
+            if idx not in self._blocked:
+                continue
+            with self._released_cond:
+                self._pending[idx] -= 1
+                if self._pending[idx]:
+                    continue
+                self._released[self._released_top.value] = self._blocked[idx]
+                self._released_top.value += 1
+                self._unreleased.value -= 1
+                self._released_cond.notify_all()
+
+    def _pop_released(self):
+        if not self._released_top.value:
+            return None
+        with self._released_cond:
+            top = self._released_top.value
+            if not top:
+                return None
+            self._released_top.value = top - 1
+            return self._released[top - 1]
+
+    def _pop(self, worker):
+        with self._locks[worker]:
+            head = self._heads[worker]
+            if head >= self._tails[worker]:
+                return None
+            self._heads[worker] = head + 1
+        self._stats[3 * worker] += 1
+        return self._tasks[head]
+
+    def _steal(self, worker):
+        for offset in range(1, self.workers):
+            victim = (worker + offset) % self.workers
+            with self._locks[victim]:
+                head = self._heads[victim]
+                tail = self._tails[victim]
+                available = tail - head
+                if available <= 0:
+                    continue
+                start = tail - (available + 1) // 2
+                self._tails[victim] = start
+
+            # The stolen range [start, tail) now belongs to nobody, take it
+            # over and keep the first task for ourselves.
+            with self._locks[worker]:
+                self._heads[worker] = start + 1
+                self._tails[worker] = tail
+            self._stats[3 * worker + 1] += tail - start
+            self._stats[3 * worker + 2] += 1
+            return self._tasks[start]
+        return None
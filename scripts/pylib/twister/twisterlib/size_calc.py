@@ -5,15 +5,182 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import logging
+import mmap
 import os
 import re
-import subprocess
+import struct
 import sys
 
 from twisterlib.error import TwisterRuntimeError
 
 logger = logging.getLogger('twister')
 
+# ELF constants used by ElfReader
+SHT_SYMTAB = 2
+SHT_NOBITS = 8
+SHF_ALLOC = 0x2
+PT_LOAD = 1
+SHN_XINDEX = 0xFFFF
+
+
+class ElfReader:
+    """Reads the section headers and symbol names of an ELF file.
+
+    The file is mapped into memory, so only the pages holding the headers
+    and the symbol table are read, however large the file is.
+    """
+
+    def __init__(self, filename: str):
+        with open(filename, "rb") as f:
+            self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_headers()
+        except struct.error as e:
+            self.data.close()
+            raise TwisterRuntimeError(f"{filename} is not a valid ELF file: {e}") from e
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.data.close()
+
+    def _read_headers(self):
+        ident = self.data[:16]
+        if ident[:4] != b'\x7fELF':
+            raise struct.error("bad magic")
+        is_64 = ident[4] == 2
+        self.order = "<" if ident[5] == 1 else ">"
+
+        if is_64:
+            header = struct.Struct(self.order + "16xHHIQQQIHHHHHH")
+            section = struct.Struct(self.order + "IIQQQQIIQQ")
+            segment = struct.Struct(self.order + "IIQQQQQQ")
+        else:
+            header = struct.Struct(self.order + "16xHHIIIIIHHHHHH")
+            section = struct.Struct(self.order + "IIIIIIIIII")
+            segment = struct.Struct(self.order + "IIIIIIII")
+
+        (_, _, _, _, phoff, shoff, _, _, phentsize, phnum, shentsize, shnum,
+         shstrndx) = header.unpack_from(self.data, 0)
+
+        self.segments = []
+        for i in range(phnum):
+            fields = segment.unpack_from(self.data, phoff + i * phentsize)
+            if is_64:
+                p_type, _, p_offset, p_vaddr, p_paddr, p_filesz, p_memsz, _ = fields
+            else:
+                p_type, p_offset, p_vaddr, p_paddr, p_filesz, p_memsz, _, _ = fields
+            if p_type == PT_LOAD:
+                self.segments.append({"offset": p_offset, "vaddr": p_vaddr, "paddr": p_paddr,
+                                      "filesz": p_filesz, "memsz": p_memsz})
+
+        self.sections = []
+        if shoff == 0:
+            return
+
+        # Files with many sections keep their count and the index of the
+        # section name table in the first section header
+        first = section.unpack_from(self.data, shoff)
+        if shnum == 0:
+            shnum = first[5]
+        if shstrndx == SHN_XINDEX:
+            shstrndx = first[6]
+
+        headers = [section.unpack_from(self.data, shoff + i * shentsize) for i in range(shnum)]
+        shstrtab = headers[shstrndx][4]
+        for (sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size, sh_link, _, _,
+             sh_entsize) in headers:
+            self.sections.append({"name": self._string(shstrtab + sh_name),
+                                  "type": sh_type, "flags": sh_flags, "addr": sh_addr,
+                                  "offset": sh_offset, "size": sh_size, "link": sh_link,
+                                  "entsize": sh_entsize})
+
+    def _string(self, offset: int) -> str:
+        end = self.data.find(b'\0', offset)
+        return self.data[offset:end].decode("utf-8", errors="replace")
+
+    def load_address(self, section: dict) -> int:
+        """Get the load address (LMA) of a section, like objdump shows it.
+
+        @param section (dict) One of the sections.
+        @return Load address of the section (int)
+        """
+        if section["flags"] & SHF_ALLOC:
+            for seg in self.segments:
+                if not seg["vaddr"] <= section["addr"] < seg["vaddr"] + max(seg["memsz"], 1):
+                    continue
+                if section["type"] == SHT_NOBITS:
+                    return seg["paddr"] + section["addr"] - seg["vaddr"]
+                return seg["paddr"] + section["offset"] - seg["offset"]
+        return section["addr"]
+
+    def has_symbols(self) -> bool:
+        return any(section["type"] == SHT_SYMTAB for section in self.sections)
+
+    def has_symbol_containing(self, text: str) -> bool:
+        """Check if the name of any symbol contains the given text.
+
+        @param text (str) Text to search for.
+        @return True if the text is part of a symbol name (bool)
+        """
+        needle = text.encode()
+        for symtab in self.sections:
+            if symtab["type"] != SHT_SYMTAB or not symtab["entsize"]:
+                continue
+            strtab = self.sections[symtab["link"]]
+            strings = self.data[strtab["offset"]:strtab["offset"] + strtab["size"]]
+
+            # Start offsets of the strings with the text in them. Symbol names
+            # may start in the middle of a string, when the string table
+            # shares the tail of a longer name with them.
+            matches = []
+            pos = strings.find(needle)
+            while pos != -1:
+                matches.append((strings.rfind(b'\0', 0, pos) + 1, pos))
+                pos = strings.find(needle, pos + 1)
+            if not matches:
+                continue
+
+            # st_name is the first field of a symbol in both ELF classes
+            symbols = self.data[symtab["offset"]:symtab["offset"] + symtab["size"]]
+            name_fmt = struct.Struct(f'{self.order}I{symtab["entsize"] - 4}x')
+            for (st_name,) in name_fmt.iter_unpack(symbols[:len(symbols) - len(symbols)
+                                                            % symtab["entsize"]]):
+                if any(start <= st_name <= pos for start, pos in matches):
+                    return True
+        return False
+
+
+def read_memory_regions(map_filename: str) -> list[dict]:
+    """Read the memory regions from the "Memory Configuration" table of a
+    linker map file.
+
+    @param map_filename (str) Path to the linker map file.
+    @return Regions with their name, origin and length (list[dict])
+    """
+    regions = []
+    with open(map_filename, errors="replace") as f:
+        for line in f:
+            if line.startswith("Memory Configuration"):
+                break
+        else:
+            return regions
+
+        for line in f:
+            if line.startswith("Linker script and memory map"):
+                break
+            words = line.split()
+            if len(words) < 3 or words[0] in ("Name", "*default*"):
+                continue
+            try:
+                regions.append({"name": words[0], "origin": int(words[1], 16),
+                                "length": int(words[2], 16)})
+            except ValueError:
+                continue
+    return regions
+
 
 class SizeCalculator:
     alloc_sections = [
@@ -104,7 +271,7 @@ class SizeCalculator:
         """Constructor
 
         @param elf_filename (str) Path to the output binary
-            parsed by objdump to determine section sizes.
+            parsed to determine section sizes.
         @param extra_sections (list[str]) List of extra,
             unexpected sections, which Twister should not
             report as error and not include in the
@@ -125,6 +292,7 @@ class SizeCalculator:
         self.extra_sections = extra_sections
         self.is_xip = True
         self.generate_warning = generate_warning
+        self.memory_regions = {}
 
         self._calculate_sizes()
 
@@ -138,6 +306,8 @@ class SizeCalculator:
             )
 
         print(f"Totals: {self.used_rom} bytes (ROM), {self.used_ram} bytes (RAM)")
+        for name, region in self.memory_regions.items():
+            print(f"Memory region {name}: {region['used']} of {region['size']} bytes used")
         print("")
 
     def get_used_ram(self):
@@ -154,6 +324,26 @@ class SizeCalculator:
         """
         return self.used_rom
 
+    def get_memory_regions(self) -> dict[str, dict[str, int]]:
+        """Get the usage of the memory regions from the linker map file.
+
+        @return "used" and total "size" of each region, in bytes, by region
+            name (dict), empty if there is no linker map file
+        """
+        return self.memory_regions
+
+    def get_section_sizes(self) -> dict[str, int]:
+        """Get the sizes of the sections counted in the RAM and ROM usage.
+
+        @return size of each section, in bytes, by section name (dict),
+            empty if the usage is read from the build log
+        """
+        sizes = {}
+        for section in self.sections:
+            if section["type"] != "unknown":
+                sizes[section["name"]] = sizes.get(section["name"], 0) + section["size"]
+        return sizes
+
     def get_available_ram(self) -> int:
         """Get the total available RAM.
 
@@ -190,53 +380,33 @@ class SizeCalculator:
             print(str(e))
             sys.exit(2)
 
-    def _check_is_xip(self) -> None:
-        # Search for CONFIG_XIP in the ELF's list of symbols using NM and AWK.
-        # GREP can not be used as it returns an error if the symbol is not
-        # found.
-        is_xip_command = "nm " + self.elf_filename + \
-                         " | awk '/CONFIG_XIP/ { print $3 }'"
-        is_xip_output = subprocess.check_output(
-            is_xip_command, shell=True, stderr=subprocess.STDOUT).decode(
-            "utf-8").strip()
+    def _check_is_xip(self, elf: ElfReader) -> None:
+        # Search for CONFIG_XIP in the ELF's list of symbols
         try:
-            if is_xip_output.endswith("no symbols"):
+            if not elf.has_symbols():
                 raise TwisterRuntimeError(f"{self.elf_filename} has no symbol information")
         except Exception as e:
             print(str(e))
             sys.exit(2)
 
-        self.is_xip = len(is_xip_output) != 0
+        self.is_xip = elf.has_symbol_containing("CONFIG_XIP")
 
-    def _get_info_elf_sections(self) -> None:
+    def _get_info_elf_sections(self, elf: ElfReader) -> None:
         """Calculate RAM and ROM usage and information about issues by section"""
-        objdump_command = "objdump -h " + self.elf_filename
-        objdump_output = subprocess.check_output(
-            objdump_command, shell=True).decode("utf-8").splitlines()
-
-        for line in objdump_output:
-            words = line.split()
-
-            if not words:  # Skip lines that are too short
-                continue
-
-            index = words[0]
-            if not index[0].isdigit():  # Skip lines that do not start
-                continue  # with a digit
-
-            name = words[1]  # Skip lines with section names
-            if name[0] == '.':  # starting with '.'
+        for section in elf.sections[1:]:
+            name = section["name"]  # Skip sections with names
+            if not name or name[0] == '.':  # starting with '.'
                 continue
 
             # TODO this doesn't actually reflect the size in flash or RAM as
             # it doesn't include linker-imposed padding between sections.
             # It is close though.
-            size = int(words[2], 16)
+            size = section["size"]
             if size == 0:
                 continue
 
-            load_addr = int(words[4], 16)
-            virt_addr = int(words[3], 16)
+            load_addr = elf.load_address(section)
+            virt_addr = section["addr"]
 
             # Add section to memory use totals (for both non-XIP and XIP scenarios)
             # Unrecognized section names are not included in the calculations.
@@ -270,10 +440,42 @@ class SizeCalculator:
                                   "size": size, "virt_addr": virt_addr,
                                   "type": stype})
 
+    def _get_memory_regions(self, elf: ElfReader) -> None:
+        """Calculate the usage of the memory regions listed in the linker map
+        file next to the ELF file, like the linker's --print-memory-usage
+        option does: from the start of a region up to the end of the last
+        section placed in it, either to run or to be loaded from.
+        """
+        map_filename = os.path.splitext(self.elf_filename)[0] + ".map"
+        if not os.path.exists(map_filename):
+            return
+
+        regions = read_memory_regions(map_filename)
+        used_up_to = {}
+        for section in elf.sections[1:]:
+            if not section["flags"] & SHF_ALLOC or section["size"] == 0:
+                continue
+
+            addrs = {section["addr"]}
+            if section["type"] != SHT_NOBITS:
+                addrs.add(elf.load_address(section))
+            for addr in addrs:
+                for region in regions:
+                    if region["origin"] <= addr < region["origin"] + region["length"]:
+                        end = addr + section["size"]
+                        used_up_to[region["name"]] = max(used_up_to.get(region["name"], 0), end)
+                        break
+
+        for region in regions:
+            used = used_up_to.get(region["name"], region["origin"]) - region["origin"]
+            self.memory_regions[region["name"]] = {"used": used, "size": region["length"]}
+
     def _analyze_elf_file(self) -> None:
         self._check_elf_file()
-        self._check_is_xip()
-        self._get_info_elf_sections()
+        with ElfReader(self.elf_filename) as elf:
+            self._check_is_xip(elf)
+            self._get_info_elf_sections(elf)
+            self._get_memory_regions(elf)
 
     def _get_buildlog_file_content(self) -> list[str]:
         """Get content of the build.log file.
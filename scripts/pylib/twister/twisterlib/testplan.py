@@ -33,10 +33,12 @@ import scl
 from twisterlib.config_parser import TwisterConfigParser
 from twisterlib.error import TwisterRuntimeError
 from twisterlib.platform import Platform, generate_platforms
+from twisterlib.platform_index import FilterStats, PlatformIndex
 from twisterlib.quarantine import Quarantine
+from twisterlib.scheduler import DependencyGraph
 from twisterlib.statuses import TwisterStatus
 from twisterlib.testinstance import TestInstance
-from twisterlib.testsuite import TestSuite, scan_testsuite_path
+from twisterlib.testsuite import ScanCache, TestSuite, scan_testsuite_paths
 
 logger = logging.getLogger('twister')
 
@@ -177,6 +179,11 @@ class TestPlan:
         self.default_platforms = []
         self.load_errors = 0
         self.instances: dict[str, TestInstance] = {}
+        self.required_apps_graph = DependencyGraph()
+        # processes and cache used to scan test sources for ztest test cases
+        self.scan_jobs = 1
+        self.scan_cache: ScanCache | None = None
+        self.filter_stats: FilterStats | None = None
         self.instance_fail_count = 0
         self.warnings = 0
 
@@ -212,6 +219,9 @@ class TestPlan:
         self.test_config = TestConfiguration(self.env.test_config)
 
         self.add_configurations()
+        self.scan_jobs = self.options.jobs or os.cpu_count()
+        if self.options.scan_cache:
+            self.scan_cache = ScanCache(self.options.scan_cache)
         num = self.add_testsuites(testsuite_filter=self.options.test,
                                 testsuite_pattern=self.options.test_pattern)
 
@@ -534,6 +544,9 @@ class TestPlan:
             for pattern in testsuite_pattern:
                 testsuite_patterns_r.append(re.compile(pattern))
 
+        # (suite path, [(suite, scenario data)]) for every test configuration file
+        parsed_suites = []
+        scan_paths = []
         for root in self.env.test_roots:
             root = os.path.abspath(root)
 
@@ -566,8 +579,7 @@ class TestPlan:
                 try:
                     parsed_data = TwisterConfigParser(suite_yaml_path, self.suite_schema)
                     parsed_data.load()
-                    subcases = None
-                    ztest_suite_names = None
+                    suites = []
 
                     for name in parsed_data.scenarios:
                         suite_dict = parsed_data.get_scenario(name)
@@ -595,31 +607,54 @@ class TestPlan:
                                 suite.platform_allow,
                                 f"platform_allow in {suite.name}")
 
+                        suites.append((suite, suite_dict))
                         if suite.harness in ['ztest', 'test']:
-                            if subcases is None:
-                                # scan it only once per testsuite
-                                subcases, ztest_suite_names = scan_testsuite_path(suite_path)
-                            suite.add_subcases(suite_dict, subcases, ztest_suite_names)
-                        else:
-                            suite.add_subcases(suite_dict)
-
-                        if suite.name in self.testsuites:
-                            msg = (
-                                f"test suite '{suite.name}' in '{suite.yamlfile}' is already added"
-                            )
-                            if suite.yamlfile == self.testsuites[suite.name].yamlfile:
-                                logger.debug(f"Skip - {msg}")
-                            else:
-                                msg = (
-                                    f"Duplicate {msg} from '{self.testsuites[suite.name].yamlfile}'"
-                                )
-                                raise TwisterRuntimeError(msg)
-                        else:
-                            self.testsuites[suite.name] = suite
+                            scan_paths.append(suite_path)
 
+                    parsed_suites.append((suite_path, suites))
                 except Exception as e:
                     logger.error(f"{suite_path}: can't load (skipping): {e!r}")
                     self.load_errors += 1
+
+        # the sources of every test suite directory are only scanned once
+        start_time = time.time()
+        scan_results = scan_testsuite_paths(scan_paths, self.scan_jobs, self.scan_cache)
+        logger.debug(
+            f"Scanned the sources of {len(scan_results)} test suite directories "
+            f"in {time.time() - start_time:.2f} seconds"
+        )
+        if self.scan_cache:
+            self.scan_cache.save()
+
+        for suite_path, suites in parsed_suites:
+            try:
+                for suite, suite_dict in suites:
+                    if suite.harness in ['ztest', 'test']:
+                        scan_result = scan_results[suite_path]
+                        if isinstance(scan_result, Exception):
+                            raise scan_result
+                        subcases, ztest_suite_names = scan_result
+                        suite.add_subcases(suite_dict, subcases, ztest_suite_names)
+                    else:
+                        suite.add_subcases(suite_dict)
+
+                    if suite.name in self.testsuites:
+                        msg = (
+                            f"test suite '{suite.name}' in '{suite.yamlfile}' is already added"
+                        )
+                        if suite.yamlfile == self.testsuites[suite.name].yamlfile:
+                            logger.debug(f"Skip - {msg}")
+                        else:
+                            msg = (
+                                f"Duplicate {msg} from '{self.testsuites[suite.name].yamlfile}'"
+                            )
+                            raise TwisterRuntimeError(msg)
+                    else:
+                        self.testsuites[suite.name] = suite
+
+            except Exception as e:
+                logger.error(f"{suite_path}: can't load (skipping): {e!r}")
+                self.load_errors += 1
         return len(self.testsuites)
 
     def __str__(self):
@@ -685,6 +720,10 @@ class TestPlan:
                     instance.metrics['used_rom']  = ts.get("used_rom",0)
                     instance.metrics['available_ram'] = ts.get('available_ram', 0)
                     instance.metrics['available_rom'] = ts.get('available_rom', 0)
+                    if 'memory_regions' in ts:
+                        instance.metrics['memory_regions'] = ts['memory_regions']
+                    if 'section_sizes' in ts:
+                        instance.metrics['section_sizes'] = ts['section_sizes']
 
                     status = TwisterStatus(ts.get('status'))
                     reason = ts.get("reason", "Unknown")
@@ -824,6 +863,36 @@ class TestPlan:
         logger.info("Building initial testsuite list...")
         build_list_start = time.time()
 
+        # Filters which only depend on the platform and the command line are
+        # evaluated once for all platforms, the others once per testsuite.
+        filter_stats = FilterStats()
+        start = time.perf_counter()
+        index = PlatformIndex(self.platforms, self.options.sim_name)
+        # workaround until toolchain variant in zephyr is overhauled and improved.
+        host_toolchain = 'llvm' if self.env.toolchain in ['llvm'] else 'host'
+        default_toolchain = "zephyr" if not self.env.toolchain else self.env.toolchain
+        static_filter_steps = {
+            'exclude_platform': (
+                index.any_of(index.by_alias, exclude_platform) if not force_platform else 0
+            ),
+            'arch': index.none_of(index.by_arch, arch_filter) if arch_filter else 0,
+            'platform': index.none_of(index.by_name, platform_filter) if platform_filter else 0,
+            'native': index.native if sys.platform != 'linux' else 0,
+        }
+        filter_args = {
+            'platform_filter': platform_filter,
+            'force_platform': force_platform,
+            'force_toolchain': force_toolchain,
+            'runnable': runnable,
+            'tag_filter': tag_filter,
+            'exclude_tag': exclude_tag,
+            'slow_only': slow_only,
+            'testsuite_filter': [os.path.basename(_ts) for _ts in testsuite_filter],
+            'host_toolchain': host_toolchain,
+            'default_toolchain': default_toolchain,
+        }
+        filter_stats.add_time('index', start)
+
         keyed_tests = {}
         for _, ts in self.testsuites.items():
             if ts.integration_platforms:
@@ -886,6 +955,7 @@ class TestPlan:
 
             # list of instances per testsuite, aka configurations.
             instance_list = []
+            filter_steps_per_toolchain = {}
             for itoolchain, plat in itertools.product(
                 ts.integration_toolchains or [None], platform_scope
             ):
@@ -893,159 +963,39 @@ class TestPlan:
                     # Discard silently
                     continue
 
+                if itoolchain not in filter_steps_per_toolchain:
+                    filter_steps_per_toolchain[itoolchain] = self._get_filter_steps(
+                        ts, itoolchain, index, filter_stats, static_filter_steps, **filter_args
+                    )
+                filter_steps, filter_candidates = filter_steps_per_toolchain[itoolchain]
+
+                start = time.perf_counter()
+                bit = index.bit(plat)
                 if itoolchain:
                     toolchain = itoolchain
-                elif plat.arch in ['posix', 'unit']:
-                    # workaround until toolchain variant in zephyr is overhauled and improved.
-                    if self.env.toolchain in ['llvm']:
-                        toolchain = 'llvm'
-                    else:
-                        toolchain = 'host'
+                elif bit & index.host_arch:
+                    toolchain = host_toolchain
                 else:
-                    toolchain = "zephyr" if not self.env.toolchain else self.env.toolchain
+                    toolchain = default_toolchain
 
                 instance = TestInstance(ts, plat, toolchain, self.env.outdir)
                 instance.run = instance.check_runnable(
                     self.options,
                     self.hwm
                 )
-
-                if not force_platform and self.check_platform(plat,exclude_platform):
-                    instance.add_filter("Platform is excluded on command line.", Filters.CMD_LINE)
-
-                if ts.modules and self.modules and not set(ts.modules).issubset(set(self.modules)):
-                    instance.add_filter(
-                        f"one or more required modules not available: {','.join(ts.modules)}",
-                        Filters.MODULE
-                    )
-
-                if self.options.level:
-                    tl = self.get_level(self.options.level)
-                    if tl is None:
-                        instance.add_filter(
-                            f"Unknown test level '{self.options.level}'",
-                            Filters.TESTPLAN
-                        )
-                    else:
-                        planned_scenarios = tl.scenarios
-                        if (
-                            ts.id not in planned_scenarios
-                            and not set(ts.levels).intersection(set(tl.levels))
-                        ):
-                            instance.add_filter("Not part of requested test plan", Filters.TESTPLAN)
-
-                if runnable and not instance.run:
-                    instance.add_filter("Not runnable on device", Filters.CMD_LINE)
-
-                if (
-                    self.options.integration
-                    and ts.integration_platforms
-                    and plat.name not in ts.integration_platforms
-                ):
-                    instance.add_filter("Not part of integration platforms", Filters.TESTSUITE)
-
-                if ts.skip:
-                    instance.add_filter("Skip filter", Filters.SKIP)
-
-                if tag_filter and not ts.tags.intersection(tag_filter):
-                    instance.add_filter("Command line testsuite tag filter", Filters.CMD_LINE)
-
-                if slow_only and not ts.slow:
-                    instance.add_filter("Not a slow test", Filters.CMD_LINE)
-
-                if exclude_tag and ts.tags.intersection(exclude_tag):
-                    instance.add_filter("Command line testsuite exclude filter", Filters.CMD_LINE)
-
-                if testsuite_filter:
-                    normalized_f = [os.path.basename(_ts) for _ts in testsuite_filter]
-                    if ts.id not in normalized_f:
-                        instance.add_filter("Testsuite name filter", Filters.CMD_LINE)
-
-                if arch_filter and plat.arch not in arch_filter:
-                    instance.add_filter("Command line testsuite arch filter", Filters.CMD_LINE)
-
-                if not force_platform:
-
-                    if ts.arch_allow and plat.arch not in ts.arch_allow:
-                        instance.add_filter("Not in testsuite arch allow list", Filters.TESTSUITE)
-
-                    if ts.arch_exclude and plat.arch in ts.arch_exclude:
-                        instance.add_filter("In testsuite arch exclude", Filters.TESTSUITE)
-
-                    if ts.vendor_allow and plat.vendor not in ts.vendor_allow:
-                        instance.add_filter(
-                            "Not in testsuite vendor allow list",
-                            Filters.TESTSUITE
-                        )
-
-                    if ts.vendor_exclude and plat.vendor in ts.vendor_exclude:
-                        instance.add_filter("In testsuite vendor exclude", Filters.TESTSUITE)
-
-                    if ts.platform_exclude and plat.name in ts.platform_exclude:
-                        instance.add_filter("In testsuite platform exclude", Filters.TESTSUITE)
-
-                if ts.toolchain_exclude and toolchain in ts.toolchain_exclude:
-                    instance.add_filter("In testsuite toolchain exclude", Filters.TOOLCHAIN)
-
-                if platform_filter and plat.name not in platform_filter:
-                    instance.add_filter("Command line platform filter", Filters.CMD_LINE)
-
-                if ts.platform_allow \
-                        and plat.name not in ts.platform_allow \
-                        and not (platform_filter and force_platform):
-                    instance.add_filter("Not in testsuite platform allow list", Filters.TESTSUITE)
-
-                if ts.platform_type and plat.type not in ts.platform_type:
-                    instance.add_filter("Not in testsuite platform type list", Filters.TESTSUITE)
-
-                if ts.toolchain_allow and toolchain not in ts.toolchain_allow:
-                    instance.add_filter("Not in testsuite toolchain allow list", Filters.TOOLCHAIN)
-
-                if not plat.env_satisfied:
-                    instance.add_filter(
-                        "Environment ({}) not satisfied".format(", ".join(plat.env)),
-                        Filters.ENVIRONMENT
-                    )
-                if plat.type == 'native' and sys.platform != 'linux':
-                    instance.add_filter("Native platform requires Linux", Filters.ENVIRONMENT)
-
-                if not force_toolchain \
-                        and toolchain and (toolchain not in plat.supported_toolchains):
-                    instance.add_filter(
-                        f"Not supported by the toolchain: {toolchain}",
-                        Filters.PLATFORM
-                    )
-
-                if plat.ram < ts.min_ram:
-                    instance.add_filter("Not enough RAM", Filters.PLATFORM)
-
-                if ts.harness:
-                    sim = plat.simulator_by_name(self.options.sim_name)
-                    if ts.harness == 'robot' and not (sim and sim.name == 'renode'):
-                        instance.add_filter(
-                            "No robot support for the selected platform",
-                            Filters.SKIP
-                        )
-
-                if ts.depends_on:
-                    dep_intersection = ts.depends_on.intersection(set(plat.supported))
-                    if dep_intersection != set(ts.depends_on):
-                        instance.add_filter(
-                            f"No hardware support for {set(ts.depends_on)-dep_intersection}",
-                            Filters.PLATFORM
-                        )
-
-                if plat.flash < ts.min_flash:
-                    instance.add_filter("Not enough FLASH", Filters.PLATFORM)
-
-                if set(plat.ignore_tags) & ts.tags:
-                    instance.add_filter(
-                        "Excluded tags per platform (exclude_tags)",
-                        Filters.PLATFORM
-                    )
-
-                if plat.only_tags and not set(plat.only_tags) & ts.tags:
-                    instance.add_filter("Excluded tags per platform (only_tags)", Filters.PLATFORM)
+                start = filter_stats.add_time('instance', start)
+
+                # The filters are applied in a fixed order, the reason of the
+                # last one which matches becomes the reason of the instance.
+                not_runnable = runnable and not instance.run
+                if bit & filter_candidates or not_runnable:
+                    for name, mask, reason, filter_type in filter_steps:
+                        if not_runnable if mask is None else mask & bit:
+                            if callable(reason):
+                                reason = reason(plat, toolchain)
+                            instance.add_filter(reason, filter_type)
+                            filter_stats.filtered[name] += 1
+                    filter_stats.add_time('apply', start)
 
                 if ts.required_snippets:
                     if missing_required_snippet:
@@ -1081,7 +1031,9 @@ class TestPlan:
                                 break
 
                 # handle quarantined tests
+                start = time.perf_counter()
                 self.handle_quarantined_tests(instance, plat)
+                filter_stats.add_time('quarantine', start)
 
                 # platform_key is a list of unique platform attributes that form a unique key
                 # a test will match against to determine if it should be scheduled to run.
@@ -1220,6 +1172,209 @@ class TestPlan:
 
         build_list_duration = time.time() - build_list_start
         logger.info(f"Built testsuite list in {build_list_duration:.2f} seconds")
+        self.filter_stats = filter_stats
+        for line in filter_stats.report():
+            logger.debug(line)
+
+    def _get_filter_steps(self, ts, itoolchain, index, filter_stats, static_filter_steps, *,
+                          platform_filter, force_platform, force_toolchain, runnable,
+                          tag_filter, exclude_tag, slow_only, testsuite_filter,
+                          host_toolchain, default_toolchain):
+        """Evaluate the filters of a testsuite for all platforms at once.
+
+        Return the filters as a list of (name, mask, reason, filter type) in
+        the order in which they are applied, and the union of their masks.
+        A mask has the bits of the platforms the filter matches, it is None
+        for the per instance "runnable" filter. A reason is either a string
+        or a callable taking the platform and the toolchain.
+        """
+        steps = []
+        start = time.perf_counter()
+
+        def add(name, mask, reason, filter_type):
+            nonlocal start
+            if mask or mask is None:
+                steps.append((name, mask, reason, filter_type))
+            start = filter_stats.add_time(name, start)
+
+        if itoolchain:
+            toolchain_masks = {itoolchain: index.all}
+        else:
+            toolchain_masks = collections.defaultdict(int)
+            toolchain_masks[host_toolchain] |= index.host_arch
+            toolchain_masks[default_toolchain] |= index.all & ~index.host_arch
+
+        add(
+            'exclude_platform',
+            static_filter_steps['exclude_platform'],
+            "Platform is excluded on command line.",
+            Filters.CMD_LINE
+        )
+        if ts.modules and self.modules and not set(ts.modules).issubset(set(self.modules)):
+            add(
+                'modules',
+                index.all,
+                f"one or more required modules not available: {','.join(ts.modules)}",
+                Filters.MODULE
+            )
+        if self.options.level:
+            tl = self.get_level(self.options.level)
+            if tl is None:
+                add(
+                    'level',
+                    index.all,
+                    f"Unknown test level '{self.options.level}'",
+                    Filters.TESTPLAN
+                )
+            elif ts.id not in tl.scenarios and not set(ts.levels).intersection(set(tl.levels)):
+                add('level', index.all, "Not part of requested test plan", Filters.TESTPLAN)
+        if runnable:
+            add('runnable', None, "Not runnable on device", Filters.CMD_LINE)
+        if self.options.integration and ts.integration_platforms:
+            add(
+                'integration',
+                index.none_of(index.by_name, ts.integration_platforms),
+                "Not part of integration platforms",
+                Filters.TESTSUITE
+            )
+        if ts.skip:
+            add('skip', index.all, "Skip filter", Filters.SKIP)
+        if tag_filter and not ts.tags.intersection(tag_filter):
+            add('tag', index.all, "Command line testsuite tag filter", Filters.CMD_LINE)
+        if slow_only and not ts.slow:
+            add('slow', index.all, "Not a slow test", Filters.CMD_LINE)
+        if exclude_tag and ts.tags.intersection(exclude_tag):
+            add('exclude_tag', index.all, "Command line testsuite exclude filter", Filters.CMD_LINE)
+        if testsuite_filter and ts.id not in testsuite_filter:
+            add('testsuite', index.all, "Testsuite name filter", Filters.CMD_LINE)
+        add(
+            'arch',
+            static_filter_steps['arch'],
+            "Command line testsuite arch filter",
+            Filters.CMD_LINE
+        )
+
+        if not force_platform:
+            if ts.arch_allow:
+                add(
+                    'arch_allow',
+                    index.none_of(index.by_arch, ts.arch_allow),
+                    "Not in testsuite arch allow list",
+                    Filters.TESTSUITE
+                )
+            if ts.arch_exclude:
+                add(
+                    'arch_exclude',
+                    index.any_of(index.by_arch, ts.arch_exclude),
+                    "In testsuite arch exclude",
+                    Filters.TESTSUITE
+                )
+            if ts.vendor_allow:
+                add(
+                    'vendor_allow',
+                    index.none_of(index.by_vendor, ts.vendor_allow),
+                    "Not in testsuite vendor allow list",
+                    Filters.TESTSUITE
+                )
+            if ts.vendor_exclude:
+                add(
+                    'vendor_exclude',
+                    index.any_of(index.by_vendor, ts.vendor_exclude),
+                    "In testsuite vendor exclude",
+                    Filters.TESTSUITE
+                )
+            if ts.platform_exclude:
+                add(
+                    'platform_exclude',
+                    index.any_of(index.by_name, ts.platform_exclude),
+                    "In testsuite platform exclude",
+                    Filters.TESTSUITE
+                )
+
+        if ts.toolchain_exclude:
+            add(
+                'toolchain_exclude',
+                index.any_of(toolchain_masks, ts.toolchain_exclude),
+                "In testsuite toolchain exclude",
+                Filters.TOOLCHAIN
+            )
+        add('platform', static_filter_steps['platform'], "Command line platform filter",
+            Filters.CMD_LINE)
+        if ts.platform_allow and not (platform_filter and force_platform):
+            add(
+                'platform_allow',
+                index.none_of(index.by_name, ts.platform_allow),
+                "Not in testsuite platform allow list",
+                Filters.TESTSUITE
+            )
+        if ts.platform_type:
+            add(
+                'platform_type',
+                index.none_of(index.by_type, ts.platform_type),
+                "Not in testsuite platform type list",
+                Filters.TESTSUITE
+            )
+        if ts.toolchain_allow:
+            add(
+                'toolchain_allow',
+                index.any_of(
+                    toolchain_masks, [tc for tc in toolchain_masks if tc not in ts.toolchain_allow]
+                ),
+                "Not in testsuite toolchain allow list",
+                Filters.TOOLCHAIN
+            )
+        add(
+            'environment',
+            index.env_unsatisfied,
+            lambda plat, _: "Environment ({}) not satisfied".format(", ".join(plat.env)),
+            Filters.ENVIRONMENT
+        )
+        add('native', static_filter_steps['native'], "Native platform requires Linux",
+            Filters.ENVIRONMENT)
+        if not force_toolchain:
+            unsupported = 0
+            for tc, mask in toolchain_masks.items():
+                unsupported |= mask & ~index.by_toolchain.get(tc, 0)
+            add(
+                'toolchain',
+                unsupported,
+                lambda _, toolchain: f"Not supported by the toolchain: {toolchain}",
+                Filters.PLATFORM
+            )
+        add('ram', index.ram_below(ts.min_ram), "Not enough RAM", Filters.PLATFORM)
+        if ts.harness == 'robot':
+            add(
+                'robot',
+                index.all & ~index.renode,
+                "No robot support for the selected platform",
+                Filters.SKIP
+            )
+        if ts.depends_on:
+            add(
+                'depends_on',
+                index.all & ~index.all_of(index.by_feature, ts.depends_on),
+                lambda plat, _: "No hardware support for "
+                f"{set(ts.depends_on) - ts.depends_on.intersection(set(plat.supported))}",
+                Filters.PLATFORM
+            )
+        add('flash', index.flash_below(ts.min_flash), "Not enough FLASH", Filters.PLATFORM)
+        add(
+            'ignore_tags',
+            index.any_of(index.by_ignore_tag, ts.tags),
+            "Excluded tags per platform (exclude_tags)",
+            Filters.PLATFORM
+        )
+        add(
+            'only_tags',
+            index.has_only_tags & ~index.any_of(index.by_only_tag, ts.tags),
+            "Excluded tags per platform (only_tags)",
+            Filters.PLATFORM
+        )
+
+        candidates = 0
+        for _, mask, _, _ in steps:
+            candidates |= mask or 0
+        return steps, candidates
 
     def _should_instance_be_processed(self, instance: TestInstance) -> bool:
         """Check if instance will be added to processing queue by runner."""
@@ -1280,6 +1435,7 @@ class TestPlan:
         return build_dirs[0]
 
     def apply_changes_for_required_applications(self) -> None:
+        self.required_apps_graph = DependencyGraph()
         # check if required applications are in scope
         for instance in self.instances.values():
             if not instance.testsuite.required_applications:
@@ -1348,6 +1504,7 @@ class TestPlan:
                 # keep dependencies to use it in the runner module to synchronize
                 # building of applications
                 instance.required_applications.append(req_instance.name)
+                self.required_apps_graph.add(instance.name, req_instance.name)
 
     def add_instances(self, instance_list):
         for instance in instance_list:
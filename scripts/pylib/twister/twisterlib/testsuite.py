@@ -5,10 +5,14 @@
 
 import contextlib
 import glob
+import json
 import logging
 import mmap
+import multiprocessing
 import os
 import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -65,38 +69,67 @@ class ScanPathResult:
                 (sorted(self.ztest_suite_names) ==
                  sorted(other.ztest_suite_names)))
 
-def scan_file(inf_name):
-    regular_suite_regex = re.compile(
-        # do not match until end-of-line, otherwise we won't allow
-        # stc_regex below to catch the ones that are declared in the same
-        # line--as we only search starting the end of this match
-        br"^\s*ztest_test_suite\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,",
-        re.MULTILINE)
-    registered_suite_regex = re.compile(
-        br"^\s*ztest_register_test_suite"
-        br"\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,",
-        re.MULTILINE)
-    new_suite_regex = re.compile(
-        br"^\s*ZTEST_SUITE\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,",
-        re.MULTILINE)
-    testcase_regex = re.compile(
-        br"^\s*(?:ZTEST|ZTEST_F|ZTEST_USER|ZTEST_USER_F)\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,"
-        br"\s*(?P<testcase_name>[a-zA-Z0-9_]+)\s*",
-        re.MULTILINE)
+# All line-anchored ztest constructs which scan_file() looks for, combined in
+# one pattern so that every source file is only traversed once. The
+# alternatives start with distinct keywords, so no match can hide another.
+_ztest_scan_regex = re.compile(
+    br"^\s*(?:"
+    # do not match until end-of-line, otherwise we won't allow
+    # _regular_testcase_regex below to catch the ones that are declared in
+    # the same line--as we only search starting the end of this match
+    br"ztest_test_suite\(\s*(?P<regular_suite>[a-zA-Z0-9_]+)\s*,"
+    br"|ztest_register_test_suite\(\s*(?P<registered_suite>[a-zA-Z0-9_]+)\s*,"
+    br"|ZTEST_SUITE\(\s*(?P<new_suite>[a-zA-Z0-9_]+)\s*,"
+    br"|(?:ZTEST|ZTEST_F|ZTEST_USER|ZTEST_USER_F)\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,"
+    br"\s*(?P<testcase_name>[a-zA-Z0-9_]+)"
     # Checks if the file contains a definition of "void test_main(void)"
     # Since ztest provides a plain test_main implementation it is OK to:
     # 1. register test suites and not call the run function if and only if
     #    the test doesn't have a custom test_main.
     # 2. register test suites and a custom test_main definition if and only if
     #    the test also calls ztest_run_registered_test_suites.
-    test_main_regex = re.compile(
-        br"^\s*void\s+test_main\(void\)",
-        re.MULTILINE)
-    registered_suite_run_regex = re.compile(
-        br"^\s*ztest_run_registered_test_suites\("
-        br"(\*+|&)?(?P<state_identifier>[a-zA-Z0-9_]+)\)",
-        re.MULTILINE)
+    br"|(?P<test_main>void\s+test_main\(void\))"
+    br"|(?P<registered_suite_run>ztest_run_registered_test_suites\("
+    br"(?:\*+|&)?[a-zA-Z0-9_]+\))"
+    br")",
+    re.MULTILINE)
+
+
+# Legacy ztest_test_suite() test cases, only searched for inside the suite
+# definition
+_regular_testcase_regex = re.compile(
+    br"""^\s*  # empty space at the beginning is ok
+    # catch the case where it is declared in the same sentence, e.g:
+    #
+    # ztest_test_suite(mutex_complex, ztest_user_unit_test(TESTNAME));
+    # ztest_register_test_suite(n, p, ztest_user_unit_test(TESTNAME),
+    (?:ztest_
+        (?:test_suite\(|register_test_suite\([a-zA-Z0-9_]+\s*,\s*)
+        [a-zA-Z0-9_]+\s*,\s*
+    )?
+    # Catch ztest[_user]_unit_test-[_setup_teardown](TESTNAME)
+    ztest_(?:1cpu_)?(?:user_)?unit_test(?:_setup_teardown)?
+    # Consume the argument that becomes the extra testcase
+    \(\s*(?P<testcase_name>[a-zA-Z0-9_]+)
+    # _setup_teardown() variant has two extra arguments that we ignore
+    (?:\s*,\s*[a-zA-Z0-9_]+\s*,\s*[a-zA-Z0-9_]+)?
+    \s*\)""",
+    # We don't check how it finishes; we don't care
+    re.MULTILINE | re.VERBOSE)
+_achtung_regex = re.compile(
+    br"(#ifdef|#endif)",
+    re.MULTILINE)
+_suite_run_regex = re.compile(
+    br"^\s*ztest_run_test_suite\((?P<suite_name>[a-zA-Z0-9_]+)\)",
+    re.MULTILINE)
+_suite_end_regex = re.compile(br"\);", re.MULTILINE)
+
 
+def scan_file(inf_name):
+    regular_suite_regex_matches = []
+    registered_suite_regex_matches = []
+    new_suite_regex_matches = []
+    new_suite_testcase_regex_matches = []
     warnings = None
     has_registered_test_suites = False
     has_run_registered_test_suites = False
@@ -115,25 +148,27 @@ def scan_file(inf_name):
             }
 
         with contextlib.closing(mmap.mmap(**mmap_args)) as main_c:
-            regular_suite_regex_matches = \
-                [m for m in regular_suite_regex.finditer(main_c)]
-            registered_suite_regex_matches = \
-                [m for m in registered_suite_regex.finditer(main_c)]
-            new_suite_testcase_regex_matches = \
-                [m for m in testcase_regex.finditer(main_c)]
-            new_suite_regex_matches = \
-                [m for m in new_suite_regex.finditer(main_c)]
+            for m in _ztest_scan_regex.finditer(main_c):
+                kind = m.lastgroup
+                if kind == 'testcase_name':
+                    new_suite_testcase_regex_matches.append(m)
+                elif kind == 'regular_suite':
+                    regular_suite_regex_matches.append(m)
+                elif kind == 'registered_suite':
+                    registered_suite_regex_matches.append(m)
+                elif kind == 'new_suite':
+                    new_suite_regex_matches.append(m)
+                elif kind == 'test_main':
+                    has_test_main = True
+                elif kind == 'registered_suite_run':
+                    has_run_registered_test_suites = True
 
             if registered_suite_regex_matches:
                 has_registered_test_suites = True
-            if registered_suite_run_regex.search(main_c):
-                has_run_registered_test_suites = True
-            if test_main_regex.search(main_c):
-                has_test_main = True
 
             if regular_suite_regex_matches:
                 ztest_suite_names = \
-                    _extract_ztest_suite_names(regular_suite_regex_matches)
+                    _extract_ztest_suite_names(regular_suite_regex_matches, 'regular_suite')
                 testcase_names, warnings = _find_regular_ztest_testcases(
                     main_c,
                     regular_suite_regex_matches,
@@ -141,7 +176,7 @@ def scan_file(inf_name):
                 )
             elif registered_suite_regex_matches:
                 ztest_suite_names = \
-                    _extract_ztest_suite_names(registered_suite_regex_matches)
+                    _extract_ztest_suite_names(registered_suite_regex_matches, 'registered_suite')
                 testcase_names, warnings = _find_regular_ztest_testcases(
                     main_c,
                     registered_suite_regex_matches,
@@ -149,9 +184,9 @@ def scan_file(inf_name):
                 )
             elif new_suite_regex_matches or new_suite_testcase_regex_matches:
                 ztest_suite_names = \
-                    _extract_ztest_suite_names(new_suite_regex_matches)
+                    _extract_ztest_suite_names(new_suite_regex_matches, 'new_suite')
                 testcase_names, warnings = \
-                    _find_new_ztest_testcases(main_c)
+                    _ztest_testcase_names(new_suite_testcase_regex_matches)
             else:
                 # can't find ztest_test_suite, maybe a client, because
                 # it includes ztest.h
@@ -166,9 +201,9 @@ def scan_file(inf_name):
                 has_test_main=has_test_main,
                 ztest_suite_names=ztest_suite_names)
 
-def _extract_ztest_suite_names(suite_regex_matches):
+def _extract_ztest_suite_names(suite_regex_matches, group="suite_name"):
     ztest_suite_names = \
-        [m.group("suite_name") for m in suite_regex_matches]
+        [m.group(group) for m in suite_regex_matches]
     ztest_suite_names = \
         [name.decode("UTF-8") for name in ztest_suite_names]
     return ztest_suite_names
@@ -178,36 +213,13 @@ def _find_regular_ztest_testcases(search_area, suite_regex_matches, is_registere
     Find regular ztest testcases like "ztest_unit_test" or similar. Return
     testcases' names and eventually found warnings.
     """
-    testcase_regex = re.compile(
-        br"""^\s*  # empty space at the beginning is ok
-        # catch the case where it is declared in the same sentence, e.g:
-        #
-        # ztest_test_suite(mutex_complex, ztest_user_unit_test(TESTNAME));
-        # ztest_register_test_suite(n, p, ztest_user_unit_test(TESTNAME),
-        (?:ztest_
-            (?:test_suite\(|register_test_suite\([a-zA-Z0-9_]+\s*,\s*)
-            [a-zA-Z0-9_]+\s*,\s*
-        )?
-        # Catch ztest[_user]_unit_test-[_setup_teardown](TESTNAME)
-        ztest_(?:1cpu_)?(?:user_)?unit_test(?:_setup_teardown)?
-        # Consume the argument that becomes the extra testcase
-        \(\s*(?P<testcase_name>[a-zA-Z0-9_]+)
-        # _setup_teardown() variant has two extra arguments that we ignore
-        (?:\s*,\s*[a-zA-Z0-9_]+\s*,\s*[a-zA-Z0-9_]+)?
-        \s*\)""",
-        # We don't check how it finishes; we don't care
-        re.MULTILINE | re.VERBOSE)
-    achtung_regex = re.compile(
-        br"(#ifdef|#endif)",
-        re.MULTILINE)
-
     search_start, search_end = \
         _get_search_area_boundary(search_area, suite_regex_matches, is_registered_test_suite)
     limited_search_area = search_area[search_start:search_end]
     testcase_names, warnings = \
-        _find_ztest_testcases(limited_search_area, testcase_regex)
+        _find_ztest_testcases(limited_search_area, _regular_testcase_regex)
 
-    achtung_matches = re.findall(achtung_regex, limited_search_area)
+    achtung_matches = _achtung_regex.findall(limited_search_area)
     if achtung_matches and warnings is None:
         achtung = ", ".join(sorted({match.decode() for match in achtung_matches},reverse = True))
         warnings = f"found invalid {achtung} in ztest_test_suite()"
@@ -221,43 +233,30 @@ def _get_search_area_boundary(search_area, suite_regex_matches, is_registered_te
     "ztest_register_test_suite(...)" or "ztest_run_test_suite(...)"
     functions occurrence.
     """
-    suite_run_regex = re.compile(
-        br"^\s*ztest_run_test_suite\((?P<suite_name>[a-zA-Z0-9_]+)\)",
-        re.MULTILINE)
-
     search_start = suite_regex_matches[0].end()
 
-    suite_run_match = suite_run_regex.search(search_area)
+    suite_run_match = _suite_run_regex.search(search_area)
     if suite_run_match:
         search_end = suite_run_match.start()
     elif not suite_run_match and not is_registered_test_suite:
         raise ValueError("can't find ztest_run_test_suite")
     else:
-        search_end = re.compile(br"\);", re.MULTILINE) \
-            .search(search_area, search_start) \
-            .end()
+        search_end = _suite_end_regex.search(search_area, search_start).end()
 
     return search_start, search_end
 
-def _find_new_ztest_testcases(search_area):
-    """
-    Find regular ztest testcases like "ZTEST", "ZTEST_F" etc. Return
-    testcases' names and eventually found warnings.
-    """
-    testcase_regex = re.compile(
-        br"^\s*(?:ZTEST|ZTEST_F|ZTEST_USER|ZTEST_USER_F)\(\s*(?P<suite_name>[a-zA-Z0-9_]+)\s*,"
-        br"\s*(?P<testcase_name>[a-zA-Z0-9_]+)\s*",
-        re.MULTILINE)
-
-    return _find_ztest_testcases(search_area, testcase_regex)
-
 def _find_ztest_testcases(search_area, testcase_regex):
     """
     Parse search area and try to find testcases defined in testcase_regex
     argument. Return testcase names and eventually found warnings.
     """
-    testcase_regex_matches = \
-        [m for m in testcase_regex.finditer(search_area)]
+    return _ztest_testcase_names(testcase_regex.finditer(search_area))
+
+def _ztest_testcase_names(testcase_regex_matches):
+    """
+    Convert testcase regex matches to testcase names. Return testcase names
+    and eventually found warnings.
+    """
     testcase_names = [
         (
             m.group("suite_name") if m.groupdict().get("suite_name") else b'',
@@ -302,7 +301,76 @@ def find_c_files_in(path: str, extensions: list = None) -> list:
 
     return filenames
 
-def scan_testsuite_path(testsuite_path):
+class ScanCache:
+    """Results of scan_file(), keyed by file path and validated by the
+    modification time, size and inode of the file.
+
+    If a path is given, the cache is loaded from and saved to that JSON
+    file, so that later twister invocations only scan modified sources.
+    Entries added since the cache was loaded are tracked separately, so that
+    worker processes can send them back to the parent.
+    """
+    VERSION = 1
+
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = {}
+        self.updates = {}
+        if path:
+            self.load()
+
+    def load(self):
+        try:
+            with open(self.path) as fp:
+                data = json.load(fp)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == self.VERSION:
+            self.entries = data.get('entries', {})
+
+    def save(self):
+        if not self.path or not self.updates:
+            return
+        self.updates = {}
+        # drop the entries of deleted files
+        self.entries = {
+            filename: entry for filename, entry in self.entries.items()
+            if os.path.exists(filename)
+        }
+        cache_dir = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as fp:
+                json.dump({'version': self.VERSION, 'entries': self.entries}, fp)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to save source scan cache {self.path}: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+
+    def merge(self, updates):
+        self.entries.update(updates)
+        self.updates.update(updates)
+
+    def scan(self, filename) -> ScanPathResult:
+        st = os.stat(filename)
+        stamp = [st.st_mtime_ns, st.st_size, st.st_ino]
+        entry = self.entries.get(filename)
+        if entry and entry['stamp'] == stamp:
+            return ScanPathResult(**entry['result'])
+
+        result = scan_file(filename)
+        self.merge({filename: {'stamp': stamp, 'result': vars(result)}})
+        return result
+
+
+def _scan_file(filename, cache=None) -> ScanPathResult:
+    if cache is None:
+        return scan_file(filename)
+    return cache.scan(filename)
+
+def scan_testsuite_path(testsuite_path, cache: ScanCache | None = None):
     subcases = []
     has_registered_test_suites = False
     has_run_registered_test_suites = False
@@ -314,7 +382,7 @@ def scan_testsuite_path(testsuite_path):
         if os.stat(filename).st_size == 0:
             continue
         try:
-            result: ScanPathResult = scan_file(filename)
+            result: ScanPathResult = _scan_file(filename, cache)
             if result.warnings:
                 logger.error(f"{filename}: {result.warnings}")
                 raise TwisterRuntimeError(f"{filename}: {result.warnings}")
@@ -340,7 +408,7 @@ def scan_testsuite_path(testsuite_path):
             continue
 
         try:
-            result: ScanPathResult = scan_file(filename)
+            result: ScanPathResult = _scan_file(filename, cache)
             if result.warnings:
                 logger.error(f"{filename}: {result.warnings}")
             if result.matches:
@@ -360,6 +428,55 @@ def scan_testsuite_path(testsuite_path):
 
     return subcases, ztest_suite_names
 
+# Source scan cache of a worker process of scan_testsuite_paths()
+_worker_scan_cache: ScanCache | None = None
+
+def _init_scan_worker(cache):
+    global _worker_scan_cache
+    _worker_scan_cache = cache
+
+def _scan_testsuite_path_worker(testsuite_path):
+    try:
+        result = scan_testsuite_path(testsuite_path, _worker_scan_cache)
+    except Exception as e:
+        result = e
+    updates = {}
+    if _worker_scan_cache is not None:
+        updates = _worker_scan_cache.updates
+        _worker_scan_cache.updates = {}
+    return result, updates
+
+def scan_testsuite_paths(testsuite_paths, jobs=1, cache: ScanCache | None = None) -> dict:
+    """
+    Scan several test suite directories with scan_testsuite_path(), in a
+    pool of "jobs" processes. Return a dict which maps every path to either
+    the result of scan_testsuite_path() or to the exception it raised.
+    """
+    testsuite_paths = list(dict.fromkeys(testsuite_paths))
+    results = {}
+    if jobs <= 1 or len(testsuite_paths) <= 1:
+        for testsuite_path in testsuite_paths:
+            try:
+                results[testsuite_path] = scan_testsuite_path(testsuite_path, cache)
+            except Exception as e:
+                results[testsuite_path] = e
+        return results
+
+    jobs = min(jobs, len(testsuite_paths))
+    chunksize = max(1, len(testsuite_paths) // (jobs * 4))
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        mp_context=multiprocessing.get_context(),
+        initializer=_init_scan_worker,
+        initargs=(cache,)
+    ) as executor:
+        scanned = executor.map(_scan_testsuite_path_worker, testsuite_paths, chunksize=chunksize)
+        for testsuite_path, (result, updates) in zip(testsuite_paths, scanned, strict=True):
+            results[testsuite_path] = result
+            if cache is not None:
+                cache.merge(updates)
+    return results
+
 def _find_src_dir_path(test_dir_path):
     """
     Try to find src directory with test source code. Sometimes due to the
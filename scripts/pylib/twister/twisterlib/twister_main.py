@@ -206,6 +206,7 @@ class Twister:
         """Run twister runner."""
         runner = TwisterRunner(tplan.instances, tplan.testsuites, env)
         runner.duts = hwm.duts
+        runner.required_apps_graph = tplan.required_apps_graph
         runner.run()
         return runner
 
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for feeding a log stream to the dictionary log parser in pieces
+"""
+
+import os
+import struct
+import sys
+
+import pytest
+
+ZEPHYR_BASE = os.getenv("ZEPHYR_BASE")
+sys.path.insert(0, os.path.join(ZEPHYR_BASE, "scripts/logging/dictionary"))
+
+from dictionary_parser.log_database import LogDatabase  # noqa: E402
+from dictionary_parser.log_parser_v3 import LogParserV3  # noqa: E402
+
+FORMATS = [
+    'thread %p started with priority %d',
+    'sensor %s: %d.%06d degrees',
+    'transfer of %u bytes to 0x%08x done in %lu us',
+    'state %s -> %s',
+    'buffer',
+]
+STRINGS = ['die_temp', 'IDLE', 'RUNNING']
+
+
+@pytest.fixture
+def database():
+    """Version 3 database of a 32-bit little endian target"""
+    database = LogDatabase()
+    database.set_arch('arm')
+    database.set_tgt_bits(32)
+    database.set_tgt_endianness(LogDatabase.LITTLE_ENDIAN)
+    # Source IDs are strings in databases read from JSON files
+    database.add_log_instance('1', 'app', 3, 0x20000000)
+    database.add_log_instance('2', 'net_core', 4, 0x20000010)
+
+    mappings = {}
+    addr = 0x10000
+    for string in FORMATS + STRINGS:
+        mappings[addr] = string
+        addr += len(string) + 1
+    database.set_string_mappings(mappings)
+    return database
+
+
+def message(database, fmt, args, level, source, timestamp, data=b''):
+    strings = {string: ptr for ptr, string in database.get_string_mappings().items()}
+    package = struct.pack('<I', strings[fmt])
+    for arg in args:
+        package += struct.pack('<I', strings.get(arg, arg))
+    # Package header: size of header and arguments in words, no strings
+    package = struct.pack('<BBBB', len(package) // 4 + 1, 0, 0, 0) + package
+    header = struct.pack('<BBHHII', 0, level << 4, len(package), len(data), source, timestamp)
+    return header + package + data
+
+
+def dropped(count):
+    return struct.pack('<BH', 1, count)
+
+
+@pytest.fixture
+def log_stream(database):
+    """Messages with integer and string arguments and hexdump data, and
+    reports of dropped messages"""
+    return b''.join(
+        [
+            message(database, FORMATS[0], [0x20001000, 5], 3, 1, 100),
+            dropped(3),
+            message(database, FORMATS[1], ['die_temp', 23, 512000], 3, 1, 200),
+            message(database, FORMATS[2], [1024, 0x20004000, 87], 4, 2, 300),
+            message(database, FORMATS[3], ['IDLE', 'RUNNING'], 2, 2, 400),
+            message(database, FORMATS[4], [], 4, 2, 500, bytes(range(40))),
+            dropped(7),
+        ]
+    )
+
+
+def feed(database, chunks):
+    log_parser = LogParserV3(database)
+    for chunk in chunks:
+        log_parser.feed(chunk)
+    return log_parser
+
+
+def test_feed_whole(capsys, database, log_stream):
+    log_parser = feed(database, [log_stream])
+
+    output = capsys.readouterr().out
+    assert not log_parser.pending
+    assert 'thread 0x20001000 started with priority 5' in output
+    assert 'sensor die_temp: 23.512000 degrees' in output
+    assert 'transfer of 1024 bytes to 0x20004000 done in 87 us' in output
+    assert 'state IDLE -> RUNNING' in output
+    assert '--- 3 messages dropped ---' in output
+    assert '--- 7 messages dropped ---' in output
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 7, 13, 64])
+def test_feed_chunks(capsys, database, log_stream, chunk_size):
+    feed(database, [log_stream])
+    expected = capsys.readouterr().out
+
+    view = memoryview(log_stream)
+    chunks = [view[i : i + chunk_size] for i in range(0, len(view), chunk_size)]
+    log_parser = feed(database, chunks)
+
+    assert capsys.readouterr().out == expected
+    assert len(log_parser.pending) == 0
+
+
+@pytest.mark.parametrize('split', [1, 2], ids=['after type', 'inside count'])
+def test_feed_split_dropped(capsys, database, split):
+    first = message(database, FORMATS[3], ['IDLE', 'RUNNING'], 2, 2, 400)
+    stream = first + dropped(3) + message(database, FORMATS[4], [], 4, 2, 500)
+    end = len(first) + split
+
+    log_parser = LogParserV3(database)
+    assert log_parser.feed(stream[:end]) == split
+    assert '--- 3 messages dropped ---' not in capsys.readouterr().out
+
+    assert log_parser.feed(stream[end:]) == 0
+    output = capsys.readouterr().out
+    assert '--- 3 messages dropped ---' in output
+    assert 'buffer' in output
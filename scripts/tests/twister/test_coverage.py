@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for coverage.py classes' methods
+"""
+
+import struct
+from unittest import mock
+
+import pytest
+from twisterlib.coverage import (
+    GCOV_TAG_COUNTER_ARCS,
+    GCOV_TAG_FUNCTION,
+    CoverageTool,
+    GcdaFormatError,
+    gcda_counter_ranges,
+    merge_gcda,
+)
+
+
+def make_gcda(functions, order='<', gcc12=True):
+    # Lays out a .gcda file like gcov_populate_buffer() does, functions is
+    # a list of arc counter value lists
+    word = order + 'I'
+    data = bytearray(b'adcg' if order == '<' else b'gcda')
+    data += struct.pack(order + 'II', 0x4232302A, 0x1234)
+    if gcc12:
+        data += struct.pack(word, 0xCAFE)
+    for ident, counters in enumerate(functions):
+        data += struct.pack(
+            order + 'IIIII',
+            GCOV_TAG_FUNCTION,
+            12 if gcc12 else 3,
+            ident,
+            0x1111,
+            0x2222,
+        )
+        length = len(counters) * (8 if gcc12 else 2)
+        data += struct.pack(order + 'II', GCOV_TAG_COUNTER_ARCS, length)
+        data += struct.pack(f'{order}{len(counters)}Q', *counters)
+    return bytes(data)
+
+
+@pytest.mark.parametrize('order', ['<', '>'], ids=['little-endian', 'big-endian'])
+@pytest.mark.parametrize('gcc12', [True, False], ids=['gcc12', 'gcc11'])
+def test_merge_gcda(order, gcc12):
+    dumps = [
+        make_gcda([[1, 2], [], [3]], order, gcc12),
+        make_gcda([[10, 0], [], [0]], order, gcc12),
+        make_gcda([[100, 200], [], [2**64 - 1]], order, gcc12),
+    ]
+
+    assert merge_gcda(dumps) == make_gcda([[111, 202], [], [2]], order, gcc12)
+
+
+def test_gcda_counter_ranges():
+    header = 16
+    function = 5 * 4
+    counters = 2 * 4
+
+    assert gcda_counter_ranges(make_gcda([])) == ('<', [])
+    assert gcda_counter_ranges(make_gcda([[1, 2], [3]])) == (
+        '<',
+        [
+            (header + function + counters, header + function + counters + 16),
+            (header + 2 * (function + counters) + 16, header + 2 * (function + counters) + 24),
+        ],
+    )
+
+
+@pytest.mark.parametrize(
+    'dumps, match',
+    [
+        ([b'xxxx' + make_gcda([[1]])[4:], make_gcda([[1]])], 'bad magic'),
+        ([make_gcda([[1]])[:-4], make_gcda([[1]])[:-4]], 'truncated record'),
+        ([make_gcda([[1]]) + b'\0\0', make_gcda([[1]]) + b'\0\0'], 'truncated record header'),
+        ([make_gcda([[1]]), make_gcda([[1, 2]])], 'differ in size'),
+        ([make_gcda([[1], [2]]), make_gcda([[1, 2], []])], 'differ in layout'),
+        (
+            [
+                make_gcda([[1]]) + struct.pack('<II', 0x01A30000, 0),
+                make_gcda([[1]]) + struct.pack('<II', 0x01A30000, 0),
+            ],
+            'unsupported record 0x01a30000',
+        ),
+    ],
+    ids=['magic', 'truncated', 'truncated header', 'size', 'layout', 'record'],
+)
+def test_merge_gcda_errors(dumps, match):
+    with pytest.raises(GcdaFormatError, match=match):
+        merge_gcda(dumps)
+
+
+def test_merge_hexdumps_fallback():
+    tool = CoverageTool()
+    tool.gcov_tool = 'gcov'
+    dumps = [make_gcda([[1]]), make_gcda([[1, 2]])]
+
+    with mock.patch(
+        'twisterlib.coverage.gcov_tool_merge', return_value=b'merged'
+    ) as gcov_tool_merge:
+        assert tool.merge_hexdumps(dumps) == b'merged'
+    gcov_tool_merge.assert_called_once_with('gcov', dumps)
+
+    with mock.patch('twisterlib.coverage.gcov_tool_merge') as gcov_tool_merge:
+        assert tool.merge_hexdumps(dumps[:1]) == dumps[0]
+        assert tool.merge_hexdumps(dumps[:1] * 2) == make_gcda([[2]])
+    gcov_tool_merge.assert_not_called()
+
+
+def write_handler_log(path, dumps):
+    lines = ['*** Booting Zephyr OS ***']
+    for dump in dumps:
+        lines.append('GCOV_COVERAGE_DUMP_START')
+        lines += [f'*{name}<{data.hex()}' for name, data in dump]
+        lines.append('GCOV_COVERAGE_DUMP_END')
+    path.parent.mkdir(parents=True)
+    path.write_text('\n'.join(lines) + '\n')
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_capture_data(tmp_path, jobs):
+    tool = CoverageTool(jobs)
+    tool.gcov_tool = 'gcov'
+    for i in range(3):
+        build_dir = tmp_path / f'build{i}'
+        write_handler_log(
+            build_dir / 'handler.log',
+            [
+                [
+                    (build_dir / 'a.gcda', make_gcda([[1, i]])),
+                    (build_dir / 'b.gcda', make_gcda([])),
+                ],
+                [(build_dir / 'a.gcda', make_gcda([[2, i]]))],
+            ],
+        )
+    (tmp_path / 'incomplete' / 'handler.log').parent.mkdir()
+    (tmp_path / 'incomplete' / 'handler.log').write_text('GCOV_COVERAGE_DUMP_START\n')
+
+    assert not tool.capture_data(str(tmp_path))
+
+    for i in range(3):
+        build_dir = tmp_path / f'build{i}'
+        assert (build_dir / 'a.gcda').read_bytes() == make_gcda([[3, 2 * i]])
+        assert (build_dir / 'b.gcda').read_bytes() == make_gcda([])
+
+    (tmp_path / 'incomplete' / 'handler.log').unlink()
+    assert tool.capture_data(str(tmp_path))
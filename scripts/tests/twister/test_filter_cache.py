@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for filter_cache.py classes' methods
+"""
+
+import os
+import shutil
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+from twisterlib.filter_cache import FilterCache, is_config_file, zephyr_tree_id
+
+
+@pytest.fixture
+def instance(tmp_path):
+    source_dir = tmp_path / 'test'
+    source_dir.mkdir()
+    (source_dir / 'prj.conf').write_text('CONFIG_ZTEST=y\n')
+    (source_dir / 'main.c').write_text('int main(void) { return 0; }\n')
+    board_dir = tmp_path / 'board'
+    board_dir.mkdir()
+    (board_dir / 'board.dts').write_text('/dts-v1/;\n')
+
+    testsuite = SimpleNamespace(
+        source_dir=str(source_dir),
+        filter='dt_compat_enabled("vnd,foo") and CONFIG_FOO',
+        extra_conf_files=[],
+        extra_overlay_confs=[],
+        extra_dtc_overlay_files=[],
+        extra_args=[],
+        conf_files=[],
+        required_snippets=[],
+    )
+    platform = SimpleNamespace(name='dummy/board', arch='arm', board_dirs=[str(board_dir)])
+    return SimpleNamespace(
+        testsuite=testsuite,
+        platform=platform,
+        toolchain='zephyr',
+        sysbuild=False,
+        handler=None,
+        build_dir=str(tmp_path / 'build'),
+    )
+
+
+@pytest.mark.parametrize(
+    'name, expected',
+    [
+        ('prj.conf', True),
+        ('Kconfig.defconfig', True),
+        ('board.overlay', True),
+        ('CMakeLists.txt', True),
+        ('main.c', False),
+        ('README.rst', False),
+    ],
+)
+def test_is_config_file(name, expected):
+    assert is_config_file(name) == expected
+
+
+def test_filtercache_roundtrip(tmp_path, instance):
+    cache = FilterCache(str(tmp_path / 'cache'), 'v4.0.0')
+    key = cache.key(instance, [], ['dts', 'kconfig'])
+
+    assert cache.get(key) is None
+    cache.put(key, True, 'dummy')
+    assert cache.get(key) is True
+    cache.put(key, False, 'dummy')
+    assert cache.get(key) is False
+
+    assert (cache.hits, cache.misses) == (2, 1)
+    assert cache.summary() == 'Filter cache: 2 hits, 1 misses (67% hit rate)'
+
+
+def test_filtercache_key_stable(tmp_path, instance):
+    key = FilterCache(str(tmp_path / 'cache'), 'v4.0.0').key(instance, [], [])
+
+    # a new cache does not share the directory digests of the first one
+    assert FilterCache(str(tmp_path / 'cache'), 'v4.0.0').key(instance, [], []) == key
+
+
+@pytest.mark.parametrize(
+    'change',
+    [
+        'tree',
+        'filter',
+        'stages',
+        'platform',
+        'extra_args',
+        'test_config',
+        'board_config',
+        'env',
+    ],
+)
+def test_filtercache_key_changes(tmp_path, monkeypatch, instance, change):
+    monkeypatch.delenv('CONFIG_FOO', raising=False)
+    key = FilterCache(str(tmp_path / 'cache'), 'v4.0.0').key(instance, [], [])
+
+    tree_id = 'v4.0.0'
+    extra_args = []
+    stages = []
+    if change == 'tree':
+        tree_id = 'v4.1.0'
+    elif change == 'filter':
+        instance.testsuite.filter = 'CONFIG_FOO'
+    elif change == 'stages':
+        stages = ['dts']
+    elif change == 'platform':
+        instance.platform.name = 'other/board'
+    elif change == 'extra_args':
+        extra_args = ['CONFIG_FOO=y']
+    elif change == 'test_config':
+        with open(os.path.join(instance.testsuite.source_dir, 'prj.conf'), 'a') as fp:
+            fp.write('CONFIG_FOO=y\n')
+    elif change == 'board_config':
+        with open(os.path.join(instance.platform.board_dirs[0], 'board.dts'), 'a') as fp:
+            fp.write('/ { };\n')
+    elif change == 'env':
+        monkeypatch.setenv('CONFIG_FOO', 'y')
+
+    new_key = FilterCache(str(tmp_path / 'cache'), tree_id).key(instance, extra_args, stages)
+
+    assert new_key != key
+
+
+def test_filtercache_key_ignores_sources(tmp_path, instance):
+    key = FilterCache(str(tmp_path / 'cache'), 'v4.0.0').key(instance, [], [])
+    with open(os.path.join(instance.testsuite.source_dir, 'main.c'), 'a') as fp:
+        fp.write('/* comment */\n')
+
+    assert FilterCache(str(tmp_path / 'cache'), 'v4.0.0').key(instance, [], []) == key
+
+
+def test_filtercache_corrupted_entry(tmp_path, instance):
+    cache = FilterCache(str(tmp_path / 'cache'), 'v4.0.0')
+    key = cache.key(instance, [], [])
+    cache.put(key, True)
+    with open(cache._path(key), 'w') as fp:
+        fp.write('{not json')
+
+    assert cache.get(key) is None
+    assert cache.misses == 1
+
+
+@pytest.fixture
+def zephyr_tree(tmp_path):
+    if shutil.which('git') is None:
+        pytest.skip('git is not available')
+    tree = tmp_path / 'zephyr'
+    tree.mkdir()
+    (tree / 'Kconfig').write_text('config FOO\n\tbool "foo"\n')
+
+    def git(*args):
+        subprocess.run(
+            ['git', '-c', 'user.name=test', '-c', 'user.email=test@example.com', *args],
+            cwd=tree,
+            check=True,
+            stdout=subprocess.DEVNULL,
+        )
+
+    git('init', '-q')
+    git('add', 'Kconfig')
+    git('commit', '-q', '-m', 'initial')
+    return tree
+
+
+@pytest.mark.parametrize(
+    'change, expected_same',
+    [
+        ('none', True),
+        ('modify', False),
+        ('untracked_config', False),
+        ('untracked_source', False),
+    ],
+)
+def test_zephyr_tree_id_local_changes(zephyr_tree, change, expected_same):
+    tree_id = zephyr_tree_id(str(zephyr_tree), 'v4.0.0')
+    assert tree_id.startswith('v4.0.0-')
+
+    if change == 'modify':
+        with open(zephyr_tree / 'Kconfig', 'a') as fp:
+            fp.write('\tdefault y\n')
+    elif change == 'untracked_config':
+        (zephyr_tree / 'board.overlay').write_text('/ { };\n')
+    elif change == 'untracked_source':
+        (zephyr_tree / 'main.c').write_text('int main(void) { return 0; }\n')
+
+    assert (zephyr_tree_id(str(zephyr_tree), 'v4.0.0') == tree_id) == expected_same
+
+
+def test_zephyr_tree_id_untracked_config_contents(zephyr_tree):
+    overlay = zephyr_tree / 'board.overlay'
+    overlay.write_text('/ { };\n')
+    tree_id = zephyr_tree_id(str(zephyr_tree), 'v4.0.0')
+
+    overlay.write_text('/ { foo; };\n')
+
+    assert zephyr_tree_id(str(zephyr_tree), 'v4.0.0') != tree_id
+
+
+def test_zephyr_tree_id_unknown(tmp_path):
+    assert zephyr_tree_id(str(tmp_path), 'Unknown') is None
+    # not a git checkout
+    assert zephyr_tree_id(str(tmp_path), 'v4.0.0') is None
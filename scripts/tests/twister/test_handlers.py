@@ -286,11 +286,11 @@ def test_binaryhandler_try_kill_process_by_pid(mocked_instance):
 
 TESTDATA_3 = [
     (
-        [b'This\\r\\n\n', b'is\r', b'some \x1B[31mANSI\x1B[39m in\n', b'a short\n', b'file.'],
+        [b'This\\r\\n\n', b'is\r\n', b'some \x1B[31mANSI\x1B[39m in\n', b'a short\n', b'file.'],
         mock.Mock(status=TwisterStatus.NONE, capture_coverage=False),
         [
             mock.call('This\\r\\n\n'),
-            mock.call('is\r'),
+            mock.call('is\r\n'),
             mock.call('some ANSI in\n'),
             mock.call('a short\n'),
             mock.call('file.')
@@ -306,7 +306,7 @@ TESTDATA_3 = [
         False
     ),
     (
-        [b'Too much.'] * 120,  # Should be more than the timeout
+        [b'Too much.\n'] * 120,  # Should be more than the timeout
         mock.Mock(status=TwisterStatus.PASS, capture_coverage=False),
         None,
         None,
@@ -314,7 +314,7 @@ TESTDATA_3 = [
         False
     ),
     (
-        [b'Too much.'] * 120,  # Should be more than the timeout
+        [b'Too much.\n'] * 120,  # Should be more than the timeout
         mock.Mock(status=TwisterStatus.PASS, capture_coverage=False),
         None,
         None,
@@ -322,7 +322,7 @@ TESTDATA_3 = [
         False
     ),
     (
-        [b'Too much.'] * 120,  # Should be more than the timeout
+        [b'Too much.\n'] * 120,  # Should be more than the timeout
         mock.Mock(status=TwisterStatus.PASS, capture_coverage=True),
         None,
         None,
@@ -352,26 +352,11 @@ def test_binaryhandler_output_handler(
     should_be_less,
     timeout_wait
 ):
-    class MockStdout(mock.Mock):
-        def __init__(self, text):
-            super().__init__(text)
-            self.text = text
-            self.line_index = 0
-
-        def readline(self):
-            if self.line_index == len(self.text):
-                self.line_index = 0
-                return b''
-            else:
-                line = self.text[self.line_index]
-                self.line_index += 1
-                return line
-
     class MockProc(mock.Mock):
         def __init__(self, pid, stdout):
             super().__init__(pid, stdout)
             self.pid = mock.PropertyMock(return_value=pid)
-            self.stdout = MockStdout(stdout)
+            self.stdout = stdout
 
         def wait(self, *args, **kwargs):
             if timeout_wait:
@@ -380,13 +365,16 @@ def test_binaryhandler_output_handler(
     handler = BinaryHandler(mocked_instance, 'build', mock.Mock(timeout_multiplier=1))
     handler.terminate = mock.Mock()
 
-    proc = MockProc(1, proc_stdout)
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b''.join(proc_stdout))
+    os.close(write_fd)
 
-    with mock.patch(
+    with open(read_fd, 'rb') as stdout, mock.patch(
         'builtins.open',
         mock.mock_open(read_data='')
     ) as mock_file, \
          mock.patch('time.time', side_effect=faux_timer.time):
+        proc = MockProc(1, stdout)
         handler._output_handler(proc, harness)
 
         mock_file.assert_called_with(handler.log, 'w')
@@ -1938,6 +1926,8 @@ def test_qemuhandler_thread(
     )
     mock_thread_update_instance_info = mock.Mock()
 
+    # Read the output one byte at a time, so that polls are interleaved
+    # with the lines as when QEMU writes them slowly
     with mock.patch('time.time', side_effect=faux_timer.time), \
          mock.patch('builtins.open', new=mocked_open), \
          mock.patch('select.poll', return_value=p), \
@@ -1945,6 +1935,7 @@ def test_qemuhandler_thread(
          mock.patch('os.unlink', mock.Mock()), \
          mock.patch('os.mkfifo', mock.Mock()), \
          mock.patch('os.kill', mock.Mock()), \
+         mock.patch('twisterlib.handlers.QEMU_FIFO_READ_SIZE', 1), \
          mock.patch('twisterlib.handlers.QEMUHandler._get_cpu_time',
                     mock_cputime), \
          mock.patch('twisterlib.handlers.QEMUHandler._thread_get_fifo_names',
@@ -1972,6 +1963,72 @@ def test_qemuhandler_thread(
     file_objs[handler.log].write.assert_has_calls(expected_log_calls)
 
 
+def test_qemuhandler_thread_chunks(mocked_instance, faux_timer):
+    content = 'a\nb\x1b[0m\r\n\u00e9\nc\npartial'.encode('utf-8')
+    # Split inside a line and inside the two-byte 'é'
+    chunks = [content[:7], content[7:11], content[11:]]
+
+    handler = QEMUHandler(mocked_instance, 'build', mock.Mock(timeout_multiplier=1))
+    handler.pid_fn = 'pid_fn'
+    handler.fifo_fn = 'fifo_fn'
+
+    in_fp = mock.mock_open().return_value
+    in_fp.read.side_effect = chunks + [b'']
+    log_fp = mock.mock_open().return_value
+
+    def mocked_open(filename, *args, **kwargs):
+        if filename == 'fifo_fn.out':
+            return in_fp
+        if filename == handler.log:
+            return log_fp
+        return mock.mock_open(read_data='0').return_value
+
+    handled = []
+    harness = mock.Mock(
+        capture_coverage=False,
+        status=TwisterStatus.NONE,
+        handle=handled.append
+    )
+
+    p = mock.Mock(poll=mock.Mock(return_value=True))
+    mock_thread_update_instance_info = mock.Mock()
+
+    with mock.patch('time.time', side_effect=faux_timer.time), \
+         mock.patch('builtins.open', new=mocked_open), \
+         mock.patch('select.poll', return_value=p), \
+         mock.patch('os.path.exists', return_value=False), \
+         mock.patch('os.unlink', mock.Mock()), \
+         mock.patch('os.mkfifo', mock.Mock()), \
+         mock.patch('twisterlib.handlers.QEMUHandler._thread_get_fifo_names',
+                    mock.Mock(return_value=('fifo_fn.in', 'fifo_fn.out'))), \
+         mock.patch('twisterlib.handlers.QEMUHandler.' \
+                    '_thread_update_instance_info',
+                    mock_thread_update_instance_info):
+        QEMUHandler._thread(
+            handler,
+            100,
+            handler.build_dir,
+            handler.log,
+            handler.fifo_fn,
+            handler.pid_fn,
+            harness,
+            True
+        )
+
+    assert handled == ['a', 'b\x1b[0m', '\u00e9', 'c']
+    # One write per chunk with complete lines
+    assert log_fp.write.call_args_list == [
+        mock.call('a\n'),
+        mock.call('b\r\n'),
+        mock.call('\u00e9\nc\n'),
+    ]
+    mock_thread_update_instance_info.assert_called_once_with(
+        handler,
+        TwisterStatus.NONE,
+        None
+    )
+
+
 TESTDATA_26 = [
     (True, False, TwisterStatus.NONE, True,
      ['No timeout, return code from QEMU (1): 1',
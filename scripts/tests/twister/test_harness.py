@@ -23,6 +23,7 @@ from twisterlib.harness import (
     PytestHarnessException,
     Robot,
     Test,
+    dispatch_pattern,
 )
 from twisterlib.statuses import TwisterStatus
 from twisterlib.testinstance import TestInstance
@@ -815,6 +816,54 @@ def test_get_harness(name):
     assert isinstance(harness_class, Test)
 
 
+TEST_DATA_DISPATCH = [
+    ("Running TESTSUITE suite_a", "suite_start"),
+    ("[00:00:00.000,000] TESTSUITE suite_a succeeded", "suite_end"),
+    ("START - test_case_a", "case_start"),
+    # Precedence goes to the first pattern, not to the leftmost match
+    ("START - test_case_a Running TESTSUITE suite_a", "suite_start"),
+    (" PASS - test_case_a in 0.011 seconds", "case_end"),
+    ("SUITE PASS - 100.00% [suite_a]: pass = 1, fail = 0, skip = 0, total = 1"
+     " duration = 0.011 seconds", "suite_summary"),
+    (" - FAIL - [suite_a.test_case_a] duration = 0.011 seconds", "case_summary"),
+    ("Sleeping for 2 seconds", None),
+    ("Hello World!", None),
+]
+
+
+@pytest.mark.parametrize(
+    "line, exp_kind",
+    TEST_DATA_DISPATCH,
+    ids=[
+        "suite start", "suite end", "case start", "precedence", "case end",
+        "suite summary", "case summary", "markers only", "plain"
+    ],
+)
+def test_test_dispatch_pattern(line, exp_kind):
+    patterns = [
+        ("suite_start", Test.test_suite_start_pattern, True),
+        ("suite_end", Test.test_suite_end_pattern, True),
+        ("case_start", Test.test_case_start_pattern, True),
+        ("case_end", Test.test_case_end_pattern, False),
+        ("suite_summary", Test.test_suite_summary_pattern, False),
+        ("case_summary", Test.test_case_summary_pattern, False),
+    ]
+    # The combined pattern selects the same pattern as trying them in order
+    exp_first = next(
+        (
+            name for name, pattern, search in patterns
+            if (pattern.search(line) if search else pattern.match(line))
+        ),
+        None
+    )
+    assert exp_first == exp_kind
+
+    dispatch_match = dispatch_pattern(patterns).match(line)
+    assert (dispatch_match.lastgroup if dispatch_match else None) == exp_kind
+
+    assert Test.may_be_ztest_line(line) or exp_kind is None
+
+
 TEST_DATA_7 = [
     (
         True,
@@ -6,6 +6,7 @@
 '''
 This test file contains tests for platform.py module of twister
 '''
+import os
 from contextlib import nullcontext
 from unittest import mock
 
@@ -490,8 +491,11 @@ board:
     init_platform = Platform()
     for platform in platforms:
         expected_platform_data = expected_data[platform.name]
+        # the board directories depend on tmp_path
+        assert platform.board_dirs
+        assert all(os.path.isdir(board_dir) for board_dir in platform.board_dirs)
         for attr, default in vars(init_platform).items():
-            if attr in {'name', 'normalized_name', 'supported_toolchains'}:
+            if attr in {'name', 'normalized_name', 'supported_toolchains', 'board_dirs'}:
                 continue
             expected = expected_platform_data.get(attr, default)
             actual = getattr(platform, attr, None)
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for platform_index.py classes' methods
+"""
+
+import time
+
+import pytest
+from twisterlib.platform import Platform, Simulator
+from twisterlib.platform_index import FilterStats, PlatformIndex
+
+
+def make_platform(name, **attrs):
+    platform = Platform()
+    platform.name = name
+    platform.aliases = [name, name.split('/')[0]]
+    for attr, value in attrs.items():
+        setattr(platform, attr, value)
+    return platform
+
+
+@pytest.fixture
+def platforms():
+    return [
+        make_platform(
+            'qemu_x86/atom',
+            arch='x86',
+            vendor='qemu',
+            type='qemu',
+            ram=256,
+            flash=1024,
+            supported={'netif'},
+            supported_toolchains=['zephyr'],
+            simulators=[Simulator({'name': 'qemu'})],
+        ),
+        make_platform(
+            'native_sim/native',
+            arch='posix',
+            vendor='zephyr',
+            type='native',
+            ram=1024,
+            flash=2048,
+            supported={'netif', 'eeprom'},
+            supported_toolchains=['host', 'llvm'],
+            only_tags=['posix'],
+        ),
+        make_platform(
+            'frdm_k64f/mk64f12',
+            arch='arm',
+            vendor='nxp',
+            type='mcu',
+            ram=64,
+            flash=512,
+            supported={'gpio'},
+            supported_toolchains=['zephyr'],
+            ignore_tags=['net'],
+            env=['NXP_ENV'],
+            env_satisfied=False,
+            simulators=[Simulator({'name': 'renode'})],
+        ),
+    ]
+
+
+def test_platformindex_attributes(platforms):
+    index = PlatformIndex(platforms)
+    qemu, native, frdm = (index.bit(p) for p in platforms)
+
+    assert index.all == qemu | native | frdm
+    assert index.by_name['native_sim/native'] == native
+    assert index.by_alias['frdm_k64f'] == frdm
+    assert index.by_arch['x86'] == qemu
+    assert index.by_vendor['nxp'] == frdm
+    assert index.by_type['native'] == index.native == native
+    assert index.by_feature['netif'] == qemu | native
+    assert index.by_toolchain['zephyr'] == qemu | frdm
+    assert index.by_ignore_tag['net'] == frdm
+    assert index.by_only_tag['posix'] == index.has_only_tags == native
+    assert index.env_unsatisfied == frdm
+    assert index.host_arch == native
+    assert index.renode == frdm
+
+
+def test_platformindex_set_operations(platforms):
+    index = PlatformIndex(platforms)
+    qemu, native, frdm = (index.bit(p) for p in platforms)
+
+    assert index.any_of(index.by_arch, ['x86', 'arm', 'unknown']) == qemu | frdm
+    assert index.none_of(index.by_arch, ['x86']) == native | frdm
+    assert index.all_of(index.by_feature, ['netif', 'eeprom']) == native
+    assert index.all_of(index.by_feature, ['netif', 'unknown']) == 0
+
+
+@pytest.mark.parametrize(
+    'limit, expected',
+    [
+        (0, []),
+        (64, []),
+        (65, ['frdm_k64f/mk64f12']),
+        (1025, ['frdm_k64f/mk64f12', 'qemu_x86/atom', 'native_sim/native']),
+    ],
+)
+def test_platformindex_ram_below(platforms, limit, expected):
+    index = PlatformIndex(platforms)
+
+    assert index.ram_below(limit) == index.any_of(index.by_name, expected)
+    # served from the cache the second time
+    assert index.ram_below(limit) == index.any_of(index.by_name, expected)
+
+
+def test_platformindex_flash_below(platforms):
+    index = PlatformIndex(platforms)
+
+    assert index.flash_below(1024) == index.bit(platforms[2])
+
+
+def test_platformindex_sim_name(platforms):
+    assert PlatformIndex(platforms, 'qemu').renode == 0
+
+
+def test_filterstats():
+    stats = FilterStats()
+
+    start = stats.add_time('slow', time.perf_counter() - 2)
+    stats.add_time('fast', start)
+    stats.filtered['fast'] += 3
+
+    lines = stats.report()
+    assert lines[1].split()[0] == 'slow'
+    assert lines[2].split()[0] == 'fast'
+    assert lines[2].split()[2] == '3'
@@ -7,11 +7,17 @@ Tests for quarantine.py classes' methods
 """
 
 import os
+import pickle
 import textwrap
 from unittest import mock
 
 import pytest
-from twisterlib.quarantine import QuarantineData, QuarantineElement, QuarantineException
+from twisterlib.quarantine import (
+    QuarantineData,
+    QuarantineElement,
+    QuarantineException,
+    QuarantineIndex,
+)
 
 TESTDATA_1 = [
     (
@@ -269,3 +275,56 @@ def test_quarantinedata_get_matched_quarantine(
             architecture=architecture,
             simulator_name=simulation
         ) == qlist[expected_idx]
+
+
+def test_quarantineindex_first_match_wins():
+    qlist = [
+        QuarantineElement(scenarios=['kernel.common'], platforms=['qemu_x86']),
+        QuarantineElement(scenarios=[r'kernel\..*'], comment='all kernel tests'),
+        QuarantineElement(platforms=['qemu_.*', 'native_sim'], architectures=['x86']),
+    ]
+    index = QuarantineIndex(qlist)
+
+    assert index.match('kernel.common', 'qemu_x86', 'x86', 'qemu') is qlist[0]
+    assert index.match('kernel.common', 'native_sim', 'posix', 'na') is qlist[1]
+    assert index.match('kernelXcommon', 'qemu_x86', 'x86', 'qemu') is qlist[0]
+    assert index.match('net.socket', 'native_sim', 'x86', 'na') is qlist[2]
+    assert index.match('net.socket', 'native_sim', 'posix', 'na') is None
+    # '.' is a regex, not an exact match
+    assert 'kernel.common' not in index.scenarios.exact
+    assert index.platforms.exact['native_sim'] == 1 << 2
+    assert index.platforms.prefilter is not None
+
+
+def test_quarantineindex_patterns_with_groups():
+    qlist = [
+        QuarantineElement(platforms=[r'(a)\1']),
+        QuarantineElement(platforms=[r'(b)\1']),
+    ]
+    index = QuarantineIndex(qlist)
+
+    assert index.platforms.prefilter is None
+    assert index.match('s', 'bb', 'arch', 'na') is qlist[1]
+    assert index.match('s', 'ab', 'arch', 'na') is None
+
+
+def test_quarantineindex_pickle():
+    qlist = [QuarantineElement(scenarios=['kernel.*'], comment='flaky')]
+    index = QuarantineIndex(qlist)
+    index.match('kernel.common', 'qemu_x86', 'x86', 'qemu')
+
+    restored = pickle.loads(pickle.dumps(index))
+
+    assert restored.match('kernel.common', 'qemu_x86', 'x86', 'qemu').comment == 'flaky'
+    assert restored.match('net.socket', 'qemu_x86', 'x86', 'qemu') is None
+
+
+def test_quarantinedata_extend_rebuilds_index():
+    quarantine_data = QuarantineData([QuarantineElement(platforms=['qemu_x86'])])
+    assert quarantine_data.get_matched_quarantine('s', 'frdm_k64f', 'arm', 'na') is None
+
+    quarantine_data.extend(QuarantineData([QuarantineElement(architectures=['arm'])]))
+
+    assert quarantine_data.get_matched_quarantine(
+        's', 'frdm_k64f', 'arm', 'na'
+    ) is quarantine_data.qlist[1]
@@ -23,6 +23,7 @@ from elftools.elf.sections import SymbolTableSection
 from twisterlib.error import BuildError
 from twisterlib.harness import Pytest
 from twisterlib.runner import CMake, ExecutionCounter, FilterBuilder, ProjectBuilder, TwisterRunner
+from twisterlib.scheduler import DependencyGraph, WorkStealingScheduler
 from twisterlib.statuses import TwisterStatus
 
 # pylint: disable=no-name-in-module
@@ -462,6 +463,7 @@ def test_cmake_run_cmake(
     cmake.instance = instance_mock
     cmake.options = mock.Mock()
     cmake.options.disable_warnings_as_errors = not error_warns
+    cmake.options.binding_cache = None
     cmake.options.overflow_as_errors = False
     cmake.env = mock.Mock()
     cmake.env.generator = 'dummy_generator'
@@ -723,7 +725,8 @@ def test_filterbuilder_parse_generated(
          mock.patch('builtins.open', mock_open), \
          mock.patch('expr_parser.parse', mock_parser), \
          mock.patch('pickle.load', mock_pickle), \
-         mock.patch('os.path.exists', return_value=edt_exists), \
+         mock.patch('os.path.exists',
+                    lambda path: edt_exists and not path.endswith('edt.bin')), \
          mock.patch('os.environ', environ_mock), \
          pytest.raises(expected_return) if \
              isinstance(parse_results, type) and \
@@ -743,6 +746,36 @@ def test_filterbuilder_parse_generated(
     assert result == expected_return
 
 
+def test_filterbuilder_parse_generated_edt_bin(mocked_jobserver):
+    testsuite_mock = mock.Mock()
+    testsuite_mock.name = 'dummy.testsuite.name'
+    testsuite_mock.filter = 'dt_compat_enabled("dummy")'
+    platform_mock = mock.Mock()
+    platform_mock.name = 'other'
+    platform_mock.arch = 'dummy arch'
+    build_dir = os.path.join('build', 'dir')
+
+    fb = FilterBuilder(testsuite_mock, platform_mock, os.path.join('source', 'dir'),
+                       build_dir, mocked_jobserver)
+    fb.instance = mock.Mock(sysbuild=None, toolchain='zephyr')
+    edt_mock = mock.Mock()
+
+    with mock.patch('twisterlib.runner.CMakeCache.from_file',
+                    side_effect=FileNotFoundError), \
+         mock.patch('os.path.exists', return_value=True), \
+         mock.patch('os.environ', {}), \
+         mock.patch('twisterlib.runner.edtbin.load',
+                    return_value=edt_mock) as load_mock, \
+         mock.patch('pickle.load') as pickle_mock, \
+         mock.patch('expr_parser.parse', return_value=True) as parse_mock:
+        result = fb.parse_generated(['dts'])
+
+    load_mock.assert_called_once_with(os.path.join(build_dir, 'zephyr', 'edt.bin'))
+    pickle_mock.assert_not_called()
+    assert parse_mock.call_args.args[2] is edt_mock
+    assert result == {os.path.join('other', 'zephyr', 'dummy.testsuite.name'): False}
+
+
 TESTDATA_4 = [
     (False, False, [f"see: {os.path.join('dummy', 'path', 'dummy_file.log')}"]),
     (True, False, [os.path.join('dummy', 'path', 'dummy_file.log'),
@@ -1549,6 +1582,78 @@ def test_projectbuilder_process(
         pb.instance.add_missing_case_status.assert_called_with(*expected_missing)
 
 
+@pytest.mark.parametrize(
+    'op, cached, cmake_filtered, expected_cmake_calls, expected_put, expected_next_op',
+    [
+        ('filter', True, False, 0, None, 'report'),
+        ('filter', False, True, 0, None, 'cmake'),
+        ('filter', None, True, 1, True, 'report'),
+        ('filter', None, False, 1, False, 'cmake'),
+        ('cmake', True, False, 0, None, 'report'),
+        ('cmake', False, False, 1, None, 'build'),
+        ('cmake', None, True, 1, True, 'report'),
+    ],
+    ids=[
+        'filter, cached filtered', 'filter, cached not filtered',
+        'filter, miss filtered', 'filter, miss not filtered',
+        'cmake, cached filtered', 'cmake, cached not filtered',
+        'cmake, miss filtered',
+    ]
+)
+def test_projectbuilder_process_filter_cache(
+    mocked_jobserver,
+    tmp_path,
+    op,
+    cached,
+    cmake_filtered,
+    expected_cmake_calls,
+    expected_put,
+    expected_next_op
+):
+    instance_mock = mock.Mock()
+    instance_mock.name = 'dummy instance name'
+    instance_mock.status = TwisterStatus.NONE
+    instance_mock.filter_stages = ['dts']
+    instance_mock.testsuite.filter = 'dt_compat_enabled("vnd,foo")'
+    env_mock = mock.Mock()
+
+    pb = ProjectBuilder(instance_mock, env_mock, mocked_jobserver)
+    pb.options = mock.Mock()
+    pb.options.cmake_only = False
+    pb.options.extra_args = []
+    pb.options.outdir = tmp_path
+    pb.options.log_file = None
+    pb.options.log_level = "DEBUG"
+    pb.filter_cache = mock.Mock(
+        key=mock.Mock(return_value='dummy key'),
+        get=mock.Mock(return_value=cached),
+    )
+    pb.cmake = mock.Mock(return_value={'filter': {'dummy instance name': cmake_filtered}})
+
+    processing_queue_mock = mock.Mock()
+    results_mock = mock.Mock()
+    lock_mock = mock.Mock(
+        __enter__=mock.Mock(return_value=(mock.Mock(), mock.Mock())),
+        __exit__=mock.Mock(return_value=None)
+    )
+
+    pb.process(processing_queue_mock, mock.Mock(), {'op': op}, lock_mock, results_mock)
+
+    assert pb.cmake.call_count == expected_cmake_calls
+    if expected_put is None:
+        pb.filter_cache.put.assert_not_called()
+    else:
+        pb.filter_cache.put.assert_called_once_with(
+            'dummy key', expected_put, 'dummy instance name'
+        )
+    processing_queue_mock.append.assert_called_with(
+        {'op': expected_next_op, 'test': instance_mock}
+    )
+    if expected_next_op == 'report':
+        assert pb.instance.status == TwisterStatus.FILTER
+        assert pb.instance.reason == 'runtime filter'
+
+
 TESTDATA_7 = [
     (
         True,
@@ -2455,6 +2560,10 @@ def test_projectbuilder_calc_size(
                size_calc_mock.get_available_rom()
         assert instance_mock.metrics['available_ram'] == \
                size_calc_mock.get_available_ram()
+        assert instance_mock.metrics['memory_regions'] == \
+               size_calc_mock.get_memory_regions()
+        assert instance_mock.metrics['section_sizes'] == \
+               size_calc_mock.get_section_sizes()
 
     if expect_zeroes:
         assert instance_mock.metrics['used_ram'] == 0
@@ -2509,10 +2618,20 @@ def test_twisterrunner_run(
     tr.options.retry_build_errors = True
     tr.options.jobs = None
     tr.options.build_only = None
+    tr.options.filter_cache = None
     for k, v in options.items():
         setattr(tr.options, k, v)
+    processing_instance = mock.Mock(
+        metrics={'k': 'v2'},
+        execution_time=30
+    )
+    processing_instance.name='dummy instance'
+
+    def mock_execute(processing_ready):
+        processing_ready[processing_instance.name] = processing_instance
+
     tr.update_counting_before_pipeline = mock.Mock()
-    tr.execute = mock.Mock()
+    tr.execute = mock.Mock(side_effect=mock_execute)
     tr.show_brief = mock.Mock()
 
     gnumakejobserver_mock = mock.Mock()
@@ -2520,18 +2639,6 @@ def test_twisterrunner_run(
     jobclient_mock = mock.Mock()
     jobclient_mock().name='JobClient'
 
-    processing_queue = deque()
-    processing_ready = {}
-    processing_instance = mock.Mock(
-        metrics={'k': 'v2'},
-        execution_time=30
-    )
-    processing_instance.name='dummy instance'
-    processing_ready[processing_instance.name] = processing_instance
-    manager_mock = mock.Mock()
-    manager_mock().deque = mock.Mock(return_value=processing_queue)
-    manager_mock().get_dict = mock.Mock(return_value=processing_ready)
-
     results_mock = mock.Mock()
     results_mock().error = 1
     results_mock().iteration = 0
@@ -2545,7 +2652,6 @@ def test_twisterrunner_run(
     results_mock().iteration_increment = iteration_increment
 
     with mock.patch('twisterlib.runner.ExecutionCounter', results_mock), \
-         mock.patch('twisterlib.runner.BaseManager', manager_mock), \
          mock.patch('twisterlib.runner.GNUMakeJobClient.from_environ',
                     mock_client_from_environ), \
          mock.patch('twisterlib.runner.GNUMakeJobServer',
@@ -2775,14 +2881,16 @@ TESTDATA_19 = [
 )
 def test_twisterrunner_pipeline_mgr(mocked_jobserver, platform):
     counter = 0
-    def mock_pop():
+    def mock_next_task(worker):
         nonlocal counter
         counter += 1
         if counter > 5:
-            raise IndexError
-        return {'test': mock.Mock(required_applications=[])}
+            return None
+        return (f'dummy{counter}', 'cmake')
 
-    instances = {}
+    instances = {
+        f'dummy{i}': mock.Mock(required_applications=[]) for i in range(1, 6)
+    }
     suites = []
     env_mock = mock.Mock()
 
@@ -2793,23 +2901,54 @@ def test_twisterrunner_pipeline_mgr(mocked_jobserver, platform):
         )
     )
 
-    processing_queue_mock = mock.Mock()
-    processing_queue_mock.pop = mock.Mock(side_effect=mock_pop)
-    processing_ready_mock = mock.Mock()
+    scheduler_mock = mock.Mock(aborted=False)
+    scheduler_mock.next_task = mock.Mock(side_effect=mock_next_task)
     lock_mock = mock.Mock()
     results_mock = mock.Mock()
 
     with mock.patch('sys.platform', platform), \
          mock.patch('twisterlib.runner.ProjectBuilder',\
                     return_value=mock.Mock()) as pb:
-        tr.pipeline_mgr(processing_queue_mock, processing_ready_mock, lock_mock, results_mock)
+        tr.pipeline_mgr(scheduler_mock, 0, lock_mock, results_mock)
 
     assert len(pb().process.call_args_list) == 5
+    assert [c.args[2] for c in pb().process.call_args_list] == \
+           [{'op': 'cmake', 'test': instances[f'dummy{i}']} for i in range(1, 6)]
 
     if platform == 'linux':
         tr.jobserver.get_job.assert_called_once()
 
 
+def test_twisterrunner_process_tasks_required_apps():
+    instances = {
+        'dependent': mock.Mock(required_applications=['app'], required_build_dirs=[]),
+        'app': mock.Mock(required_applications=[], build_dir='/path/to/app'),
+    }
+    env_mock = mock.Mock()
+    env_mock.options.quit_on_failure = False
+
+    tr = TwisterRunner(instances, [], env=env_mock)
+    graph = DependencyGraph()
+    graph.add('dependent', 'app')
+    scheduler = WorkStealingScheduler(instances, 1, graph)
+    scheduler.seed([('dependent', 'cmake'), ('app', 'cmake')])
+
+    processed = []
+    def mock_process(processing_queue, processing_ready, task, lock, results):
+        name = next(k for k, v in instances.items() if v is task['test'])
+        processed.append(name)
+        instance = mock.Mock(status=TwisterStatus.PASS)
+        with mock.patch.object(processing_ready, '_finished'):
+            processing_ready.update({name: instance})
+
+    with mock.patch('twisterlib.runner.ProjectBuilder') as pb:
+        pb().process = mock.Mock(side_effect=mock_process)
+        tr.process_tasks(scheduler, 0, mock.Mock(), mock.Mock())
+
+    assert processed == ['app', 'dependent']
+    assert instances['dependent'].required_build_dirs == ['/path/to/app']
+
+
 def test_twisterrunner_execute(caplog):
     counter = 0
     def mock_join():
@@ -2827,13 +2966,12 @@ def test_twisterrunner_execute(caplog):
     tr.jobs = 5
 
     process_mock = mock.Mock()
+    process_mock().is_alive = mock.Mock(return_value=False)
     process_mock().join = mock.Mock(side_effect=mock_join)
     process_mock().exitcode = 0
-    pipeline_mock = mock.Mock()
-    done_mock = mock.Mock()
 
     with mock.patch('twisterlib.runner.Process', process_mock):
-        tr.execute(pipeline_mock, done_mock)
+        tr.execute({})
 
     assert 'Execution interrupted' in caplog.text
 
@@ -2862,33 +3000,6 @@ def test_twisterrunner_get_cmake_filter_stages(filter, expected_result):
     assert sorted(result) == sorted(expected_result)
 
 
-@pytest.mark.parametrize(
-    'required_apps, processing_ready_keys, expected_result',
-    [
-        (['app1', 'app2'], ['app1', 'app2'], True),  # all apps ready
-        (['app1', 'app2', 'app3'], ['app1', 'app2'], False),  # some apps missing
-        ([], [], True),  # no required apps
-        (['app1'], [], False),  # single app missing
-    ],
-    ids=['all_ready', 'some_missing', 'no_apps', 'single_missing']
-)
-def test_twisterrunner_are_required_apps_ready(required_apps, processing_ready_keys, expected_result):
-    """Test _are_required_apps_ready method with various scenarios"""
-    instances = {}
-    suites = []
-    env_mock = mock.Mock()
-    tr = TwisterRunner(instances, suites, env=env_mock)
-
-    instance_mock = mock.Mock()
-    instance_mock.required_applications = required_apps
-
-    processing_ready = {key: mock.Mock() for key in processing_ready_keys}
-
-    result = tr._are_required_apps_ready(instance_mock, processing_ready)
-
-    assert result is expected_result
-
-
 @pytest.mark.parametrize(
     'app_statuses, expected_result',
     [
@@ -2897,8 +3008,10 @@ def test_twisterrunner_are_required_apps_ready(required_apps, processing_ready_k
         ([TwisterStatus.PASS, TwisterStatus.NOTRUN], True),  # mixed pass/notrun
         ([TwisterStatus.PASS, TwisterStatus.FAIL], False),  # one failed
         ([TwisterStatus.ERROR], False),  # single error
+        ([TwisterStatus.PASS, None], False),  # one not processed
     ],
-    ids=['all_pass', 'all_notrun', 'mixed_pass_notrun', 'one_fail', 'single_error']
+    ids=['all_pass', 'all_notrun', 'mixed_pass_notrun', 'one_fail', 'single_error',
+         'not_processed']
 )
 def test_twisterrunner_are_all_required_apps_success(app_statuses, expected_result):
     """Test _are_all_required_apps_success method with various app statuses"""
@@ -2913,6 +3026,8 @@ def test_twisterrunner_are_all_required_apps_success(app_statuses, expected_resu
 
     processing_ready = {}
     for i, status in enumerate(app_statuses):
+        if status is None:
+            continue
         app_instance = mock.Mock()
         app_instance.status = status
         app_instance.reason = f"Reason for app{i + 1}"
@@ -2926,17 +3041,17 @@ def test_twisterrunner_are_all_required_apps_success(app_statuses, expected_resu
     'required_apps, ready_apps, expected_result, expected_actions',
     [
         ([], {}, True,
-         {'requeue': False, 'skip': False, 'build_dirs': 0}),
+         {'skip': False, 'build_dirs': 0}),
         (['app1'], {}, False,
-         {'requeue': True, 'skip': False, 'build_dirs': 0}),
+         {'skip': True, 'build_dirs': 0}),
         (['app1', 'app2'], {'app1': TwisterStatus.PASS}, False,
-         {'requeue': True, 'skip': False, 'build_dirs': 0}),
+         {'skip': True, 'build_dirs': 0}),
         (['app1'], {'app1': TwisterStatus.FAIL}, False,
-         {'requeue': False, 'skip': True, 'build_dirs': 0}),
+         {'skip': True, 'build_dirs': 0}),
         (['app1', 'app2'], {'app1': TwisterStatus.PASS, 'app2': TwisterStatus.NOTRUN}, True,
-         {'requeue': False, 'skip': False, 'build_dirs': 2}),
+         {'skip': False, 'build_dirs': 2}),
     ],
-    ids=['no_apps', 'not_ready_single_job', 'not_ready_multi_job',
+    ids=['no_apps', 'not_processed_single', 'not_processed_one_of_two',
          'apps_failed', 'apps_success']
 )
 def test_twisterrunner_are_required_apps_processed(required_apps, ready_apps,
@@ -2970,16 +3085,11 @@ def test_twisterrunner_are_required_apps_processed(required_apps, ready_apps,
         processing_ready[app_name] = app_instance
 
     processing_queue = deque()
-    task = {'test': instance_mock}
 
-    result = tr.are_required_apps_processed(instance_mock, processing_queue, processing_ready, task)
+    result = tr.are_required_apps_processed(instance_mock, processing_queue, processing_ready)
 
     assert result is expected_result
 
-    if expected_actions['requeue']:
-        assert len(processing_queue) == 1
-        assert processing_queue[0] == task
-
     if expected_actions['skip']:
         assert instance_mock.status == TwisterStatus.SKIP
         assert instance_mock.reason == "Required application failed"
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for scheduler.py classes' methods
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from twisterlib.scheduler import (
+    PIPELINE_OPS,
+    DependencyGraph,
+    ReadyInstance,
+    WorkStealingScheduler,
+)
+from twisterlib.statuses import TwisterStatus
+
+
+def drain(scheduler, worker):
+    tasks = []
+    while (task := scheduler.next_task(worker)) is not None:
+        tasks.append(task)
+    return tasks
+
+
+@pytest.mark.parametrize('op', PIPELINE_OPS)
+def test_scheduler_encode_decode(op):
+    scheduler = WorkStealingScheduler(['a', 'b', 'c'], 2)
+
+    task_id = scheduler.encode('c', op)
+
+    assert isinstance(task_id, int)
+    assert scheduler.decode(task_id) == ('c', op)
+
+
+def test_scheduler_seed_round_robin():
+    names = [f'inst{i}' for i in range(5)]
+    scheduler = WorkStealingScheduler(names, 2)
+    scheduler.seed((name, 'cmake') for name in names)
+
+    assert scheduler.next_task(0) == ('inst0', 'cmake')
+    assert scheduler.next_task(1) == ('inst1', 'cmake')
+    assert scheduler.next_task(0) == ('inst2', 'cmake')
+    assert scheduler.next_task(0) == ('inst4', 'cmake')
+    assert scheduler.stats() == {'dispatched': 4, 'stolen': 0, 'steals': 0, 'released': 0}
+
+
+def test_scheduler_steal_keeps_ranges_disjoint():
+    names = [f'inst{i}' for i in range(9)]
+    scheduler = WorkStealingScheduler(names, 3)
+    scheduler.seed([(name, 'cmake') for name in names[:6]])
+    # worker 2 owns inst2 and inst5
+    assert scheduler.next_task(2) == ('inst2', 'cmake')
+    assert scheduler.next_task(2) == ('inst5', 'cmake')
+    # worker 2 has to steal now, the first victim is worker 0 (inst0, inst3)
+    assert scheduler.next_task(2) == ('inst3', 'cmake')
+    assert scheduler.stats()['steals'] == 1
+
+    seen = drain(scheduler, 0) + drain(scheduler, 1) + drain(scheduler, 2)
+    assert sorted(seen) == [('inst0', 'cmake'), ('inst1', 'cmake'), ('inst4', 'cmake')]
+
+
+def test_scheduler_all_tasks_dispatched_once():
+    names = [f'inst{i}' for i in range(100)]
+    scheduler = WorkStealingScheduler(names, 4)
+    scheduler.seed((name, 'filter') for name in names)
+
+    seen = []
+    worker = 0
+    while (task := scheduler.next_task(worker)) is not None:
+        seen.append(task[0])
+        # only two workers ever ask for work, the others are stolen from
+        worker = 1 - worker
+
+    assert sorted(seen) == sorted(names)
+    assert scheduler.stats()['dispatched'] == 100
+    assert scheduler.stats()['steals'] > 0
+
+
+def test_scheduler_abort():
+    scheduler = WorkStealingScheduler(['a', 'b'], 1)
+    scheduler.seed([('a', 'cmake'), ('b', 'cmake')])
+
+    assert not scheduler.aborted
+    scheduler.abort()
+
+    assert scheduler.aborted
+    assert scheduler.next_task(0) is None
+
+
+def test_readytable():
+    scheduler = WorkStealingScheduler(['a', 'b', 'c'], 1)
+    ready = scheduler.ready
+
+    assert ready.get('a') is None
+    assert ready.get('unknown') is None
+
+    ready.mark('a', TwisterStatus.SKIP)
+    instance = SimpleNamespace(name='b', status=TwisterStatus.PASS)
+    ready.update({'b': instance})
+
+    assert ready.get('a') == ReadyInstance('a', TwisterStatus.SKIP)
+    assert ready.get('b') == ReadyInstance('b', TwisterStatus.PASS)
+    assert ready.get('c') is None
+
+    collected = {}
+    assert ready.collect(collected, timeout=5) == 1
+    assert collected['b'].name == 'b'
+    assert ready.collect(collected, timeout=0) == 0
+
+
+def test_dependencygraph_priority():
+    graph = DependencyGraph()
+    # a <- b <- c <- d, and a <- e
+    graph.add('b', 'a')
+    graph.add('c', 'b')
+    graph.add('d', 'c')
+    graph.add('e', 'a')
+
+    assert graph.requires['d'] == ['c']
+    assert sorted(graph.dependents['a']) == ['b', 'e']
+    assert graph.priority('a') == 4
+    assert graph.priority('b') == 3
+    assert graph.priority('e') == 1
+    assert graph.priority('unrelated') == 1
+
+
+def test_dependencygraph_priority_cycle():
+    graph = DependencyGraph()
+    graph.add('a', 'b')
+    graph.add('b', 'a')
+
+    # the walk stops when it gets back to 'a', which counts as a leaf then
+    assert graph.priority('a') == 3
+
+
+def test_scheduler_critical_path_first():
+    graph = DependencyGraph()
+    graph.add('chain2', 'chain1')
+    graph.add('chain3', 'chain2')
+    names = ['single1', 'single2', 'chain1', 'chain2', 'chain3']
+    scheduler = WorkStealingScheduler(names, 1, graph)
+    scheduler.seed((name, 'cmake') for name in names)
+
+    # the dependents are held back, the head of the chain starts first
+    assert scheduler.next_task(0) == ('chain1', 'cmake')
+    assert scheduler.next_task(0) == ('single1', 'cmake')
+
+
+def test_scheduler_releases_dependents():
+    graph = DependencyGraph()
+    graph.add('dependent', 'app1')
+    graph.add('dependent', 'app2')
+    graph.add('other', 'app1')
+    names = ['app1', 'app2', 'dependent', 'other']
+    scheduler = WorkStealingScheduler(names, 2, graph)
+    scheduler.seed((name, 'cmake') for name in names)
+
+    assert scheduler.next_task(0) == ('app1', 'cmake')
+    assert scheduler.next_task(0) == ('app2', 'cmake')
+    assert scheduler.stats()['released'] == 0
+
+    scheduler.ready.update({'app1': SimpleNamespace(name='app1', status=TwisterStatus.PASS)})
+    assert scheduler.next_task(1) == ('other', 'cmake')
+
+    scheduler.ready.update({'app2': SimpleNamespace(name='app2', status=TwisterStatus.FAIL)})
+    assert scheduler.next_task(1) == ('dependent', 'cmake')
+    assert scheduler.next_task(0) is None
+    assert scheduler.stats()['released'] == 2
+
+
+def test_scheduler_required_app_not_queued():
+    graph = DependencyGraph()
+    graph.add('dependent', 'app')
+    scheduler = WorkStealingScheduler(['app', 'dependent'], 1, graph)
+    # the required application was processed in a previous iteration
+    scheduler.seed([('dependent', 'run')])
+
+    assert scheduler.next_task(0) == ('dependent', 'run')
+    assert scheduler.next_task(0) is None
+
+
+def test_scheduler_abort_wakes_waiting_worker():
+    graph = DependencyGraph()
+    graph.add('dependent', 'app')
+    scheduler = WorkStealingScheduler(['app', 'dependent'], 2, graph)
+    scheduler.seed([('app', 'cmake'), ('dependent', 'cmake')])
+    assert scheduler.next_task(0) == ('app', 'cmake')
+
+    def abort_later(*args, **kwargs):
+        scheduler._aborted.value = 1
+
+    # the second worker has to wait for 'app', aborting makes it give up
+    scheduler._released_cond.wait = abort_later
+    assert scheduler.next_task(1) is None
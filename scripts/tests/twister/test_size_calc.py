@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# Copyright The Zephyr Project Contributors
+#
+# SPDX-License-Identifier: Apache-2.0
+"""
+Tests for size_calc.py classes' methods
+"""
+
+import struct
+
+import pytest
+from twisterlib.size_calc import ElfReader, SizeCalculator, read_memory_regions
+
+SHT_PROGBITS = 1
+SHT_SYMTAB = 2
+SHT_STRTAB = 3
+SHT_NOBITS = 8
+SHF_WRITE = 0x1
+SHF_ALLOC = 0x2
+SHF_EXECINSTR = 0x4
+
+MAP = """\
+Archive member included to satisfy reference by file (symbol)
+
+Memory Configuration
+
+Name             Origin             Length             Attributes
+FLASH            0x0000000000010000 0x0000000000010000 xr
+SRAM             0x0000000000080000 0x0000000000008000 rw
+*default*        0x0000000000000000 0xffffffffffffffff
+
+Linker script and memory map
+
+"""
+
+
+def make_elf(symbols, is_64=True, order='<'):
+    # Lays out an executable like a Zephyr build with "text" in FLASH, "datas"
+    # in SRAM loaded from FLASH, "bss" in SRAM and a non-allocated
+    # ".comment" section, with the given symbol names
+    fmt = {
+        True: ('16sHHIQQQIHHHHHH', 'IIQQQQIIQQ', 'IIQQQQQQ', 'IBBHQQ'),
+        False: ('16sHHIIIIIHHHHHH', 'IIIIIIIIII', 'IIIIIIII', 'IIIBBH'),
+    }[is_64]
+    header, section, segment, symbol = (struct.Struct(order + f) for f in fmt)
+
+    shstrtab = b'\0text\0datas\0bss\0.comment\0.symtab\0.strtab\0.shstrtab\0'
+    strtab = b'\0' + b''.join(name.encode() + b'\0' for name in symbols)
+    symtab = b'\0' * symbol.size
+    for name in symbols:
+        st_name = strtab.index(name.encode() + b'\0')
+        if is_64:
+            symtab += symbol.pack(st_name, 0x11, 0, 1, 0x10000, 4)
+        else:
+            symtab += symbol.pack(st_name, 0x10000, 4, 0x11, 0, 1)
+
+    # name, type, flags, address, contents, size, link, entry size
+    sections = [
+        ('text', SHT_PROGBITS, SHF_ALLOC | SHF_EXECINSTR, 0x10000, b'\x90' * 0x100, 0, 0),
+        ('datas', SHT_PROGBITS, SHF_ALLOC | SHF_WRITE, 0x80000, b'\1' * 0x20, 0, 0),
+        ('bss', SHT_NOBITS, SHF_ALLOC | SHF_WRITE, 0x80020, 0x40, 0, 0),
+        ('.comment', SHT_PROGBITS, 0, 0, b'GCC\0', 0, 0),
+        ('.symtab', SHT_SYMTAB, 0, 0, symtab, 6, symbol.size),
+        ('.strtab', SHT_STRTAB, 0, 0, strtab, 0, 0),
+        ('.shstrtab', SHT_STRTAB, 0, 0, shstrtab, 0, 0),
+    ]
+
+    phoff = header.size
+    body_start = phoff + 2 * segment.size
+    body = bytearray()
+    headers = [section.pack(*[0] * 10)]
+    offsets = {}
+    for name, sh_type, flags, addr, contents, link, entsize in sections:
+        offset = body_start + len(body)
+        if sh_type == SHT_NOBITS:
+            size = contents
+        else:
+            size = len(contents)
+            body += contents
+        offsets[name] = offset
+        headers.append(
+            section.pack(
+                shstrtab.index(name.encode() + b'\0'),
+                sh_type,
+                flags,
+                addr,
+                offset,
+                size,
+                link,
+                0,
+                1,
+                entsize,
+            )
+        )
+    shoff = body_start + len(body)
+
+    def load(offset, vaddr, paddr, filesz, memsz):
+        if is_64:
+            return segment.pack(1, 5, offset, vaddr, paddr, filesz, memsz, 0x10)
+        return segment.pack(1, offset, vaddr, paddr, filesz, memsz, 5, 0x10)
+
+    segments = load(offsets['text'], 0x10000, 0x10000, 0x100, 0x100)
+    segments += load(offsets['datas'], 0x80000, 0x10100, 0x20, 0x60)
+
+    ident = b'\x7fELF' + bytes([2 if is_64 else 1, 1 if order == '<' else 2, 1])
+    elf_header = header.pack(
+        ident,
+        2,
+        62 if is_64 else 3,
+        1,
+        0x10000,
+        phoff,
+        shoff,
+        0,
+        header.size,
+        segment.size,
+        2,
+        section.size,
+        len(headers),
+        len(headers) - 1,
+    )
+    return elf_header + segments + bytes(body) + b''.join(headers)
+
+
+@pytest.mark.parametrize('is_64', [True, False], ids=['elf64', 'elf32'])
+@pytest.mark.parametrize('order', ['<', '>'], ids=['little-endian', 'big-endian'])
+def test_elf_reader(tmp_path, is_64, order):
+    elf_file = tmp_path / 'zephyr.elf'
+    elf_file.write_bytes(make_elf(['main', 'CONFIG_XIP', 'z_main_thread'], is_64, order))
+
+    with ElfReader(elf_file) as elf:
+        sections = {s['name']: s for s in elf.sections}
+        assert list(sections) == [
+            '',
+            'text',
+            'datas',
+            'bss',
+            '.comment',
+            '.symtab',
+            '.strtab',
+            '.shstrtab',
+        ]
+        assert [
+            (elf.load_address(sections[name]), sections[name]['addr'], sections[name]['size'])
+            for name in ('text', 'datas', 'bss', '.comment')
+        ] == [
+            (0x10000, 0x10000, 0x100),
+            (0x10100, 0x80000, 0x20),
+            (0x10120, 0x80020, 0x40),
+            (0, 0, 4),
+        ]
+
+        assert elf.has_symbols()
+        assert elf.has_symbol_containing('CONFIG_XIP')
+        assert elf.has_symbol_containing('main')
+        # Part of a section name, but not of a symbol name
+        assert not elf.has_symbol_containing('datas')
+
+
+def test_elf_reader_shared_string(tmp_path):
+    elf_file = tmp_path / 'zephyr.elf'
+    elf_file.write_bytes(make_elf(['foo_CONFIG_XIP', 'bar']))
+
+    with ElfReader(elf_file) as elf:
+        assert elf.has_symbol_containing('CONFIG_XIP')
+        assert not elf.has_symbol_containing('baz')
+
+
+def test_read_memory_regions(tmp_path):
+    map_file = tmp_path / 'zephyr.map'
+    map_file.write_text(MAP)
+
+    assert read_memory_regions(map_file) == [
+        {'name': 'FLASH', 'origin': 0x10000, 'length': 0x10000},
+        {'name': 'SRAM', 'origin': 0x80000, 'length': 0x8000},
+    ]
+
+    map_file.write_text('Linker script and memory map\n')
+    assert read_memory_regions(map_file) == []
+
+
+@pytest.mark.parametrize(
+    'symbols, used_ram, used_rom',
+    [(['main', 'CONFIG_XIP'], 0x60, 0x120), (['main'], 0x160, 0x120)],
+    ids=['xip', 'no xip'],
+)
+def test_size_calculator(tmp_path, symbols, used_ram, used_rom):
+    elf_file = tmp_path / 'zephyr.elf'
+    elf_file.write_bytes(make_elf(symbols))
+    (tmp_path / 'zephyr.map').write_text(MAP)
+
+    size_calc = SizeCalculator(str(elf_file), [])
+
+    assert size_calc.is_xip == ('CONFIG_XIP' in symbols)
+    assert size_calc.get_used_ram() == used_ram
+    assert size_calc.get_used_rom() == used_rom
+    assert size_calc.sections == [
+        {'name': 'text', 'load_addr': 0x10000, 'size': 0x100, 'virt_addr': 0x10000, 'type': 'ro'},
+        {'name': 'datas', 'load_addr': 0x10100, 'size': 0x20, 'virt_addr': 0x80000, 'type': 'rw'},
+        {'name': 'bss', 'load_addr': 0x10120, 'size': 0x40, 'virt_addr': 0x80020, 'type': 'alloc'},
+    ]
+    assert size_calc.get_section_sizes() == {'text': 0x100, 'datas': 0x20, 'bss': 0x40}
+    assert size_calc.get_memory_regions() == {
+        'FLASH': {'used': 0x120, 'size': 0x10000},
+        'SRAM': {'used': 0x60, 'size': 0x8000},
+    }
+
+
+def test_size_calculator_no_symbols(tmp_path):
+    elf_file = tmp_path / 'zephyr.elf'
+    elf = bytearray(make_elf([]))
+    # Turn .symtab, the 6th section, into a string table
+    shoff = struct.unpack_from('<Q', elf, 0x28)[0]
+    struct.pack_into('<I', elf, shoff + 5 * 64 + 4, SHT_STRTAB)
+    elf_file.write_bytes(elf)
+
+    with pytest.raises(SystemExit) as e:
+        SizeCalculator(str(elf_file), [])
+    assert e.value.code == 2
@@ -196,6 +196,9 @@ def test_apply_filters_part1(class_testplan, all_testsuites_dict, platforms_list
     filtered_instances = list(filter(lambda item:  item.status == TwisterStatus.FILTER, plan.instances.values()))
     for d in filtered_instances:
         assert d.reason == expected_discards
+    if filtered_instances:
+        assert plan.filter_stats.filtered
+        assert sum(plan.filter_stats.filtered.values()) >= len(filtered_instances)
 
 TESTDATA_PART2 = [
     ("runnable", "True", "Not runnable on device"),
@@ -300,6 +303,8 @@ def test_apply_changes_for_required_applications(testplan_with_one_instance: Tes
     plan.apply_changes_for_required_applications()
     # Check that the required application was added to the instance
     assert testinstance.required_applications[0] == testinstance_req.name
+    assert plan.required_apps_graph.requires[testinstance.name] == [testinstance_req.name]
+    assert plan.required_apps_graph.dependents[testinstance_req.name] == [testinstance.name]
 
 
 def test_apply_changes_for_required_applications_missing_app(testplan_with_one_instance: TestPlan):
@@ -681,7 +686,9 @@ def test_testplan_discover(
         test_pattern=[],
         test='ts1',
         quarantine_list=[tmp_path / qf for qf in ql],
-        quarantine_verify=qv
+        quarantine_verify=qv,
+        jobs=1,
+        scan_cache=None
     )
     testplan.testsuites = {
         'ts1': mock.Mock(id=1),
@@ -1523,6 +1530,10 @@ def test_testplan_load_from_file(caplog, device_testing, expected_tfilter):
             "available_ram": 12278,
             "used_rom": 1024,
             "available_rom": 1047552,
+            "memory_regions": {
+                "FLASH": {"used": 1024, "size": 1048576}
+            },
+            "section_sizes": {"text": 1000, "bss": 4096},
             "status": "passed",
             "toolchain": "zephyr",
             "reason": "OK",
@@ -1615,7 +1626,9 @@ def test_testplan_load_from_file(caplog, device_testing, expected_tfilter):
                 'used_ram': 4096,
                 'used_rom': 1024,
                 'available_ram': 12278,
-                'available_rom': 1047552
+                'available_rom': 1047552,
+                'memory_regions': {'FLASH': {'used': 1024, 'size': 1048576}},
+                'section_sizes': {'text': 1000, 'bss': 4096}
             },
             'retries': 0,
             'toolchain': 'zephyr',
@@ -15,6 +15,7 @@ import pytest
 from twisterlib.error import TwisterException, TwisterRuntimeError
 from twisterlib.statuses import TwisterStatus
 from twisterlib.testsuite import (
+    ScanCache,
     ScanPathResult,
     TestCase,
     TestSuite,
@@ -23,6 +24,7 @@ from twisterlib.testsuite import (
     find_c_files_in,
     scan_file,
     scan_testsuite_path,
+    scan_testsuite_paths,
 )
 
 from . import ZEPHYR_BASE
@@ -678,6 +680,70 @@ def test_scan_testsuite_path(
     )
 
 
+def test_scancache(tmp_path):
+    source = tmp_path / 'test.c'
+    source.write_text('ZTEST_SUITE(feature, NULL, NULL, NULL, NULL, NULL);\n'
+                      'ZTEST(feature, test_a)\n{\n}\n')
+    cache_file = tmp_path / 'cache' / 'scan.json'
+
+    cache = ScanCache(str(cache_file))
+    result = cache.scan(str(source))
+    assert result.matches == ['feature.a']
+    cache.save()
+    assert cache_file.exists()
+    assert cache.updates == {}
+
+    cache = ScanCache(str(cache_file))
+    with mock.patch('twisterlib.testsuite.scan_file') as mock_sf:
+        assert cache.scan(str(source)) == result
+    mock_sf.assert_not_called()
+
+    # a modified file is scanned again
+    source.write_text('ZTEST_SUITE(feature, NULL, NULL, NULL, NULL, NULL);\n'
+                      'ZTEST(feature, test_a)\n{\n}\n'
+                      'ZTEST(feature, test_b)\n{\n}\n')
+    os.utime(source, ns=(0, 0))
+    assert cache.scan(str(source)).matches == ['feature.a', 'feature.b']
+    assert list(cache.updates) == [str(source)]
+
+
+def test_scancache_invalid_file(tmp_path):
+    cache_file = tmp_path / 'scan.json'
+    cache_file.write_text('{"version": 0, "entries": {"a.c": {}}}')
+
+    assert ScanCache(str(cache_file)).entries == {}
+
+    cache_file.write_text('not json')
+
+    assert ScanCache(str(cache_file)).entries == {}
+
+
+@pytest.mark.parametrize('jobs', [1, 2], ids=['serial', 'parallel'])
+def test_scan_testsuite_paths(tmp_path, testsuites_dir, jobs):
+    bad_src_dir = tmp_path / 'bad_test' / 'src'
+    bad_src_dir.mkdir(parents=True)
+    (bad_src_dir / 'main.c').write_text('ZTEST(feature, bad_name)\n{\n}\n')
+    paths = [
+        os.path.join(testsuites_dir, 'tests', 'test_d'),
+        os.path.join(testsuites_dir, 'tests', 'test_e'),
+        str(tmp_path / 'bad_test'),
+    ]
+    cache = ScanCache()
+
+    results = scan_testsuite_paths(paths + paths[:1], jobs, cache)
+
+    assert list(results) == paths
+    assert sorted(results[paths[0]][0]) == ['unit_1a', 'unit_1b']
+    assert sorted(results[paths[1]][0]) == ['feature5.1a', 'feature5.1b']
+    assert isinstance(results[paths[2]], TwisterRuntimeError)
+    assert sorted(os.path.basename(filename) for filename in cache.entries) == [
+        'main.c',
+        'test_ztest_error_register_test_suite.c',
+        'test_ztest_new_suite.c',
+        'test_ztest_no_suite.c',
+    ]
+
+
 TESTDATA_9 = [
     ('dummy/path', 'dummy/path/src', 'dummy/path/src'),
     ('dummy/path', 'dummy/src', 'dummy/src'),
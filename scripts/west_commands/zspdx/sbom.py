@@ -7,7 +7,7 @@ from dataclasses import dataclass
 
 from west import log
 
-from zspdx.scanner import ScannerConfig, scanDocument
+from zspdx.scanner import ScannerConfig, loadScanCache, saveScanCache, scanDocument
 from zspdx.version import SPDX_VERSION_2_3
 from zspdx.walker import Walker, WalkerConfig
 from zspdx.writer import writeSPDX
@@ -92,12 +92,18 @@ def makeSPDX(cfg):
     # set up scanner configuration
     scannerCfg = ScannerConfig()
 
+    # results of earlier scans, so that only new and modified files are
+    # scanned again
+    scanCacheFile = os.path.join(cfg.buildDir, "spdx-scan-cache.json")
+    scanCache = loadScanCache(scannerCfg, scanCacheFile)
+
     # scan each document from walker
     if cfg.includeSDK:
-        scanDocument(scannerCfg, w.docSDK)
-    scanDocument(scannerCfg, w.docApp)
-    scanDocument(scannerCfg, w.docZephyr)
-    scanDocument(scannerCfg, w.docBuild)
+        scanDocument(scannerCfg, w.docSDK, scanCache)
+    scanDocument(scannerCfg, w.docApp, scanCache)
+    scanDocument(scannerCfg, w.docZephyr, scanCache)
+    scanDocument(scannerCfg, w.docBuild, scanCache)
+    saveScanCache(scannerCfg, scanCacheFile, scanCache)
 
     # write each document, in this particular order so that the
     # hashes for external references are calculated
@@ -3,9 +3,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import hashlib
+import json
 import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from importlib.metadata import version
 
 from reuse.project import Project
 from west import log
@@ -37,6 +40,18 @@ class ScannerConfig:
     # should we calculate MD5 hashes for each Package's Files?
     doMD5: bool = False
 
+    # number of processes to scan Files with (0 = one per CPU)
+    numJobs: int = 0
+
+
+# version of the format of the scan cache file written by saveScanCache()
+SCAN_CACHE_VERSION = 1
+
+# REUSE Projects by root directory, and root directories by the directories
+# looked up in getReuseProject()
+_reuseProjects = {}
+_reuseRoots = {}
+
 
 def parseLineForExpression(line):
     """Return parsed SPDX expression if tag found in line, or None otherwise."""
@@ -177,6 +192,35 @@ def normalizeExpression(licsConcluded):
     return " AND ".join(revised)
 
 
+def getReuseProject(filePath):
+    """
+    Get the REUSE Project to scan the specified file with. One Project is
+    made per repository root, i.e. the closest parent directory containing
+    .git, or per directory for files outside of any repository.
+
+    Arguments:
+        - filePath: path to file to scan
+
+    Returns: REUSE Project
+    """
+    dirPath = os.path.dirname(filePath)
+    root = _reuseRoots.get(dirPath)
+    if root is None:
+        root = dirPath
+        while not os.path.exists(os.path.join(root, ".git")):
+            parent = os.path.dirname(root)
+            if parent == root:
+                root = dirPath
+                break
+            root = parent
+        _reuseRoots[dirPath] = root
+
+    project = _reuseProjects.get(root)
+    if project is None:
+        project = _reuseProjects[root] = Project(root)
+    return project
+
+
 def getCopyrightInfo(filePath):
     """
     Scans the specified file for copyright information using REUSE tools.
@@ -189,7 +233,7 @@ def getCopyrightInfo(filePath):
     log.dbg(f"  - getting copyright info for {filePath}")
 
     try:
-        project = Project(os.path.dirname(filePath))
+        project = getReuseProject(filePath)
         infos = project.reuse_info_of(filePath)
         copyrights = []
 
@@ -197,13 +241,136 @@ def getCopyrightInfo(filePath):
             for notice in info.copyright_notices:
                 copyrights.extend([notice.original])
 
-        return copyrights
+        # the notices come in a set, sort them for reproducible documents
+        return sorted(copyrights)
     except Exception as e:
         log.wrn(f"Error getting copyright info for {filePath}: {e}")
         return []
 
 
-def scanDocument(cfg, doc):
+def scanFile(filePath, numLines):
+    """
+    Calculate hashes and scan for licenses and copyright information in
+    the specified file. Called in worker processes by scanFiles().
+
+    Arguments:
+        - filePath: path to file to scan.
+        - numLines: number of lines to scan for an expression, see
+                    getExpressionData().
+    Returns: tuple of (hashes, expression, copyrights), where hashes is
+             the tuple returned by getHashes(); (None, None, []) if the
+             file is not found.
+    """
+    hashes = getHashes(filePath)
+    if not hashes:
+        return None, None, []
+    return hashes, getExpressionData(filePath, numLines), getCopyrightInfo(filePath)
+
+
+def scanFiles(cfg, filePaths, cache):
+    """
+    Scan the specified files with scanFile(), in a pool of processes.
+    Files found in the cache with their current modification time and
+    size are not scanned again.
+
+    Arguments:
+        - cfg: ScannerConfig
+        - filePaths: paths to files to scan
+        - cache: dict from loadScanCache(), which gets the results of the
+                 files that were scanned; or None
+    Returns: dict mapping paths to the results of scanFile()
+    """
+    results = {}
+    stamps = {}
+    for filePath in filePaths:
+        try:
+            st = os.stat(filePath)
+        except OSError:
+            results[filePath] = (None, None, [])
+            continue
+        stamps[filePath] = stamp = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(filePath) if cache is not None else None
+        if entry is not None and entry[0] == stamp:
+            results[filePath] = entry[1]
+
+    todo = [filePath for filePath in stamps if filePath not in results]
+    numJobs = cfg.numJobs or os.cpu_count() or 1
+    if numJobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=numJobs) as executor:
+            scanned = executor.map(
+                scanFile,
+                todo,
+                [cfg.numLinesScanned] * len(todo),
+                chunksize=max(1, len(todo) // (numJobs * 4)),
+            )
+            results.update(zip(todo, scanned, strict=True))
+    else:
+        for filePath in todo:
+            results[filePath] = scanFile(filePath, cfg.numLinesScanned)
+
+    if cache is not None:
+        for filePath in todo:
+            if results[filePath][0]:
+                cache[filePath] = [stamps[filePath], results[filePath]]
+
+    return results
+
+
+def scanCacheKey(cfg):
+    """
+    Return what the results in a scan cache depend on, besides the files.
+
+    Arguments:
+        - cfg: ScannerConfig
+    """
+    return {
+        "version": SCAN_CACHE_VERSION,
+        "numLinesScanned": cfg.numLinesScanned,
+        "reuse": version("reuse"),
+    }
+
+
+def loadScanCache(cfg, cacheFile):
+    """
+    Load the results of earlier scans, as saved by saveScanCache().
+
+    Arguments:
+        - cfg: ScannerConfig
+        - cacheFile: path to scan cache file
+    Returns: dict mapping file paths to [[mtime, size], scanFile() result];
+             empty if the cache file doesn't exist or is outdated
+    """
+    try:
+        with open(cacheFile) as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("key") != scanCacheKey(cfg):
+        return {}
+    return data["files"]
+
+
+def saveScanCache(cfg, cacheFile, cache):
+    """
+    Save the results of scans, so that later runs only scan new and
+    modified files. Files which no longer exist are left out.
+
+    Arguments:
+        - cfg: ScannerConfig
+        - cacheFile: path to scan cache file
+        - cache: dict from loadScanCache(), as updated by scanDocument()
+    """
+    files = {filePath: entry for filePath, entry in cache.items() if os.path.exists(filePath)}
+    try:
+        with open(cacheFile + ".tmp", "w") as f:
+            json.dump({"key": scanCacheKey(cfg), "files": files}, f)
+        os.replace(cacheFile + ".tmp", cacheFile)
+    except OSError as e:
+        log.wrn(f"unable to write SPDX scan cache {cacheFile}: {e}")
+
+
+def scanDocument(cfg, doc, cache=None):
     """
     Scan for licenses and calculate hashes for all Files and Packages
     in this Document.
@@ -211,7 +378,12 @@ def scanDocument(cfg, doc):
     Arguments:
         - cfg: ScannerConfig
         - doc: Document
+        - cache: dict from loadScanCache(), or None to scan all Files
     """
+    results = scanFiles(
+        cfg, [f.abspath for pkg in doc.pkgs.values() for f in pkg.files.values()], cache
+    )
+
     for pkg in doc.pkgs.values():
         log.inf(f"scanning files in package {pkg.cfg.name} in document {doc.cfg.name}")
 
@@ -221,7 +393,7 @@ def scanDocument(cfg, doc):
             f.relpath = os.path.relpath(f.abspath, pkg.cfg.relativeBaseDir)
 
             # get hashes for file
-            hashes = getHashes(f.abspath)
+            hashes, expression, copyrights = results[f.abspath]
             if not hashes:
                 log.wrn(f"unable to get hashes for file {f.abspath}; skipping")
                 continue
@@ -233,13 +405,12 @@ def scanDocument(cfg, doc):
                 f.md5 = hMD5
 
             # get licenses for file
-            expression = getExpressionData(f.abspath, cfg.numLinesScanned)
             if expression:
                 if cfg.shouldConcludeFileLicenses:
                     f.concludedLicense = expression
                 f.licenseInfoInFile = splitExpression(expression)
 
-            if copyrights := getCopyrightInfo(f.abspath):
+            if copyrights:
                 f.copyrightText = "<text>\n" + "\n".join(copyrights) + "\n</text>"
 
             # check if any custom license IDs should be flagged for document